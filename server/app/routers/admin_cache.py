@@ -0,0 +1,33 @@
+"""
+admin: 프로세스 내 결과 캐시 지표.
+
+엔드포인트:
+- GET /admin/cache/stats : calculate_cached 히트 / 미스 / 퇴출 / 크기 (응답한 워커 기준)
+"""
+
+from fastapi import APIRouter, Depends
+
+from app.schemas.cache_schema import CacheStatsEntry, CacheStatsResponse
+from app.security import require_admin_token
+from app.services.result_cache import CacheStats
+from app.services.tax_calculator import calculate_cache_stats
+
+
+router = APIRouter(dependencies=[Depends(require_admin_token)])
+
+
+def _entry(stats: CacheStats) -> CacheStatsEntry:
+    lookups = stats.hits + stats.misses
+    return CacheStatsEntry(
+        hits=stats.hits,
+        misses=stats.misses,
+        evictions=stats.evictions,
+        size=stats.size,
+        maxsize=stats.maxsize,
+        hit_rate=stats.hits / lookups if lookups else 0.0,
+    )
+
+
+@router.get("/admin/cache/stats", response_model=CacheStatsResponse)
+def cache_stats_endpoint():
+    return CacheStatsResponse(calculate=_entry(calculate_cache_stats()))
@@ -1,16 +1,23 @@
+import json
+import logging
+from typing import Any, AsyncIterator
+
 from fastapi import APIRouter, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 
 from app.rate_limit import LIMIT_LLM_USER, limiter
 from app.schemas.analysis_schema import AnalyzeRequest, AnalyzeResponse, Section
 from app.schemas.rag_schema import SearchHit
 from app.schemas.rule_schema import RuleEvaluation
 from app.schemas.tax_calculator_schema import CalcInputs, CalcResult, DependentsInput
-from app.services import rag
-from app.services.llm_client import generate_analysis
+from app.services import rag_bundles
+from app.services.llm_client import generate_analysis, stream_analysis
 from app.services.rules_engine import RuleContext, build_rule_context
-from app.services.tax_calculator import calculate
+from app.services.tax_calculator import calculate_cached
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 # 섹션 → 관련 룰 ID 매핑 (Phase 3-1 Provenance).
@@ -27,6 +34,9 @@ SECTION_TO_RULE_IDS: dict[str, list[str]] = {
 # RAG 컨텍스트 fetch 시 검색에 쓸 top-K
 RAG_TOP_K = 8
 
+# SSE error 이벤트 detail — 클라이언트에는 고정 문구만
+STREAM_ERROR_DETAIL = "분석 생성 실패"
+
 
 def _attach_provenance(
     sections: list[Section],
@@ -46,13 +56,7 @@ def _build_rag_query(rule_context: RuleContext) -> str | None:
     """평가된 룰들의 제목·anchor 를 합쳐 RAG 검색 query 로 사용."""
     if not rule_context.evaluations:
         return None
-    parts: list[str] = []
-    for ev in rule_context.evaluations:
-        parts.append(ev.title)
-        if ev.legal_anchor:
-            parts.append(ev.legal_anchor)
-    query = " ".join(parts).strip()
-    return query or None
+    return rag_bundles.build_query(rule_context.evaluations)
 
 
 async def _fetch_rag_context(
@@ -60,18 +64,20 @@ async def _fetch_rag_context(
     top_k: int = RAG_TOP_K,
 ) -> list[SearchHit]:
     """
-    RAG top-K 법령 청크 fetch. 실패 시 빈 리스트 반환 (분석 흐름 유지).
+    RAG 법령 청크 fetch. 실패 시 빈 리스트 반환 (분석 흐름 유지).
+    1) 인덱싱 시 미리 계산한 룰 조합 번들 (rag_bundles) — 파일 캐시 조회만
+    2) 번들이 없거나 낡았으면 실시간: 인용 조문 anchor 직접 조회 + 의미 검색 보충
     인덱스가 비었거나 OPENAI_API_KEY 없으면 자연스럽게 [] 반환.
     """
-    query = _build_rag_query(rule_context)
-    if query is None:
+    if _build_rag_query(rule_context) is None:
         return []
     try:
-        hits, _ = await rag.search(query, top_k=top_k)
-        return hits
+        bundled = rag_bundles.get_bundle(rule_context.evaluations, top_k)
     except Exception:
-        # RAG 실패는 분석 자체를 막지 않음 — silent fallback
-        return []
+        bundled = None
+    if bundled is not None:
+        return bundled
+    return await rag_bundles.fetch_context(rule_context.evaluations, top_k)
 
 
 def _run_tax_calc(data: AnalyzeRequest) -> CalcResult | None:
@@ -95,7 +101,7 @@ def _run_tax_calc(data: AnalyzeRequest) -> CalcResult | None:
             ),
             prepaid_tax=data.parsed_pdf.prepaid_tax or 0,
         )
-        return calculate(inputs)
+        return calculate_cached(inputs)
     except Exception:
         return None
 
@@ -106,8 +112,9 @@ async def analyze_tax(request: Request, data: AnalyzeRequest):
     """
     PAGE 7: 전체 데이터 기반 Why 분석.
     1) 규칙엔진: JSON 룰 평가 → RuleEvaluation 리스트 (각각 legal_anchor 포함)
-    2) RAG: 평가된 룰의 제목/anchor 로 법령 본문 top-K fetch (실패시 silent skip)
+    2) RAG: 룰 조합 번들(사전 계산) → 없으면 인용 조문 직접 조회 + 의미 검색 보충 (실패시 silent skip)
     3) LLM: 항목별 Why 해설 (detail 안에 [rule_id] 마커 인용 + RAG 본문 참고)
+       같은 프롬프트면 응답 캐시 재사용 → cached=true
     4) 백엔드 후처리: 섹션마다 관련 평가 결과를 provenance 로 부착
     """
 
@@ -124,7 +131,7 @@ async def analyze_tax(request: Request, data: AnalyzeRequest):
 
     rag_hits = await _fetch_rag_context(rule_context)
 
-    summary, sections, tax_tips = await generate_analysis(
+    summary, sections, tax_tips, cached = await generate_analysis(
         income=data.income,
         dependents=data.dependents,
         conditions=data.conditions,
@@ -143,4 +150,91 @@ async def analyze_tax(request: Request, data: AnalyzeRequest):
         sections=sections_with_prov,
         tax_tips=tax_tips,
         evaluations=rule_context.evaluations,
+        cached=cached,
+    )
+
+
+# ---------------- 스트리밍 (SSE) ----------------
+
+
+def _sse(event: str, data: Any) -> str:
+    payload = json.dumps(jsonable_encoder(data), ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+@router.post("/analyze/stream")
+@limiter.limit(LIMIT_LLM_USER)
+async def analyze_tax_stream(request: Request, data: AnalyzeRequest):
+    """
+    /analyze 의 Server-Sent Events 버전. 이벤트 순서:
+    1) evaluations : 룰 평가 결과 (LLM 대기 없이 즉시)
+    2) calc        : CalcResult (총급여 없으면 null)
+    3) section     : LLM 토큰 스트림에서 섹션 JSON 이 닫히는 즉시 1건씩 (provenance 부착)
+       summary / tax_tips : 각 값이 완성되는 시점
+    4) done        : 전체 AnalyzeResponse (/analyze 와 동일 모양, 캐시 적중 시 cached=true)
+       LLM 실패 시 done 대신 error {"detail": 고정 문구} (예외 원문은 서버 로그만)
+    """
+    rule_context = build_rule_context(
+        income=data.income,
+        dependents=data.dependents,
+        conditions=data.conditions,
+        parsed_pdf=data.parsed_pdf,
+        manual_input=data.manual_input,
+    )
+    calc_result = _run_tax_calc(data)
+
+    async def events() -> AsyncIterator[str]:
+        yield _sse("evaluations", rule_context.evaluations)
+        yield _sse("calc", calc_result)
+
+        rag_hits = await _fetch_rag_context(rule_context)
+
+        summary = None
+        sections: list[Section] = []
+        tax_tips: list[str] = []
+        cached = False
+        try:
+            async for kind, value in stream_analysis(
+                income=data.income,
+                dependents=data.dependents,
+                conditions=data.conditions,
+                parsed_pdf=data.parsed_pdf,
+                manual_input=data.manual_input,
+                rule_context=rule_context,
+                rag_hits=rag_hits,
+                calc_result=calc_result,
+            ):
+                if kind == "cached":
+                    cached = True
+                    continue
+                if kind == "section":
+                    (value,) = _attach_provenance([value], rule_context.evaluations)
+                    sections.append(value)
+                elif kind == "summary":
+                    summary = value
+                else:
+                    tax_tips = value
+                yield _sse(kind, value)
+        except Exception:
+            # 헤더는 이미 나갔으므로 상태코드 대신 error 이벤트.
+            # 예외 원문(내부 경로 · 프롬프트 조각 등)은 서버 로그에만 남김
+            logger.exception("analyze_stream_failed")
+            yield _sse("error", {"detail": STREAM_ERROR_DETAIL})
+            return
+
+        yield _sse(
+            "done",
+            AnalyzeResponse(
+                summary=summary,
+                sections=sections,
+                tax_tips=tax_tips,
+                evaluations=rule_context.evaluations,
+                cached=cached,
+            ),
+        )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
@@ -1,13 +1,14 @@
 """
 Phase 4-2 RAG 엔드포인트.
 
-- POST /rag/index        : 법령 인덱싱 (legal_api 통해 fetch + embed + 저장)
+- POST /rag/index        : 법령 인덱싱 (legal_api 통해 fetch + embed + 저장) + 룰별 컨텍스트 번들 재계산
 - POST /rag/search       : 자연어 → top-K 청크
 - GET  /rag/stats        : 인덱스 통계 (법령별 청크 수)
 
 주의: 1차는 admin 인증 없음. 운영 배포 전 가드 필수.
 """
 
+import logging
 import os
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Request
@@ -21,10 +22,12 @@ from app.schemas.rag_schema import (
     SearchResponse,
 )
 from app.security import require_admin_token
-from app.services import rag
+from app.services import rag, rag_bundles
 from app.services.legal_api import LegalAPIClient, LegalAPIError
 
 
+logger = logging.getLogger(__name__)
+
 # RAG 는 OpenAI 호출 비용/데이터 노출 우려 → admin 전용
 router = APIRouter(dependencies=[Depends(require_admin_token)])
 
@@ -72,6 +75,12 @@ async def index_endpoint(
             status_code=502, detail=f"인덱싱 실패: {e}"
         ) from e
 
+    # /analyze 용 룰 조합 컨텍스트 번들 재계산 — 실패해도 인덱싱은 성공 (실시간 계산으로 fallback)
+    try:
+        await rag_bundles.build_bundles()
+    except Exception:
+        logger.exception("rag_bundles_build_failed law_id=%s", pack.law_id)
+
     return IndexLawResponse(
         law_id=pack.law_id,
         law_name=pack.law_name,
@@ -94,6 +103,9 @@ async def search_endpoint(
             top_k=req.top_k,
             law_id_filter=req.law_id_filter,
             article_no_filter=req.article_no_filter,
+            nprobe=req.nprobe,
+            exact=req.exact,
+            mode=req.mode,
         )
     except Exception as e:
         raise HTTPException(
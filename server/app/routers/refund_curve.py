@@ -0,0 +1,47 @@
+"""POST /refund-curve — 입력 1개에 대한 환급 곡선 breakpoint."""
+
+from fastapi import APIRouter, HTTPException
+
+from app.schemas.refund_curve_schema import (
+    CurvePoint,
+    RefundCurveRequest,
+    RefundCurveResponse,
+)
+from app.services.tax_calculator import calculate_totals, table_registry
+from app.services.tax_curve import marginal_rate, refund_curve
+
+
+router = APIRouter()
+
+
+@router.post("/refund-curve", response_model=RefundCurveResponse)
+def refund_curve_endpoint(body: RefundCurveRequest):
+    # 세율표 없는 연도는 계산 전에 거부 (곡선 / 환급 / 한계세율 모두 같은 연도 표를 씀)
+    try:
+        table_registry.get(body.year)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    curve = refund_curve(body.inputs, body.variable, body.lo, body.hi, year=body.year)
+    knots = curve.knots()
+    points = [
+        CurvePoint(
+            x=x,
+            refund_or_owed=y,
+            slope_after=(
+                (knots[i + 1][1] - y) / (knots[i + 1][0] - x)
+                if i + 1 < len(knots)
+                else None
+            ),
+        )
+        for i, (x, y) in enumerate(knots)
+    ]
+    return RefundCurveResponse(
+        variable=body.variable,
+        lo=body.lo,
+        hi=body.hi,
+        year=body.year,
+        points=points,
+        current_x=getattr(body.inputs, body.variable),
+        current_refund=calculate_totals(body.inputs, year=body.year).refund_or_owed,
+        marginal_rate=marginal_rate(body.inputs, body.variable, year=body.year),
+    )
@@ -50,3 +50,5 @@ class AnalyzeResponse(BaseModel):
     tax_tips: List[str]
     # 전체 룰 평가 결과 (UI 가 모든 anchor 를 참조해야 할 때)
     evaluations: List[RuleEvaluation] = Field(default_factory=list)
+    # LLM 응답 캐시(llm_cache) 적중 여부 — 같은 프롬프트의 이전 생성 결과 재사용
+    cached: bool = False
@@ -0,0 +1,24 @@
+"""
+프로세스 내 결과 캐시 운영 지표 스키마 (GET /admin/cache/stats).
+
+수치는 워커(프로세스)별 — 멀티 워커 배포에서는 응답한 워커의 값.
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class CacheStatsEntry(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+    hit_rate: float = Field(..., description="hits / (hits + misses). 조회 0건이면 0.0")
+
+
+class CacheStatsResponse(BaseModel):
+    calculate: CacheStatsEntry = Field(
+        ..., description="tax_calculator.calculate_cached 결과 캐시"
+    )
@@ -14,6 +14,10 @@ from typing import Literal
 from pydantic import BaseModel, ConfigDict, Field
 
 
+# vector: 임베딩 cosine / lexical: n-gram BM25 (임베딩 없음) / hybrid: BM25 shortlist + cosine 융합
+SearchMode = Literal["vector", "lexical", "hybrid"]
+
+
 class IndexedChunk(BaseModel):
     """디스크에 저장되는 한 청크."""
 
@@ -73,6 +77,17 @@ class SearchRequest(BaseModel):
     top_k: int = Field(default=5, ge=1, le=50)
     law_id_filter: str | None = None
     article_no_filter: str | None = None
+    nprobe: int | None = Field(
+        default=None,
+        ge=1,
+        le=4096,
+        description="ANN 탐색 클러스터 수 (클수록 recall ↑ / latency ↑). 작은 인덱스는 무시.",
+    )
+    exact: bool = Field(default=False, description="True 면 ANN 없이 정확 검색.")
+    mode: SearchMode = Field(
+        default="vector",
+        description="vector | lexical (임베딩 호출 없음) | hybrid (BM25 shortlist 재정렬).",
+    )
 
 
 class SearchHit(BaseModel):
@@ -0,0 +1,56 @@
+"""
+환급 곡선(refund curve) 스키마.
+
+- 입력 1개(variable)를 [lo, hi] 에서 움직일 때 refund_or_owed 의 정확한 breakpoint 목록.
+- 곡선은 breakpoint 사이에서 선형 — 클라이언트는 점을 직선으로 이어 그리면 됨.
+- 값은 반올림 없는 실수 모델 (calculate() 와 수 원 이내 차이).
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+from app.schemas.tax_calculator_schema import CalcInputs
+
+
+class RefundCurveRequest(BaseModel):
+    inputs: CalcInputs = Field(..., description="고정할 나머지 입력 (현재 상태)")
+    variable: Literal[
+        "gross_salary", "extra_income_deductions", "extra_tax_credits"
+    ] = Field(..., description="가로축으로 움직일 입력")
+    lo: int = Field(default=0, ge=0, description="가로축 시작 (원)")
+    hi: int = Field(..., gt=0, le=10_000_000_000, description="가로축 끝 (원)")
+    year: int = 2025
+
+    @model_validator(mode="after")
+    def _check_range(self) -> RefundCurveRequest:
+        if self.lo >= self.hi:
+            raise ValueError("lo 는 hi 보다 작아야 합니다.")
+        if self.inputs.itemized is not None:
+            raise ValueError(
+                "itemized 입력은 곡선 계산을 지원하지 않습니다. extra_tax_credits 합산값을 사용하세요."
+            )
+        return self
+
+
+class CurvePoint(BaseModel):
+    x: float = Field(..., description="variable 값 (원)")
+    refund_or_owed: float = Field(..., description="이 점의 환급액 (양수=환급, 음수=추징)")
+    slope_after: float | None = Field(
+        default=None, description="다음 점까지의 기울기 d(refund)/dx. 마지막 점은 None"
+    )
+
+
+class RefundCurveResponse(BaseModel):
+    variable: str
+    lo: int
+    hi: int
+    year: int
+    points: list[CurvePoint]
+    current_x: int = Field(..., description="inputs 의 현재 variable 값")
+    current_refund: int = Field(..., description="현재 입력의 정확한 환급액 (calculate 기준)")
+    marginal_rate: float = Field(
+        ..., description="현재 점에서의 d(total_tax)/d(variable) (우미분)"
+    )
@@ -3,8 +3,11 @@
 
 == 룰 ==
 - Rule: 외부 JSON 1건. legal_anchor 필수, evaluator 는 종류별 discriminated union.
-- ValueExpr: threshold·value 로 쓰일 수 있는 수치 표현 (필드 참조/비율/필드 합/상수).
-- Evaluator: 룰 평가 방식 (현재 'threshold' / 'all_of_flags' 두 종류; 추후 확장).
+- ValueExpr: threshold·value 로 쓰일 수 있는 수치 표현.
+  · 리프: 필드 참조 / 비율 / 필드 합 / 상수
+  · 조합(중첩 가능): sum / sub / scale / min / max / clip / piecewise(구간 누진)
+- Evaluator: 룰 평가 방식 ('threshold' / 'all_of_flags' / 'any_of_flags' / 'amount').
+  실행은 rules_engine(scalar) · rules_batch(NumPy 컬럼) 가 services/rule_expr 로 컴파일해 공유.
 
 == 평가 결과 ==
 - RuleEvaluation: 룰 1건 평가 결과. computed dict 와 result, legal_anchor 보유.
@@ -17,7 +20,7 @@ from __future__ import annotations
 
 from typing import Annotated, Any, Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 # ---------------- Value 표현 ----------------
@@ -52,11 +55,104 @@ class Constant(BaseModel):
     value: int
 
 
+class SumOf(BaseModel):
+    """하위 표현들의 합 (중첩 가능)."""
+
+    type: Literal["sum"] = "sum"
+    args: list[ValueExpr] = Field(..., min_length=1)
+
+
+class Sub(BaseModel):
+    """left - right (예: 카드 사용액 - 최저사용액)."""
+
+    type: Literal["sub"] = "sub"
+    left: ValueExpr
+    right: ValueExpr
+
+
+class Scale(BaseModel):
+    """하위 표현 × 비율, 0 방향 절사 (예: 초과 사용분 × 0.15)."""
+
+    type: Literal["scale"] = "scale"
+    value: ValueExpr
+    ratio: float
+
+
+class MinOf(BaseModel):
+    """하위 표현들 중 최솟값 (한도 적용)."""
+
+    type: Literal["min"] = "min"
+    args: list[ValueExpr] = Field(..., min_length=1)
+
+
+class MaxOf(BaseModel):
+    """하위 표현들 중 최댓값."""
+
+    type: Literal["max"] = "max"
+    args: list[ValueExpr] = Field(..., min_length=1)
+
+
+class Clip(BaseModel):
+    """lo ≤ value ≤ hi 로 자르기. lo/hi 생략 시 그 방향은 제한 없음."""
+
+    type: Literal["clip"] = "clip"
+    value: ValueExpr
+    lo: ValueExpr | None = None
+    hi: ValueExpr | None = None
+
+
+class PiecewiseBracket(BaseModel):
+    """구간 1개. value ≤ upto 인 첫 구간 적용. 값 = fixed + round((value - base) × rate)."""
+
+    upto: int | None = None
+    base: int = 0
+    fixed: int = 0
+    rate: float = 0.0
+
+
+class Piecewise(BaseModel):
+    """
+    구간별 선형 (세율표 brackets 와 같은 모양).
+    upto 오름차순, 마지막 구간은 upto=None (상한 없음).
+    """
+
+    type: Literal["piecewise"] = "piecewise"
+    value: ValueExpr
+    brackets: list[PiecewiseBracket] = Field(..., min_length=1)
+
+    @model_validator(mode="after")
+    def _check_brackets(self) -> Piecewise:
+        uppers = [b.upto for b in self.brackets]
+        if uppers[-1] is not None:
+            raise ValueError("piecewise 마지막 구간은 upto=null 이어야 합니다.")
+        bounded = uppers[:-1]
+        if any(u is None for u in bounded):
+            raise ValueError("piecewise 중간 구간의 upto 는 null 일 수 없습니다.")
+        if any(a >= b for a, b in zip(bounded, bounded[1:])):
+            raise ValueError("piecewise upto 는 엄격히 오름차순이어야 합니다.")
+        return self
+
+
 ValueExpr = Annotated[
-    Union[FieldRef, RatioOfField, SumOfFields, Constant],
+    Union[
+        FieldRef,
+        RatioOfField,
+        SumOfFields,
+        Constant,
+        SumOf,
+        Sub,
+        Scale,
+        MinOf,
+        MaxOf,
+        Clip,
+        Piecewise,
+    ],
     Field(discriminator="type"),
 ]
 
+for _model in (SumOf, Sub, Scale, MinOf, MaxOf, Clip, Piecewise):
+    _model.model_rebuild()
+
 
 # ---------------- 평가 방식 ----------------
 
@@ -95,8 +191,36 @@ class AllOfFlagsEvaluator(BaseModel):
     outputs: AllOfFlagsOutputs
 
 
+class AnyOfFlagsEvaluator(BaseModel):
+    """
+    여러 boolean 플래그 중 하나라도 True 인지.
+    예: child_education ∨ self_education (교육비 공제 대상 존재)
+    """
+
+    kind: Literal["any_of_flags"] = "any_of_flags"
+    flags: list[str]
+    outputs: AllOfFlagsOutputs
+
+
+class AmountOutputs(BaseModel):
+    value_key: str
+    result_key: str
+
+
+class AmountEvaluator(BaseModel):
+    """
+    금액 산식 (한도·구간 포함) 을 계산해 computed 로 노출.
+    result 는 금액 > 0 여부 (공제/혜택 발생).
+    예: min(scale(sub(card_total, threshold), 0.15), 3_000_000)
+    """
+
+    kind: Literal["amount"] = "amount"
+    value: ValueExpr
+    outputs: AmountOutputs
+
+
 Evaluator = Annotated[
-    Union[ThresholdEvaluator, AllOfFlagsEvaluator],
+    Union[ThresholdEvaluator, AllOfFlagsEvaluator, AnyOfFlagsEvaluator, AmountEvaluator],
     Field(discriminator="kind"),
 ]
 
@@ -148,7 +272,12 @@ class RuleEvaluation(BaseModel):
 
 
 class RulePack(BaseModel):
-    """rules/{year}.json 의 최상위 컨테이너."""
+    """
+    rules/{year}.json 의 최상위 컨테이너.
+    _compiled: rules_engine 이 load 시점에 붙이는 컴파일 결과 (직렬화 제외).
+    """
 
     year: int
     rules: list[Rule]
+
+    _compiled: Any = PrivateAttr(default=None)
@@ -3,7 +3,7 @@ Phase 4-1: 다년도 시뮬레이션 스키마.
 
 - 베이스라인 inputs (현재 상태) + 연도별 override 리스트 → 연도별 tax_calculator 결과
 - override 는 'inherit from previous year' 디폴트. None 인 필드는 직전 연도 값을 그대로 가져감.
-- 모든 연도가 동일한 세율표를 사용 (현재는 2025 단년만 지원). 미래 세법 변경은 v2.
+- 연도별 세율표는 TaxTableRegistry 에서 조회. 파일이 없는 연도는 직전 최신 세율표로 대체.
 """
 
 from __future__ import annotations
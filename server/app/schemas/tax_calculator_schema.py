@@ -4,13 +4,15 @@ tax_calculator 의 입출력 스키마.
 핵심 원칙:
 - 모든 금액은 정수(원 단위). float 누적 오차 회피.
 - 단계별 산출 결과를 CalcStep 으로 trail. Phase 3-1 Provenance 와 직접 연결.
+- CalcStep / CalcResult 는 frozen (steps 는 tuple) — calculate_cached 가 저장본을
+  복사 없이 여러 호출자에게 공유함. dict 필드(inputs / itemized_breakdown)도 읽기 전용으로 취급.
 """
 
 from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DependentsInput(BaseModel):
@@ -112,6 +114,8 @@ class CalcInputs(BaseModel):
 class CalcStep(BaseModel):
     """단계별 계산 trail. Provenance 의 building block."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="단계 ID (예: 'earned_income_deduction')")
     label: str = Field(..., description="사람이 읽는 라벨")
     legal_anchor: str | None = None
@@ -125,6 +129,8 @@ class CalcStep(BaseModel):
 class CalcResult(BaseModel):
     """tax_calculator 출력."""
 
+    model_config = ConfigDict(frozen=True)
+
     # 핵심 산출
     earned_income_deduction: int
     earned_income_amount: int  # 근로소득금액
@@ -156,5 +162,5 @@ class CalcResult(BaseModel):
     )
 
     # provenance
-    steps: list[CalcStep]
+    steps: tuple[CalcStep, ...]
     year: int = 2025
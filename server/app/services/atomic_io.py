@@ -0,0 +1,71 @@
+"""
+원자적 파일 쓰기 (tmp + os.replace).
+
+== 목적 ==
+인덱스 / 번들 / 룰 팩처럼 다른 요청·워커가 읽고 있는 파일을 덮어쓸 때,
+읽는 쪽이 반쯤 쓰인 파일을 보지 않게 함.
+
+== 원칙 ==
+- 같은 디렉토리에 tmp 파일로 쓴 뒤 os.replace — 같은 파일시스템이라 교체가 원자적.
+- 교체 후 경로는 새 inode → 기존 mmap / 열린 핸들은 옛 파일을 계속 봄.
+  stat 시그니처(mtime, size, inode) 캐시는 같은 mtime tick 안의 재작성도 감지.
+- 실패(예외 / 취소) 시 tmp 파일 삭제, 원본은 그대로.
+- mkstemp 는 0600 으로 만들고 os.replace 는 그 권한을 그대로 옮김 → 교체 전 tmp 에
+  기존 파일 권한(없으면 0666 & ~umask, 일반 open() 과 동일)을 입힘. 다른 사용자로 도는
+  워커 / 배포 계정도 계속 읽을 수 있게.
+- fsync=True 면 교체 전 디스크 flush — 원본 데이터(룰 팩) 용. 재생성 가능한 파생
+  데이터(인덱스 / 번들) 는 기본값(False) 으로 충분.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def _current_umask() -> int:
+    # umask 는 읽기 전용 API 가 없음 — 설정 후 즉시 복원 (import 시 1회)
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _current_umask()
+
+
+def _target_mode(path: Path) -> int:
+    """교체 후 path 가 가질 권한 — 기존 파일 권한 유지, 새 파일은 umask 기본값."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def atomic_write_bytes(path: Path, payload: bytes, *, fsync: bool = False) -> None:
+    """path 를 payload 로 원자 교체 (부모 디렉토리는 없으면 생성)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+    )
+    try:
+        os.chmod(tmp_name, _target_mode(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_json(path: Path, data: Any, *, fsync: bool = False) -> None:
+    """UTF-8 JSON (ensure_ascii=False, indent=2) 으로 원자 교체."""
+    payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    atomic_write_bytes(path, payload, fsync=fsync)
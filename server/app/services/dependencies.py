@@ -2,7 +2,7 @@
 Phase 4-4: ripple-effect simulator.
 
 == 정적 분석 ==
-- 룰 evaluator 로부터 (field → rule_id) 매핑 추출 (런타임 lru_cache)
+- 룰 evaluator 로부터 (field → rule_id) 매핑 추출 (룰 팩 snapshot 에 부착, 팩 교체 시 재생성)
 - tax_calculator step DAG 는 본 모듈에 하드코딩 (코드와 동기 유지 필요)
 
 == ripple BFS ==
@@ -13,7 +13,6 @@ rule 은 다른 rule 의 출력을 읽지 않으므로 rule 노드는 leaf.
 from __future__ import annotations
 
 from collections import deque
-from functools import lru_cache
 from typing import Iterable
 
 from app.schemas.dependencies_schema import (
@@ -25,14 +24,18 @@ from app.schemas.dependencies_schema import (
 )
 from app.schemas.rule_schema import (
     AllOfFlagsEvaluator,
-    Constant,
-    FieldRef,
-    RatioOfField,
+    AmountEvaluator,
+    AnyOfFlagsEvaluator,
     Rule,
-    SumOfFields,
+    RulePack,
     ThresholdEvaluator,
 )
-from app.services.rules_engine import EVAL_CONTEXT_FIELDS, load_rules
+from app.services.rule_expr import expr_fields
+from app.services.rules_engine import (
+    EVAL_CONTEXT_FIELDS,
+    RulePackSnapshot,
+    rule_registry,
+)
 
 
 # -------------------- 정적 step DAG --------------------
@@ -106,27 +109,22 @@ def _rule_input_fields(rule: Rule) -> set[str]:
     fields: set[str] = set()
     ev = rule.evaluator
     if isinstance(ev, ThresholdEvaluator):
-        for expr in (ev.threshold, ev.value):
-            if isinstance(expr, FieldRef):
-                fields.add(expr.name)
-            elif isinstance(expr, RatioOfField):
-                fields.add(expr.field)
-            elif isinstance(expr, SumOfFields):
-                fields.update(expr.fields)
-            elif isinstance(expr, Constant):
-                pass
-    elif isinstance(ev, AllOfFlagsEvaluator):
+        fields |= expr_fields(ev.threshold) | expr_fields(ev.value)
+    elif isinstance(ev, AmountEvaluator):
+        fields |= expr_fields(ev.value)
+    elif isinstance(ev, (AllOfFlagsEvaluator, AnyOfFlagsEvaluator)):
         fields.update(ev.flags)
     return fields
 
 
-@lru_cache(maxsize=4)
-def _build_indices(year: int = 2025) -> tuple[
+_INDEX_KEY = "dependencies.indices"
+
+
+def _index_pack(pack: RulePack) -> tuple[
     dict[str, list[str]],  # field → rule_ids
     dict[str, set[str]],  # rule_id → input fields
     dict[str, Rule],  # rule_id → Rule
 ]:
-    pack = load_rules(year=year)
     field_to_rules: dict[str, list[str]] = {}
     rule_to_fields: dict[str, set[str]] = {}
     rule_by_id: dict[str, Rule] = {}
@@ -139,6 +137,30 @@ def _build_indices(year: int = 2025) -> tuple[
     return field_to_rules, rule_to_fields, rule_by_id
 
 
+def _build_indices(
+    year: int = 2025, snapshot: RulePackSnapshot | None = None
+) -> tuple[dict[str, list[str]], dict[str, set[str]], dict[str, Rule]]:
+    """
+    룰 팩 snapshot 에 부착된 인덱스. 팩이 교체되면 새 snapshot 에서 다시 만들어짐
+    → 팩과 인덱스가 항상 같은 버전 (별도 cache_clear 불필요).
+    """
+    snap = snapshot or rule_registry.snapshot(year)
+    return snap.derive(_INDEX_KEY, _index_pack)
+
+
+def rule_ids_for_fields(
+    fields: Iterable[str],
+    year: int = 2025,
+    snapshot: RulePackSnapshot | None = None,
+) -> set[str]:
+    """입력 필드 중 하나라도 읽는 rule_id 집합 (증분 재평가용)."""
+    field_to_rules, _, _ = _build_indices(year, snapshot)
+    out: set[str] = set()
+    for f in fields:
+        out.update(field_to_rules.get(f, ()))
+    return out
+
+
 def _build_field_to_steps() -> dict[str, list[str]]:
     """field/step 이름 → 그것을 입력으로 읽는 step 들."""
     out: dict[str, list[str]] = {}
@@ -0,0 +1,145 @@
+"""
+임베딩 배치 파이프라인 — 고정 크기 배치 + 동시성 제한 + 배치별 재시도.
+
+== 목적 ==
+index_law 가 청크 전체를 embed() 1회로 보내면 큰 법령은 공급자 요청 한도를 넘고,
+중간에 실패하면 전부 다시 해야 함.
+
+== 흐름 ==
+texts → batch_size 단위로 자름 → asyncio.Semaphore(concurrency) 로 동시 호출 수 제한
+  · 일시 오류(is_transient: rate limit / timeout / 연결 / 5xx) 면 지수 backoff
+    (backoff_base · 2^n, 최대 backoff_max) 후 max_retries 번 재시도.
+    인증 · 잘못된 요청 · 코드 버그 등 나머지 예외는 재시도 없이 바로 올림
+  · 배치가 끝날 때마다 on_batch(start, vectors) → 호출자가 즉시 저장 (embedding_store)
+    → 중간에 죽어도 다음 재인덱싱은 끝난 배치를 재사용 (재개 가능)
+  · on_progress(done, total) 로 진행률 전달
+
+== 원칙 ==
+- 결과 순서 = 입력 순서 (배치 완료 순서와 무관).
+- 개수 불일치(입력 ≠ 출력)는 재시도하지 않고 즉시 RuntimeError — 일시 오류가 아니라 버그.
+- 한 배치가 재시도까지 실패하면 아직 임베딩 중인 배치를 취소하고 그 예외를 그대로 올림
+  (이미 벡터를 받은 배치는 on_batch 저장까지 마침).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from openai import APIConnectionError, APIStatusError, APITimeoutError, RateLimitError
+
+
+logger = logging.getLogger(__name__)
+
+EmbedFn = Callable[[list[str]], Awaitable[list[list[float]]]]
+BatchFn = Callable[[int, list[list[float]]], Awaitable[None]]
+ProgressFn = Callable[[int, int], None]
+SleepFn = Callable[[float], Awaitable[None]]
+
+
+def is_transient(exc: BaseException) -> bool:
+    """재시도할 가치가 있는 공급자 오류인지 (APITimeoutError 는 APIConnectionError 하위)."""
+    if isinstance(exc, (RateLimitError, APITimeoutError, APIConnectionError)):
+        return True
+    return isinstance(exc, APIStatusError) and exc.status_code >= 500
+
+
+@dataclass(frozen=True, slots=True)
+class EmbedBatchConfig:
+    """배치 크기 / 동시성 / 재시도 손잡이."""
+
+    batch_size: int = 128
+    concurrency: int = 4
+    max_retries: int = 3
+    backoff_base: float = 0.5  # 초
+    backoff_max: float = 8.0
+
+    def __post_init__(self) -> None:
+        if self.batch_size < 1 or self.concurrency < 1 or self.max_retries < 0:
+            raise ValueError(
+                "batch_size / concurrency 는 1 이상, max_retries 는 0 이상이어야 합니다."
+            )
+
+    def backoff(self, attempt: int) -> float:
+        return min(self.backoff_max, self.backoff_base * (2**attempt))
+
+
+async def embed_in_batches(
+    texts: list[str],
+    embed: EmbedFn,
+    *,
+    config: EmbedBatchConfig = EmbedBatchConfig(),
+    on_batch: BatchFn | None = None,
+    on_progress: ProgressFn | None = None,
+    sleep: SleepFn = asyncio.sleep,
+) -> list[list[float]]:
+    """texts 를 배치로 나눠 임베딩. 반환 순서는 texts 와 동일."""
+    total = len(texts)
+    if total == 0:
+        return []
+
+    out: list[list[float] | None] = [None] * total
+    semaphore = asyncio.Semaphore(config.concurrency)
+    done = 0
+    finishing: set[int] = set()  # 임베딩은 끝나고 on_batch 저장 중인 배치
+
+    async def _call(start: int, batch: list[str]) -> list[list[float]]:
+        attempt = 0
+        while True:
+            try:
+                vectors = await embed(batch)
+            except Exception as e:
+                if not is_transient(e) or attempt >= config.max_retries:
+                    raise
+                delay = config.backoff(attempt)
+                attempt += 1
+                logger.warning(
+                    "embed_batch_retry start=%s size=%s attempt=%s delay=%.2fs error=%s",
+                    start,
+                    len(batch),
+                    attempt,
+                    delay,
+                    e,
+                )
+                await sleep(delay)
+                continue
+            if len(vectors) != len(batch):
+                raise RuntimeError(
+                    f"임베딩 개수 불일치: 입력 {len(batch)} / 출력 {len(vectors)}"
+                )
+            return vectors
+
+    async def _run(start: int) -> None:
+        nonlocal done
+        batch = texts[start : start + config.batch_size]
+        async with semaphore:
+            vectors = await _call(start, batch)
+        out[start : start + len(batch)] = vectors
+        finishing.add(start)
+        if on_batch is not None:
+            await on_batch(start, vectors)
+        done += len(batch)
+        logger.info(
+            "embed_batch_done start=%s size=%s progress=%s/%s",
+            start,
+            len(batch),
+            done,
+            total,
+        )
+        if on_progress is not None:
+            on_progress(done, total)
+
+    starts = range(0, total, config.batch_size)
+    tasks = {start: asyncio.create_task(_run(start)) for start in starts}
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        # 아직 임베딩 중인 배치만 취소 — 이미 받은 벡터는 저장까지 마쳐야 재개 가능
+        for start, t in tasks.items():
+            if start not in finishing:
+                t.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return out  # type: ignore[return-value]
@@ -0,0 +1,220 @@
+"""
+임베딩 content-addressed 저장소.
+
+== 목적 ==
+개정은 보통 몇 개 조만 바꾸는데 index_law 는 매번 전 청크를 다시 임베딩.
+(embedding_model, text_hash) → 벡터 를 보관해 두고, 재인덱싱 시 새로 생기거나
+바뀐 청크만 임베딩 API 로 보냄.
+
+== 위치 ==
+server/app/data/rag_embeddings.sqlite3  (data_dir 별 1개, 파생 데이터 — gitignored)
+
+== 원칙 ==
+- 키는 LawChunk.text_hash (legal_api 가 본문 sha256 으로 채움) + 모델명.
+  모델이 바뀌면 자연히 miss → 재임베딩.
+- 벡터는 float32 little-endian BLOB. 인덱스 행렬(rag_index/*.npy) 과 같은 정밀도.
+- 연결은 호출마다 열고 닫음 (asyncio.to_thread / 멀티 워커에서 안전). WAL 모드.
+
+== 검색 query 벡터 ==
+rag.search 의 query 임베딩은 별도 테이블(query_embeddings) — 사용자 입력이라 종류가
+무한히 늘 수 있으므로 청크 테이블과 섞지 않고 TTL(생성 시각 기준) + 최대 건수(LRU) 로 제한.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable
+
+import numpy as np
+
+
+STORE_FILENAME = "rag_embeddings.sqlite3"
+
+# SQLite 변수 개수 제한 회피용 조회 배치
+_LOOKUP_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model      TEXT    NOT NULL,
+    text_hash  TEXT    NOT NULL,
+    dim        INTEGER NOT NULL,
+    vector     BLOB    NOT NULL,
+    created_at TEXT    NOT NULL,
+    PRIMARY KEY (model, text_hash)
+)
+"""
+
+_QUERY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_embeddings (
+    model       TEXT NOT NULL,
+    query_hash  TEXT NOT NULL,
+    dim         INTEGER NOT NULL,
+    vector      BLOB NOT NULL,
+    created_at  REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (model, query_hash)
+)
+"""
+_QUERY_INDEX = (
+    "CREATE INDEX IF NOT EXISTS query_embeddings_accessed ON query_embeddings (accessed_at)"
+)
+
+# query 벡터 보관 한도 (테이블 전체 기준)
+QUERY_TTL_SECONDS = 30 * 24 * 3600.0
+QUERY_MAX_ENTRIES = 50_000
+
+
+class EmbeddingStore:
+    """(model, text_hash) → float32 벡터. query 벡터는 별도 테이블 (TTL + 용량 제한)."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        query_ttl_seconds: float | None = QUERY_TTL_SECONDS,
+        query_max_entries: int = QUERY_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if query_max_entries <= 0:
+            raise ValueError("query_max_entries 는 1 이상이어야 합니다.")
+        self.path = Path(path)
+        self.query_ttl_seconds = query_ttl_seconds
+        self.query_max_entries = query_max_entries
+        self._clock = clock
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.execute(_QUERY_SCHEMA)
+            conn.execute(_QUERY_INDEX)
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def get_many(self, model: str, text_hashes: Iterable[str]) -> dict[str, np.ndarray]:
+        """저장된 것만 반환 (없는 hash 는 결과에 없음)."""
+        wanted = list(dict.fromkeys(text_hashes))
+        if not wanted:
+            return {}
+        out: dict[str, np.ndarray] = {}
+        with closing(self._connect()) as conn:
+            for start in range(0, len(wanted), _LOOKUP_BATCH):
+                batch = wanted[start : start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    "SELECT text_hash, dim, vector FROM embeddings "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *batch],
+                ).fetchall()
+                for text_hash, dim, blob in rows:
+                    vec = np.frombuffer(blob, dtype="<f4")
+                    if vec.shape == (dim,):
+                        out[text_hash] = vec
+        return out
+
+    def put_many(
+        self, model: str, items: Iterable[tuple[str, list[float] | np.ndarray]]
+    ) -> int:
+        """(text_hash, 벡터) 저장. 같은 키는 덮어씀. 저장 건수 반환."""
+        now = datetime.now(timezone.utc).isoformat()
+        rows = []
+        for text_hash, vector in items:
+            vec = np.asarray(vector, dtype="<f4")
+            rows.append((model, text_hash, int(vec.shape[0]), vec.tobytes(), now))
+        if not rows:
+            return 0
+        with closing(self._connect()) as conn:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings "
+                    "(model, text_hash, dim, vector, created_at) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+        return len(rows)
+
+    def count(self, model: str | None = None) -> int:
+        with closing(self._connect()) as conn:
+            if model is None:
+                (n,) = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            else:
+                (n,) = conn.execute(
+                    "SELECT COUNT(*) FROM embeddings WHERE model = ?", (model,)
+                ).fetchone()
+        return int(n)
+
+
+    # ---- query 벡터 ----
+
+    def get_query(self, model: str, query_hash: str) -> np.ndarray | None:
+        """저장된 query 벡터. 없거나 만료면 None (만료 항목은 삭제)."""
+        now = self._clock()
+        with closing(self._connect()) as conn:
+            with conn:
+                row = conn.execute(
+                    "SELECT dim, vector, created_at FROM query_embeddings "
+                    "WHERE model = ? AND query_hash = ?",
+                    (model, query_hash),
+                ).fetchone()
+                if row is None:
+                    return None
+                dim, blob, created_at = row
+                if (
+                    self.query_ttl_seconds is not None
+                    and now - created_at >= self.query_ttl_seconds
+                ):
+                    conn.execute(
+                        "DELETE FROM query_embeddings WHERE model = ? AND query_hash = ?",
+                        (model, query_hash),
+                    )
+                    return None
+                conn.execute(
+                    "UPDATE query_embeddings SET accessed_at = ? "
+                    "WHERE model = ? AND query_hash = ?",
+                    (now, model, query_hash),
+                )
+        vec = np.frombuffer(blob, dtype="<f4")
+        return vec if vec.shape == (dim,) else None
+
+    def put_query(
+        self, model: str, query_hash: str, vector: list[float] | np.ndarray
+    ) -> None:
+        """query 벡터 저장 (같은 키는 덮어씀) 후 만료 · 용량 초과분 정리."""
+        now = self._clock()
+        vec = np.asarray(vector, dtype="<f4")
+        with closing(self._connect()) as conn:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO query_embeddings "
+                    "(model, query_hash, dim, vector, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (model, query_hash, int(vec.shape[0]), vec.tobytes(), now, now),
+                )
+                if self.query_ttl_seconds is not None:
+                    conn.execute(
+                        "DELETE FROM query_embeddings WHERE created_at <= ?",
+                        (now - self.query_ttl_seconds,),
+                    )
+                conn.execute(
+                    "DELETE FROM query_embeddings WHERE rowid IN ("
+                    "SELECT rowid FROM query_embeddings "
+                    "ORDER BY accessed_at DESC, created_at DESC LIMIT -1 OFFSET ?)",
+                    (self.query_max_entries,),
+                )
+
+    def query_count(self) -> int:
+        with closing(self._connect()) as conn:
+            (n,) = conn.execute("SELECT COUNT(*) FROM query_embeddings").fetchone()
+        return int(n)
+
+
+def store_for(data_dir: Path) -> EmbeddingStore:
+    return EmbeddingStore(data_dir / STORE_FILENAME)
@@ -0,0 +1,126 @@
+"""
+LLM 토큰 스트림용 증분 JSON 파서.
+
+== 목적 ==
+/analyze/stream 은 LLM 응답 전체({"summary", "sections": [...], "tax_tips"})를
+기다리지 않고, sections 의 객체 하나가 닫히는 순간 바로 내보냄.
+
+== 동작 ==
+feed(text) 로 조각을 넣으면 새로 완성된 값을 이벤트로 반환.
+  - ItemEvent(key, index, value) : 최상위 배열 값(key)의 원소(객체/배열)가 닫힘
+  - ValueEvent(key, value)       : 최상위 키의 값(객체/배열)이 닫힘
+- 문자 단위 상태기계 (문자열 / 이스케이프 / 괄호 스택) — 완성된 구간만 json.loads.
+- 첫 '{' 이전(```json 펜스 등) 과 최상위 객체가 닫힌 뒤의 텍스트는 무시.
+- 완성 구간 파싱 실패(LLM 의 trailing comma 등) → 정리 후 재시도, 그래도 실패면 건너뜀
+  (호출자는 스트림 종료 후 전체 파싱 결과로 보정).
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class ItemEvent:
+    key: str
+    index: int
+    value: Any
+
+
+@dataclass(frozen=True, slots=True)
+class ValueEvent:
+    key: str
+    value: Any
+
+
+StreamEvent = ItemEvent | ValueEvent
+
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
+
+def _loads(text: str) -> tuple[bool, Any]:
+    for candidate in (text, _TRAILING_COMMA_RE.sub(r"\1", text)):
+        try:
+            return True, json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+    return False, None
+
+
+class JsonStreamParser:
+    """최상위 객체 1개를 조각 단위로 받아 완성된 값부터 방출."""
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._pos = 0
+        self._stack: list[str] = []  # 열린 괄호 ('{' / '[')
+        self._in_str = False
+        self._esc = False
+        self._str_start = 0
+        self._expect_key = False  # 최상위 객체에서 다음 문자열이 키인지
+        self._key: str | None = None
+        self._value_start: int | None = None  # 최상위 키 값(컨테이너) 시작
+        self._item_start: int | None = None  # 최상위 배열 원소(컨테이너) 시작
+        self._item_index = 0
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        """최상위 객체가 닫혔는지."""
+        return self._done
+
+    def feed(self, text: str) -> list[StreamEvent]:
+        self._buf += text
+        events: list[StreamEvent] = []
+        buf = self._buf
+        i = self._pos
+        while i < len(buf) and not self._done:
+            ch = buf[i]
+            if self._in_str:
+                if self._esc:
+                    self._esc = False
+                elif ch == "\\":
+                    self._esc = True
+                elif ch == '"':
+                    self._in_str = False
+                    if len(self._stack) == 1 and self._expect_key:
+                        ok, key = _loads(buf[self._str_start : i + 1])
+                        self._key = key if ok else None
+                        self._expect_key = False
+            elif ch == '"' and self._stack:
+                self._in_str = True
+                self._str_start = i
+            elif ch == "{" or (ch == "[" and self._stack):
+                depth = len(self._stack)
+                if depth == 0:
+                    self._expect_key = True
+                elif depth == 1:
+                    self._value_start = i
+                    self._item_index = 0
+                elif depth == 2 and self._stack[1] == "[":
+                    self._item_start = i
+                self._stack.append(ch)
+            elif ch in "}]" and self._stack:
+                self._stack.pop()
+                depth = len(self._stack)
+                if depth == 2 and self._stack[1] == "[" and self._item_start is not None:
+                    ok, value = _loads(buf[self._item_start : i + 1])
+                    if ok and self._key is not None:
+                        events.append(ItemEvent(self._key, self._item_index, value))
+                    self._item_index += 1
+                    self._item_start = None
+                elif depth == 1 and self._value_start is not None:
+                    ok, value = _loads(buf[self._value_start : i + 1])
+                    if ok and self._key is not None:
+                        events.append(ValueEvent(self._key, value))
+                    self._value_start = None
+                elif depth == 0:
+                    self._done = True
+            elif ch == "," and len(self._stack) == 1:
+                self._expect_key = True
+            i += 1
+        self._pos = i
+        return events
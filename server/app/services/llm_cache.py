@@ -0,0 +1,202 @@
+"""
+LLM 응답 content-addressed 캐시.
+
+== 목적 ==
+재시도 · 뒤로가기 · 데모 계정처럼 같은 위저드 입력이 다시 들어오면 generate_analysis 가
+같은 프롬프트로 gpt-4o-mini 를 또 호출함 (비용 + 수 초 지연).
+렌더링된 프롬프트 전체 + 모델 + temperature 의 해시 → LLM 원문 응답 을 보관해 재사용.
+
+== 위치 ==
+server/app/data/llm_cache.sqlite3  (파생 데이터 — gitignored)
+
+== 원칙 ==
+- 키: sha256(model, temperature, max_tokens, messages) — build_prompt 결과가 1글자라도
+  다르면(룰 평가 / RAG 청크 / 세액 포함) 자연히 miss. SYSTEM_PROMPT 변경도 마찬가지.
+- 값: LLM 원문 텍스트. 파싱 · 스키마 검증에 성공한 응답만 저장 (실패 응답 재사용 방지).
+- TTL 경과 항목은 조회 시 miss + 삭제. 저장 시 max_entries 초과분은 최근 사용이 가장
+  오래된 것부터 제거 (LRU).
+- 연결은 호출마다 열고 닫음 (asyncio.to_thread / 멀티 워커에서 안전). WAL 모드.
+- opt-in: LLM_CACHE_ENABLED=1 일 때만 켬 (LLM_CACHE_TTL_SECONDS 기본 7일,
+  LLM_CACHE_MAX_ENTRIES 기본 5000).
+  TTL / 용량은 default_cache() 첫 호출 때 읽음 — 숫자가 아니거나 0 이하면 경고 로그 후
+  기본값 (잘못된 env 값이 앱 import 를 깨지 않게).
+
+== 개인정보 ==
+- 응답 원문에는 사용자 입력(총급여 · 부양가족 · 공제 금액 등)이 그대로 인용됨 →
+  켜면 평문으로 디스크에 남음 (키는 해시지만 값은 암호화 안 함). 그래서 기본은 꺼짐 —
+  배포가 명시적으로 켜야만 새 개인정보 사본이 생김.
+- DB 파일은 생성 시 소유자만 읽기/쓰기(0600). 백업 · 공유 볼륨 · 다중 사용자 호스트에
+  data/ 가 노출되는 배포에서는 켜지 말 것.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Callable
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "llm_cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key         TEXT PRIMARY KEY,
+    model       TEXT NOT NULL,
+    content     TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+_INDEX = "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+
+
+# LLM_CACHE_ENABLED=1 일 때만 켬 (개인정보 평문 저장 — opt-in).
+# TTL / 용량은 배포별 조정 가능 (default_cache 에서 읽음).
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "0") == "1"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def _env_positive(name: str, default: float, parse: Callable[[str], float]) -> float:
+    """env 값을 parse. 없으면 default, 숫자가 아니거나 0 이하 / 무한대면 경고 후 default."""
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = parse(raw.strip())
+    except ValueError:
+        value = None
+    if value is None or not math.isfinite(value) or value <= 0:
+        logger.warning("llm_cache_invalid_env name=%s value=%r default=%s", name, raw, default)
+        return default
+    return value
+
+
+def cache_key(completion_kwargs: dict[str, Any]) -> str:
+    """chat.completions.create 인자 중 응답을 결정하는 것만 해시."""
+    material = {
+        "model": completion_kwargs["model"],
+        "temperature": completion_kwargs.get("temperature"),
+        "max_tokens": completion_kwargs.get("max_tokens"),
+        "messages": completion_kwargs["messages"],
+    }
+    blob = json.dumps(material, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class LlmResponseCache:
+    """key → LLM 원문 응답 (TTL + 용량 제한)."""
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries 는 1 이상이어야 합니다.")
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            # 응답 원문에 급여 · 부양가족 정보가 있음 → 소유자만 (-wal / -shm 도 이 권한을 따름)
+            try:
+                os.chmod(self.path, 0o600)
+            except OSError:
+                logger.warning("llm_cache_chmod_failed path=%s", self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.execute(_INDEX)
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at >= self.ttl_seconds
+
+    def get(self, key: str) -> str | None:
+        """저장된 응답. 없거나 만료면 None (만료 항목은 삭제)."""
+        now = self._clock()
+        with closing(self._connect()) as conn:
+            with conn:
+                row = conn.execute(
+                    "SELECT content, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                content, created_at = row
+                if self._expired(created_at, now):
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+                conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+        return content
+
+    def put(self, key: str, model: str, content: str) -> None:
+        """저장 (같은 key 는 덮어씀) 후 만료 · 용량 초과분 정리."""
+        now = self._clock()
+        with closing(self._connect()) as conn:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, model, content, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, model, content, now, now),
+                )
+                if self.ttl_seconds is not None:
+                    conn.execute(
+                        "DELETE FROM responses WHERE created_at <= ?",
+                        (now - self.ttl_seconds,),
+                    )
+                conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY accessed_at DESC, created_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def count(self) -> int:
+        with closing(self._connect()) as conn:
+            (n,) = conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return int(n)
+
+    def clear(self) -> None:
+        with closing(self._connect()) as conn:
+            with conn:
+                conn.execute("DELETE FROM responses")
+
+
+_DEFAULT: LlmResponseCache | None = None
+
+
+def default_cache() -> LlmResponseCache | None:
+    """프로세스 공용 캐시 (DEFAULT_PATH). 꺼져 있으면 None."""
+    global _DEFAULT
+    if not LLM_CACHE_ENABLED:
+        return None
+    if _DEFAULT is None:
+        _DEFAULT = LlmResponseCache(
+            DEFAULT_PATH,
+            ttl_seconds=_env_positive("LLM_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS, float),
+            max_entries=int(
+                _env_positive("LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES, int)
+            ),
+        )
+    return _DEFAULT
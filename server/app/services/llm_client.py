@@ -1,8 +1,12 @@
-from typing import Tuple, List
+from typing import Any, AsyncIterator, Tuple, List
 from openai import AsyncOpenAI
+from pydantic import ValidationError
+import asyncio
 import os
 import json
+import logging
 import re
+import sqlite3
 
 from app.schemas.user_input_schema import Income, Dependents, Conditions
 from app.schemas.pdf_schema import ParsedPdfData
@@ -10,8 +14,12 @@ from app.schemas.manual_input_schema import ManualInputRequest
 from app.schemas.analysis_schema import Summary, Section
 from app.schemas.rag_schema import SearchHit
 from app.schemas.tax_calculator_schema import CalcResult
+from app.services import llm_cache
+from app.services.json_stream import ItemEvent, JsonStreamParser, ValueEvent
 from app.services.rules_engine import RuleContext
 
+logger = logging.getLogger(__name__)
+
 # OpenAI 클라이언트는 lazy init — 테스트 환경에서 모듈 로드 시점 OPENAI_API_KEY 미설정 회피.
 _client: AsyncOpenAI | None = None
 
@@ -381,6 +389,77 @@ PDF 월세: {fmt_money(parsed_pdf.rent_in_pdf)}
 # 3) LLM 호출 함수
 # -------------------------------
 
+def _completion_kwargs(prompt: str) -> dict:
+    return dict(
+        model="gpt-4o-mini",
+        temperature=0.3,
+        max_tokens=4000,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ],
+    )
+
+
+def _parse_analysis_json(content: str) -> dict:
+    # 1차 파싱
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        cleaned = extract_json(content)
+        try:
+            return json.loads(cleaned)
+        except json.JSONDecodeError as e:
+            raise ValueError(
+                f"LLM JSON 파싱 실패(자동수정도 실패): {content}"
+            ) from e
+
+
+def _analysis_from_raw(raw: dict) -> Tuple[Summary, List[Section], List[str]]:
+    summary = Summary(**raw["summary"])
+    # provenance 는 백엔드가 채우므로 LLM 출력에서 빠져 있어도 OK
+    sections = [Section(**sec) for sec in raw["sections"]]
+    tax_tips = raw.get("tax_tips", [])
+    return summary, sections, tax_tips
+
+
+# 응답 캐시 (llm_cache) — 저장소 장애는 miss 로 취급하고 LLM 호출로 진행
+
+async def _cache_get(key: str) -> str | None:
+    cache = llm_cache.default_cache()
+    if cache is None:
+        return None
+    try:
+        return await asyncio.to_thread(cache.get, key)
+    except sqlite3.Error:
+        logger.warning("llm_cache_get_failed", exc_info=True)
+        return None
+
+
+async def _cache_put(key: str, model: str, content: str) -> None:
+    cache = llm_cache.default_cache()
+    if cache is None:
+        return
+    try:
+        await asyncio.to_thread(cache.put, key, model, content)
+    except sqlite3.Error:
+        logger.warning("llm_cache_put_failed", exc_info=True)
+
+
+async def _cached_analysis(
+    key: str,
+) -> Tuple[Summary, List[Section], List[str]] | None:
+    """캐시 적중 시 파싱된 분석. 저장된 응답이 현재 스키마에 안 맞으면 None (재생성)."""
+    content = await _cache_get(key)
+    if content is None:
+        return None
+    try:
+        return _analysis_from_raw(_parse_analysis_json(content))
+    except (ValueError, KeyError, TypeError):
+        logger.warning("llm_cache_stale_entry key=%s", key[:12])
+        return None
+
+
 async def generate_analysis(
     income: Income,
     dependents: Dependents,
@@ -390,7 +469,8 @@ async def generate_analysis(
     rule_context: RuleContext,
     rag_hits: List[SearchHit] | None = None,
     calc_result: CalcResult | None = None,
-) -> Tuple[Summary, List[Section], List[str]]:
+) -> Tuple[Summary, List[Section], List[str], bool]:
+    """(summary, sections, tax_tips, cached) — cached 는 응답 캐시 적중 여부."""
 
     prompt = build_prompt(
         income,
@@ -402,34 +482,113 @@ async def generate_analysis(
         rag_hits=rag_hits,
         calc_result=calc_result,
     )
+    kwargs = _completion_kwargs(prompt)
+    key = llm_cache.cache_key(kwargs)
 
-    response = await _get_client().chat.completions.create(
-        model="gpt-4o-mini",
-        temperature=0.3,
-        max_tokens=4000,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": prompt},
-        ],
-    )
+    hit = await _cached_analysis(key)
+    if hit is not None:
+        return (*hit, True)
+
+    response = await _get_client().chat.completions.create(**kwargs)
 
     content = response.choices[0].message.content
+    summary, sections, tax_tips = _analysis_from_raw(_parse_analysis_json(content))
 
-    # 1차 파싱
-    try:
-        raw = json.loads(content)
-    except json.JSONDecodeError:
-        cleaned = extract_json(content)
-        try:
-            raw = json.loads(cleaned)
-        except json.JSONDecodeError as e:
-            raise ValueError(
-                f"LLM JSON 파싱 실패(자동수정도 실패): {content}"
-            ) from e
+    # 파싱 · 검증을 통과한 응답만 저장
+    await _cache_put(key, kwargs["model"], content)
+    return summary, sections, tax_tips, False
 
-    summary = Summary(**raw["summary"])
-    # provenance 는 백엔드가 채우므로 LLM 출력에서 빠져 있어도 OK
-    sections = [Section(**sec) for sec in raw["sections"]]
-    tax_tips = raw.get("tax_tips", [])
 
-    return summary, sections, tax_tips
+# -------------------------------
+# 4) 스트리밍 (/analyze/stream)
+# -------------------------------
+
+# ("summary", Summary) | ("section", Section) | ("tax_tips", list) | ("cached", True)
+AnalysisEvent = Tuple[str, Any]
+
+
+async def stream_analysis(
+    income: Income,
+    dependents: Dependents,
+    conditions: Conditions,
+    parsed_pdf: ParsedPdfData,
+    manual_input: ManualInputRequest,
+    rule_context: RuleContext,
+    rag_hits: List[SearchHit] | None = None,
+    calc_result: CalcResult | None = None,
+) -> AsyncIterator[AnalysisEvent]:
+    """
+    generate_analysis 의 스트리밍 버전. 프롬프트 / 모델 / 파싱 규칙은 동일.
+
+    LLM 토큰을 JsonStreamParser 에 흘려 sections 원소가 닫히는 즉시 ("section", Section),
+    summary / tax_tips 값이 닫히면 각각 방출. 스트림 종료 후 전체 텍스트를 generate_analysis
+    와 같은 방식으로 파싱해, 중간에 못 낸 항목(부분 파싱 실패 등) 을 보충 — 각 항목은 1회만.
+
+    응답 캐시는 generate_analysis 와 공유 (같은 key). 적중 시 LLM 호출 없이 ("cached", True)
+    를 먼저 낸 뒤 저장된 응답의 항목을 순서대로 방출. 미스면 스트림 완료 + 검증 후 저장.
+    """
+    prompt = build_prompt(
+        income,
+        dependents,
+        conditions,
+        parsed_pdf,
+        manual_input,
+        rule_context,
+        rag_hits=rag_hits,
+        calc_result=calc_result,
+    )
+
+    kwargs = _completion_kwargs(prompt)
+    key = llm_cache.cache_key(kwargs)
+
+    hit = await _cached_analysis(key)
+    if hit is not None:
+        summary, sections, tax_tips = hit
+        yield "cached", True
+        yield "summary", summary
+        for section in sections:
+            yield "section", section
+        yield "tax_tips", tax_tips
+        return
+
+    stream = await _get_client().chat.completions.create(**kwargs, stream=True)
+
+    parser = JsonStreamParser()
+    parts: List[str] = []
+    sent_sections: set[int] = set()
+    sent: set[str] = set()
+
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        parts.append(delta)
+        for ev in parser.feed(delta):
+            try:
+                if isinstance(ev, ItemEvent) and ev.key == "sections":
+                    section = Section(**ev.value)
+                    sent_sections.add(ev.index)
+                    yield "section", section
+                elif isinstance(ev, ValueEvent) and ev.key == "summary":
+                    summary = Summary(**ev.value)
+                    sent.add("summary")
+                    yield "summary", summary
+                elif isinstance(ev, ValueEvent) and ev.key == "tax_tips":
+                    sent.add("tax_tips")
+                    yield "tax_tips", list(ev.value)
+            except (TypeError, ValidationError):
+                continue  # 종료 후 전체 파싱으로 보충
+
+    content = "".join(parts)
+    summary, sections, tax_tips = _analysis_from_raw(_parse_analysis_json(content))
+    for i, section in enumerate(sections):
+        if i not in sent_sections:
+            yield "section", section
+    if "summary" not in sent:
+        yield "summary", summary
+    if "tax_tips" not in sent:
+        yield "tax_tips", tax_tips
+
+    await _cache_put(key, kwargs["model"], content)
@@ -4,44 +4,112 @@ Phase 4-2: 단순 RAG.
 == 구조 ==
 법령 chunks → OpenAI embedding → 디스크 저장 (per-law) → 메모리 로드 → cosine top-K
 
-== 위치 ==
-server/app/data/rag_index/{law_id}/{effective_date or 'latest'}.json
+== 위치 / 포맷 ==
+server/app/data/rag_index/{law_id}/{effective_date or 'latest'}.json  — 메타 sidecar (임베딩 제외)
+server/app/data/rag_index/{law_id}/{effective_date or 'latest'}.npy   — (청크 수 × dim) float32 행렬
+- 행렬은 np.load(mmap_mode="r") 로 로드 → 페이지 캐시 공유, 상주 메모리 최소.
+- 쓰기는 .npy → sidecar 순서로 각각 tmp + os.replace (sidecar 가 커밋 마커).
+- 이전 포맷(임베딩이 JSON float 리스트로 들어간 단일 파일)도 그대로 읽음.
 
 == 안전장치 ==
 - embed_fn 인자로 OpenAI 호출 주입 가능 (테스트용)
 - chunks_override 로 법령 API 우회 가능
 - 동일 (law_id, effective_date) 재인덱싱 = 덮어쓰기
 
+== 검색 ==
+- snapshot 마다 차원별 SearchBlock: 정규화된 float32 행렬 1개 + law_id / article_no bool mask.
+- 점수 = 행렬 @ 정규화 query 1회, top-K 는 argpartition (동점은 인덱스 순서 — 기존 정렬과 동일).
+
+- 청크가 ANN_CONFIG.min_rows 이상이면 IVF ANN (rag_ann.py, data/rag_ann/ 에 저장).
+  인덱스 빌드는 index_law 끝에서 (build_ann_indexes), 검색은 디스크에서 로드만.
+  작은 코퍼스 / 필터 후 후보가 적은 경우 / exact=True / 인덱스 파일 없음 은 정확 검색.
+- mode="lexical" 은 블록별 문자 bigram BM25 역색인 (rag_lexical.py) 만 — 임베딩 호출 없음.
+  역색인은 snapshot 을 만들 때 행렬과 함께 빌드 (index_law 는 끝에서 snapshot 을 미리 만듦)
+  → 검색 요청은 조회만.
+  mode="hybrid" 는 BM25 shortlist 만 cosine 으로 재정렬 후 점수 융합.
+- lookup_anchor("소득세법 §59의4 ②") / get_chunk(chunk_id) 는 snapshot 의 anchor 색인에서
+  바로 조회 (법령명별 최신 팩 기준).
+
+== 상주 캐시 ==
+- data_dir 별 IndexCache 가 불변 IndexSnapshot 을 들고 있음 → search / get_stats 는 파일 안 읽음.
+- index_law 는 같은 프로세스 캐시를 즉시 무효화, 다른 워커는 check_interval(1초) 마다
+  sidecar stat 비교로 감지 → 바뀐 팩만 다시 로드.
+
+== 임베딩 재사용 ==
+- data/rag_embeddings.sqlite3 (embedding_store.py) 에 (embedding_model, text_hash) → 벡터.
+- 재인덱싱 시 새로 생기거나 바뀐 청크만 embed_fn 호출, 나머지는 저장소 벡터 재사용.
+- 검색 query 도 (모델, 정규화 query) LRU+TTL 캐시 → 저장소 query 테이블(TTL + 용량 제한)
+  → API 순 (기본 임베딩일 때만).
+- 새 청크는 EMBED_BATCH_CONFIG 단위 배치 + 동시성 제한 + 재시도 (embedding_batch.py),
+  배치마다 저장소에 기록 → 큰 법령 인덱싱이 중간에 실패해도 재실행 시 이어서 진행.
+
 == 한계 (v0) ==
-- 모든 인덱스를 매 검색마다 메모리 로드 — 수백 법령까지는 OK, 그 이상이면 vector DB.
-- 임베딩 재사용 dedup 미구현 (text_hash 동일이면 skip 같은 최적화는 v1).
 - 한국어 토큰화 별도 안 함 — OpenAI embedding 모델이 다국어 지원.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import io
 import json
+import logging
 import math
 import os
 import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Awaitable, Callable
 
+import numpy as np
 from openai import AsyncOpenAI
 
 from app.schemas.legal_schema import Law
+from app.services import rag_ann
+from app.services.atomic_io import atomic_write_bytes
+from app.services.embedding_batch import EmbedBatchConfig, ProgressFn, embed_in_batches
+from app.services.embedding_store import store_for
+from app.services.result_cache import ResultCache
+from app.services.rag_ann import AnnConfig, AnnIndex
+from app.services.rag_lexical import LexicalIndex
 from app.schemas.rag_schema import (
     IndexedChunk,
     IndexedLawPack,
     IndexStatsEntry,
     SearchHit,
+    SearchMode,
 )
 
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 RAG_SUBDIR = ("rag_index",)
 DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+INDEX_FORMAT = "npy-v1"
+
+# index_law 임베딩 배치 크기 / 동시성 / 재시도 (services/embedding_batch.py)
+EMBED_BATCH_CONFIG = EmbedBatchConfig()
+
+# query 임베딩 캐시 — (모델, 정규화 query) → 정규화 전 벡터.
+# 프로세스 내 LRU + TTL, 미스 시 임베딩 저장소(data_dir) 의 query 테이블도 조회
+# (embedding_store.QUERY_TTL_SECONDS / QUERY_MAX_ENTRIES, RAG_QUERY_CACHE_PERSIST=0 이면 끔).
+QUERY_CACHE_PERSIST = os.getenv("RAG_QUERY_CACHE_PERSIST", "1") != "0"
+_QUERY_CACHE: ResultCache[np.ndarray] = ResultCache(maxsize=1024, ttl_seconds=24 * 3600.0)
+
+# hybrid 검색: lexical 상위 max(top_k × 배수, 최소) 행만 벡터 점수로 재정렬.
+# 융합 점수 = w·cosine + (1 − w)·(BM25 / shortlist 최대 BM25)
+HYBRID_SHORTLIST_FACTOR = 10
+HYBRID_SHORTLIST_MIN = 50
+HYBRID_VECTOR_WEIGHT = 0.5
+
+# ANN 사용 조건 / recall·latency 손잡이 (services/rag_ann.py)
+ANN_CONFIG = AnnConfig()
 
 
 # OpenAI 클라이언트 lazy init
@@ -99,6 +167,10 @@ def _pack_path(
     return _rag_dir(data_dir) / safe_law / f"{key}.json"
 
 
+def _matrix_path(sidecar: Path) -> Path:
+    return sidecar.with_suffix(".npy")
+
+
 # -------------------- cosine --------------------
 
 
@@ -120,6 +192,84 @@ def cosine(a: list[float], b: list[float]) -> float:
 # -------------------- 인덱싱 --------------------
 
 
+async def _embed_with_reuse(
+    texts: list[str],
+    text_hashes: list[str],
+    *,
+    embed: EmbedFn,
+    embedding_model: str,
+    data_dir: Path,
+    batch_config: EmbedBatchConfig,
+    progress: ProgressFn | None,
+) -> list[list[float]]:
+    """
+    저장소에 없는 text_hash 만 임베딩 (같은 hash 는 1번만), 새 벡터는 배치가 끝날 때마다
+    저장소에 추가 → 중간 실패 후 재실행하면 끝난 배치는 재사용.
+    text_hash 가 비어있는 청크는 항상 새로 임베딩. 저장소 오류 시 전부 임베딩.
+    """
+    store = store_for(data_dir)
+    try:
+        cached = await asyncio.to_thread(
+            store.get_many, embedding_model, [h for h in text_hashes if h]
+        )
+    except sqlite3.Error:
+        logger.warning("embedding_store_read_failed path=%s", store.path, exc_info=True)
+        cached = {}
+
+    # 임베딩할 고유 입력: hash 있으면 hash 단위 dedup, 없으면 청크 단위
+    pending: dict[str, int] = {}
+    to_embed: list[str] = []
+    embed_hashes: list[str] = []
+    slots: list[int | None] = []
+    for text, h in zip(texts, text_hashes):
+        if h and h in cached:
+            slots.append(None)
+            continue
+        if h and h in pending:
+            slots.append(pending[h])
+            continue
+        if h:
+            pending[h] = len(to_embed)
+        slots.append(len(to_embed))
+        to_embed.append(text)
+        embed_hashes.append(h)
+
+    async def _persist(start: int, vectors: list[list[float]]) -> None:
+        items = [
+            (h, vec)
+            for h, vec in zip(embed_hashes[start : start + len(vectors)], vectors)
+            if h
+        ]
+        if not items:
+            return
+        try:
+            await asyncio.to_thread(store.put_many, embedding_model, items)
+        except sqlite3.Error:
+            logger.warning(
+                "embedding_store_write_failed path=%s", store.path, exc_info=True
+            )
+
+    fresh = await embed_in_batches(
+        to_embed,
+        embed,
+        config=batch_config,
+        on_batch=_persist,
+        on_progress=progress,
+    )
+
+    logger.info(
+        "rag_embed model=%s chunks=%s reused=%s embedded=%s",
+        embedding_model,
+        len(texts),
+        sum(1 for s in slots if s is None),
+        len(to_embed),
+    )
+    return [
+        cached[h].tolist() if slot is None else list(fresh[slot])
+        for h, slot in zip(text_hashes, slots)
+    ]
+
+
 async def index_law(
     law: Law,
     *,
@@ -127,11 +277,14 @@ async def index_law(
     embedding_model: str = DEFAULT_EMBEDDING_MODEL,
     data_dir: Path | None = None,
     article_no_filter: str | None = None,
+    batch_config: EmbedBatchConfig | None = None,
+    progress: ProgressFn | None = None,
 ) -> IndexedLawPack:
     """
     Law → 청크 평탄화 → 임베딩 → 디스크 저장 → IndexedLawPack 반환.
 
     article_no_filter 가 주어지면 해당 조만 인덱싱.
+    progress(done, total) 는 임베딩 배치가 끝날 때마다 호출 (재사용 청크는 total 에서 제외).
     """
     base = data_dir or DEFAULT_DATA_DIR
     embed = embed_fn or _default_embed
@@ -162,12 +315,16 @@ async def index_law(
                 }
             )
 
-    # 2) 임베딩 (배치)
-    vectors = await embed(raw_texts)
-    if len(vectors) != len(raw_texts):
-        raise RuntimeError(
-            f"임베딩 개수 불일치: 입력 {len(raw_texts)} / 출력 {len(vectors)}"
-        )
+    # 2) 임베딩 — (모델, text_hash) 저장소에 있는 청크는 재사용, 나머지만 배치 호출
+    vectors = await _embed_with_reuse(
+        raw_texts,
+        [m["text_hash"] for m in raw_meta],
+        embed=embed,
+        embedding_model=embedding_model,
+        data_dir=base,
+        batch_config=batch_config or EMBED_BATCH_CONFIG,
+        progress=progress,
+    )
 
     now = datetime.now(timezone.utc)
     for meta, vec in zip(raw_meta, vectors):
@@ -189,66 +346,530 @@ async def index_law(
         indexed_at=now,
     )
 
-    # 3) 저장
+    # 3) 저장 (float32 행렬 + 메타 sidecar)
     path = _pack_path(base, law.law_id, law.effective_date)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(pack.model_dump(mode="json"), ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    _write_pack_files(path, pack, vectors)
+    # 같은 프로세스의 다음 검색은 바로 새 팩을 봄
+    _index_cache(base).invalidate()
+    # 미리 계산한 룰별 컨텍스트 번들은 팩 구성이 바뀌었으니 폐기
+    from app.services import rag_bundles
+
+    rag_bundles.invalidate(base)
+    # 새 snapshot (정규화 행렬 · BM25 역색인) 도 검색 요청이 아니라 여기서 만듦
+    await asyncio.to_thread(index_snapshot, base)
+    # ANN 인덱스(k-means) 는 검색 요청이 아니라 여기서 빌드·저장
+    try:
+        await asyncio.to_thread(build_ann_indexes, base)
+    except Exception:
+        # 팩은 이미 저장됨 — 인덱스 없으면 검색은 정확 검색으로 동작
+        logger.exception("ann_index_build_failed law_id=%s", law.law_id)
 
     return pack
 
 
+def _write_pack_files(
+    path: Path, pack: IndexedLawPack, vectors: list[list[float]]
+) -> None:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(vectors), -1)
+    sidecar = {
+        "format": INDEX_FORMAT,
+        "law_id": pack.law_id,
+        "law_name": pack.law_name,
+        "effective_date": pack.effective_date,
+        "embedding_model": pack.embedding_model,
+        "indexed_at": pack.indexed_at.isoformat(),
+        "rows": int(matrix.shape[0]),
+        "dim": int(matrix.shape[1]),
+        "chunks": [
+            c.model_dump(
+                mode="json", exclude={"embedding", "embedding_model", "indexed_at"}
+            )
+            for c in pack.chunks
+        ],
+    }
+    buf = io.BytesIO()
+    np.save(buf, matrix)
+    atomic_write_bytes(_matrix_path(path), buf.getvalue())
+    atomic_write_bytes(
+        path,
+        json.dumps(sidecar, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+    )
+
+
 # -------------------- 로드 / stats --------------------
 
 
-def _load_pack(path: Path) -> IndexedLawPack | None:
+@dataclass(frozen=True, slots=True)
+class PackIndex:
+    """
+    디스크 팩 1개의 메모리 표현.
+    chunks: 임베딩 제외 청크 메타, embeddings: (청크 수 × dim) float32 (mmap).
+    IndexedChunk 는 검색 결과로 나갈 때만 생성.
+    """
+
+    law_id: str
+    law_name: str
+    effective_date: str | None
+    embedding_model: str
+    indexed_at: datetime
+    chunks: tuple[dict[str, Any], ...]
+    embeddings: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def chunk(self, i: int) -> IndexedChunk:
+        return IndexedChunk(
+            **{
+                "embedding_model": self.embedding_model,
+                "indexed_at": self.indexed_at,
+                **self.chunks[i],
+            },
+            embedding=self.embeddings[i].tolist(),
+        )
+
+    def to_pack(self) -> IndexedLawPack:
+        return IndexedLawPack(
+            law_id=self.law_id,
+            law_name=self.law_name,
+            effective_date=self.effective_date,
+            embedding_model=self.embedding_model,
+            chunks=[self.chunk(i) for i in range(len(self))],
+            indexed_at=self.indexed_at,
+        )
+
+
+def _pack_index_from_legacy(data: dict[str, Any]) -> PackIndex:
+    """임베딩이 JSON 리스트로 들어간 이전 포맷."""
+    pack = IndexedLawPack.model_validate(data)
+    vectors = [c.embedding for c in pack.chunks]
+    matrix = (
+        np.asarray(vectors, dtype=np.float32)
+        if vectors
+        else np.zeros((0, 0), dtype=np.float32)
+    )
+    return PackIndex(
+        law_id=pack.law_id,
+        law_name=pack.law_name,
+        effective_date=pack.effective_date,
+        embedding_model=pack.embedding_model,
+        indexed_at=pack.indexed_at,
+        chunks=tuple(
+            c.model_dump(exclude={"embedding"}) for c in pack.chunks
+        ),
+        embeddings=matrix,
+    )
+
+
+def _load_pack_index(path: Path) -> PackIndex | None:
     if not path.exists():
         return None
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
-        return IndexedLawPack.model_validate(data)
-    except (OSError, json.JSONDecodeError):
+        if data.get("format") != INDEX_FORMAT:
+            return _pack_index_from_legacy(data)
+        rows, dim = int(data["rows"]), int(data["dim"])
+        if rows == 0:
+            # 빈 파일은 mmap 불가
+            matrix = np.zeros((0, dim), dtype=np.float32)
+        else:
+            matrix = np.load(_matrix_path(path), mmap_mode="r")
+        if matrix.shape != (rows, dim) or len(data["chunks"]) != rows:
+            return None
+        return PackIndex(
+            law_id=data["law_id"],
+            law_name=data["law_name"],
+            effective_date=data.get("effective_date"),
+            embedding_model=data["embedding_model"],
+            indexed_at=datetime.fromisoformat(data["indexed_at"]),
+            chunks=tuple(data["chunks"]),
+            embeddings=matrix,
+        )
+    except (OSError, ValueError, KeyError, TypeError):
         return None
 
 
-def list_packs(data_dir: Path | None = None) -> list[IndexedLawPack]:
-    base = data_dir or DEFAULT_DATA_DIR
-    root = _rag_dir(base)
-    if not root.exists():
-        return []
-    out: list[IndexedLawPack] = []
+def _sidecar_paths(root: Path) -> list[Path]:
+    out: list[Path] = []
     for law_dir in sorted(root.iterdir()):
         if not law_dir.is_dir():
             continue
-        for f in sorted(law_dir.glob("*.json")):
-            pack = _load_pack(f)
-            if pack is not None:
-                out.append(pack)
+        out.extend(sorted(law_dir.glob("*.json")))
     return out
 
 
+# -------------------- 상주 인덱스 캐시 --------------------
+
+
+@dataclass(frozen=True, slots=True)
+class SearchBlock:
+    """
+    같은 차원(dim)의 전체 청크를 한 행렬로. 행 순서 = (팩 순서, 팩 내 청크 순서).
+    matrix 는 행 단위 L2 정규화 (영벡터 행은 0 유지) → cosine = matrix @ q̂.
+    """
+
+    dim: int
+    matrix: np.ndarray  # (rows, dim) float32, C-contiguous
+    pack_ids: np.ndarray  # row → snapshot.packs 인덱스
+    chunk_ids: np.ndarray  # row → 팩 내 청크 인덱스
+    law_masks: dict[str, np.ndarray]
+    article_masks: dict[str, np.ndarray]
+    identity: tuple[str, ...] = ()  # 팩 구성 (ANN 인덱스 파일 키 재료)
+    ann: dict[AnnConfig, AnnIndex] = field(default_factory=dict, compare=False)
+    lexical: LexicalIndex | None = field(default=None, compare=False)  # 문자 n-gram BM25
+
+    def candidates(
+        self, law_id: str | None, article_no: str | None
+    ) -> np.ndarray | None:
+        """필터 → bool mask. 필터가 없으면 None (전체)."""
+        mask: np.ndarray | None = None
+        for table, key in ((self.law_masks, law_id), (self.article_masks, article_no)):
+            if not key:
+                continue
+            m = table.get(key)
+            if m is None:
+                return np.zeros(len(self.pack_ids), dtype=np.bool_)
+            mask = m if mask is None else mask & m
+        return mask
+
+
+def _normalized_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    out = np.divide(
+        matrix, norms, out=np.zeros_like(matrix), where=norms > 0
+    )
+    return np.ascontiguousarray(out, dtype=np.float32)
+
+
+def _build_blocks(packs: tuple[PackIndex, ...]) -> tuple[SearchBlock, ...]:
+    by_dim: dict[int, list[int]] = {}
+    for pi, pack in enumerate(packs):
+        if len(pack) and pack.embeddings.ndim == 2:
+            by_dim.setdefault(int(pack.embeddings.shape[1]), []).append(pi)
+
+    blocks: list[SearchBlock] = []
+    for dim, pack_idx in by_dim.items():
+        members = [packs[pi] for pi in pack_idx]
+        matrix = _normalized_rows(
+            np.concatenate([np.asarray(p.embeddings, dtype=np.float32) for p in members])
+        )
+        pack_ids = np.concatenate(
+            [np.full(len(p), pi, dtype=np.int32) for pi, p in zip(pack_idx, members)]
+        )
+        chunk_ids = np.concatenate(
+            [np.arange(len(p), dtype=np.int32) for p in members]
+        )
+        law_col = np.array(
+            [p.law_id for p in members for _ in range(len(p))], dtype=object
+        )
+        article_col = np.array(
+            [c["article_no"] for p in members for c in p.chunks], dtype=object
+        )
+        lexical = LexicalIndex.build([c["text"] for p in members for c in p.chunks])
+        identity = [
+            f"{p.law_id}|{p.effective_date}|{p.indexed_at.isoformat()}|{len(p)}"
+            for p in members
+        ]
+        blocks.append(
+            SearchBlock(
+                dim=dim,
+                matrix=matrix,
+                pack_ids=pack_ids,
+                chunk_ids=chunk_ids,
+                law_masks={k: law_col == k for k in set(law_col.tolist())},
+                article_masks={k: article_col == k for k in set(article_col.tolist())},
+                identity=tuple(identity),
+                lexical=lexical,
+            )
+        )
+    return tuple(blocks)
+
+
+@dataclass(frozen=True, slots=True)
+class IndexSnapshot:
+    """한 시점의 전체 인덱스. 불변 — 동시 요청이 같은 객체를 공유."""
+
+    generation: int
+    packs: tuple[PackIndex, ...]
+    total_chunks: int
+    blocks: tuple[SearchBlock, ...] = ()
+    # 조문 anchor (법령명, 조[, 항[, 호]]) → (팩, 청크) 목록 / chunk_id → (팩, 청크)
+    anchors: dict[tuple[str, ...], tuple[tuple[int, int], ...]] = field(
+        default_factory=dict
+    )
+    by_chunk_id: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, generation: int, packs: tuple[PackIndex, ...]) -> IndexSnapshot:
+        anchors, by_chunk_id = _build_anchor_index(packs)
+        return cls(
+            generation=generation,
+            packs=packs,
+            total_chunks=sum(len(p) for p in packs),
+            blocks=_build_blocks(packs),
+            anchors=anchors,
+            by_chunk_id=by_chunk_id,
+        )
+
+    def hit(self, ref: tuple[int, int], score: float = 1.0) -> SearchHit:
+        pi, ci = ref
+        return SearchHit(chunk=self.packs[pi].chunk(ci), score=score)
+
+
+# -------------------- 조문 anchor 색인 --------------------
+
+# "소득세법 §59의4 ②", "조세특례제한법 제126조의2 제1항 제3호" 등
+_ANCHOR_RE = re.compile(
+    r"^\s*(?P<law>\S.*?)\s*"
+    r"(?:§\s*(?P<art>\d+(?:\s*의\s*\d+)?)|제\s*(?P<art_no>\d+)\s*조(?:\s*의\s*(?P<art_sub>\d+))?)"
+    r"(?P<rest>.*)$"
+)
+
+
+def _norm_anchor_part(value: str) -> str:
+    """NFKC(① → 1) + 공백 / '제' / 단위(조·항·호) / 끝 구두점 제거."""
+    text = unicodedata.normalize("NFKC", value)
+    text = re.sub(r"\s+", "", text).strip(".)")
+    text = re.sub(r"^(?:제|§)", "", text)
+    return re.sub(r"(?:조|항|호)$", "", text)
+
+
+def _chunk_anchor(chunk: dict[str, Any], law_name: str) -> tuple[str, ...]:
+    key = [_norm_anchor_part(law_name), _norm_anchor_part(chunk["article_no"])]
+    for part in ("paragraph_no", "item_no"):
+        if not chunk.get(part):
+            break
+        key.append(_norm_anchor_part(chunk[part]))
+    return tuple(key)
+
+
+def parse_anchor(anchor: str) -> tuple[str, ...] | None:
+    """legal_anchor 문자열 → (법령명, 조[, 항[, 호]]) 정규화 키. 형식이 다르면 None."""
+    m = _ANCHOR_RE.match(unicodedata.normalize("NFKC", anchor))
+    if m is None:
+        return None
+    if m["art"]:
+        article = m["art"]
+    else:
+        article = m["art_no"] + (f"의{m['art_sub']}" if m["art_sub"] else "")
+    key = [_norm_anchor_part(m["law"]), _norm_anchor_part(article)]
+    key.extend(_norm_anchor_part(tok) for tok in m["rest"].split()[:2])
+    return tuple(k for k in key if k) if key[0] and key[1] else None
+
+
+def _build_anchor_index(
+    packs: tuple[PackIndex, ...],
+) -> tuple[dict[tuple[str, ...], tuple[tuple[int, int], ...]], dict[str, tuple[int, int]]]:
+    """
+    법령명별로 가장 최신 팩(시행일 → 인덱싱 시각)만 색인.
+    키는 모든 접두어(조 / 조+항 / 조+항+호) — 조 단위 anchor 는 그 조의 전체 청크.
+    """
+    latest: dict[str, int] = {}
+    for pi, pack in enumerate(packs):
+        name = _norm_anchor_part(pack.law_name)
+        prev = latest.get(name)
+        if prev is None or (pack.effective_date or "", pack.indexed_at) > (
+            packs[prev].effective_date or "",
+            packs[prev].indexed_at,
+        ):
+            latest[name] = pi
+
+    anchors: dict[tuple[str, ...], list[tuple[int, int]]] = {}
+    by_chunk_id: dict[str, tuple[int, int]] = {}
+    for pi in sorted(latest.values()):
+        pack = packs[pi]
+        for ci, chunk in enumerate(pack.chunks):
+            key = _chunk_anchor(chunk, pack.law_name)
+            for n in range(2, len(key) + 1):
+                anchors.setdefault(key[:n], []).append((pi, ci))
+            by_chunk_id[chunk["chunk_id"]] = (pi, ci)
+    return {k: tuple(v) for k, v in anchors.items()}, by_chunk_id
+
+
+_FileSig = tuple[int, int, int]  # (mtime_ns, size, inode)
+
+
+class IndexCache:
+    """
+    rag_index/ 1개에 대한 상주 캐시.
+    - 같은 프로세스의 index_law 는 invalidate() → 다음 조회에서 즉시 재스캔.
+    - 다른 워커의 재인덱싱은 check_interval 마다 sidecar stat 비교로 감지.
+    - 재스캔 시 stat 이 바뀐 팩만 다시 로드, 나머지 PackIndex 는 재사용.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        check_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.root = root
+        self.check_interval = check_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._by_path: dict[Path, tuple[_FileSig, PackIndex | None]] = {}
+        self._snapshot = IndexSnapshot(generation=0, packs=(), total_chunks=0)
+        self._checked_at: float | None = None
+
+    def invalidate(self) -> None:
+        self._checked_at = None
+
+    def snapshot(self) -> IndexSnapshot:
+        checked_at = self._checked_at
+        if checked_at is not None and self._clock() - checked_at < self.check_interval:
+            return self._snapshot
+        with self._lock:
+            self._rescan()
+            return self._snapshot
+
+    def _rescan(self) -> None:
+        now = self._clock()
+        by_path: dict[Path, tuple[_FileSig, PackIndex | None]] = {}
+        changed = False
+        paths = _sidecar_paths(self.root) if self.root.exists() else []
+        for f in paths:
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                continue
+            sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+            prev = self._by_path.get(f)
+            if prev is not None and prev[0] == sig:
+                by_path[f] = prev
+                continue
+            by_path[f] = (sig, _load_pack_index(f))
+            changed = True
+        if changed or by_path.keys() != self._by_path.keys():
+            packs = tuple(pack for _, pack in by_path.values() if pack is not None)
+            self._snapshot = IndexSnapshot.build(self._snapshot.generation + 1, packs)
+        self._by_path = by_path
+        self._checked_at = now
+
+
+_CACHES: dict[Path, IndexCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def _index_cache(data_dir: Path | None) -> IndexCache:
+    root = _rag_dir(data_dir or DEFAULT_DATA_DIR).resolve()
+    cache = _CACHES.get(root)
+    if cache is None:
+        with _CACHES_LOCK:
+            cache = _CACHES.setdefault(root, IndexCache(root))
+    return cache
+
+
+def index_snapshot(data_dir: Path | None = None) -> IndexSnapshot:
+    """현재 인덱스 snapshot (파일 파싱은 바뀐 팩만, 그것도 최대 check_interval 당 1회)."""
+    return _index_cache(data_dir).snapshot()
+
+
+def list_pack_indexes(data_dir: Path | None = None) -> list[PackIndex]:
+    return list(index_snapshot(data_dir).packs)
+
+
+def list_packs(data_dir: Path | None = None) -> list[IndexedLawPack]:
+    """전체 팩을 IndexedLawPack 으로 (임베딩 리스트까지 materialize — 디버그/내보내기용)."""
+    return [p.to_pack() for p in list_pack_indexes(data_dir)]
+
+
 def get_stats(data_dir: Path | None = None) -> tuple[list[IndexStatsEntry], int]:
-    packs = list_packs(data_dir)
+    snap = index_snapshot(data_dir)
+    packs = snap.packs
     entries = [
         IndexStatsEntry(
             law_id=p.law_id,
             law_name=p.law_name,
             effective_date=p.effective_date,
-            chunks=len(p.chunks),
+            chunks=len(p),
             indexed_at=p.indexed_at,
             embedding_model=p.embedding_model,
         )
         for p in packs
     ]
-    total = sum(len(p.chunks) for p in packs)
-    return entries, total
+    return entries, snap.total_chunks
+
+
+def lookup_anchor(anchor: str, data_dir: Path | None = None) -> list[SearchHit]:
+    """
+    legal_anchor 가 가리키는 청크를 색인에서 바로 조회 (임베딩 / 스캔 없음).
+    항·호까지 맞는 청크가 없으면 더 짧은 접두어(조+항 → 조) 로 물러남. score = 1.0.
+    """
+    key = parse_anchor(anchor)
+    if key is None:
+        return []
+    snap = index_snapshot(data_dir)
+    for n in range(len(key), 1, -1):
+        refs = snap.anchors.get(key[:n])
+        if refs:
+            return [snap.hit(ref) for ref in refs]
+    return []
+
+
+def get_chunk(chunk_id: str, data_dir: Path | None = None) -> IndexedChunk | None:
+    snap = index_snapshot(data_dir)
+    ref = snap.by_chunk_id.get(chunk_id)
+    return snap.hit(ref).chunk if ref is not None else None
 
 
 # -------------------- 검색 --------------------
 
 
+def _normalize_query(query: str) -> str:
+    """캐시 키용 — NFKC + 공백 정리. 임베딩도 이 문자열로 요청."""
+    return " ".join(unicodedata.normalize("NFKC", query).split())
+
+
+async def _embed_query(
+    query: str, embed_fn: EmbedFn | None, base: Path
+) -> np.ndarray | None:
+    """
+    query 1건 임베딩. embed_fn 주입 시(테스트 / 다른 모델) 캐시 없이 그대로 호출.
+    기본 임베딩: 메모리 캐시 → 저장소 query 테이블(TTL + 용량 제한, 청크 벡터와 분리) → API 순.
+    """
+    if embed_fn is not None:
+        qvecs = await embed_fn([query])
+        return np.asarray(qvecs[0], dtype=np.float32) if qvecs else None
+
+    text = _normalize_query(query)
+    key = (DEFAULT_EMBEDDING_MODEL, text)
+    cached = _QUERY_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    query_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    store = store_for(base) if QUERY_CACHE_PERSIST else None
+    if store is not None:
+        try:
+            stored = await asyncio.to_thread(
+                store.get_query, DEFAULT_EMBEDDING_MODEL, query_hash
+            )
+        except sqlite3.Error:
+            logger.warning("query_cache_read_failed path=%s", store.path, exc_info=True)
+            stored = None
+        if stored is not None:
+            _QUERY_CACHE.put(key, stored)
+            return stored
+
+    qvecs = await _default_embed([text])
+    if not qvecs:
+        return None
+    qvec = np.asarray(qvecs[0], dtype=np.float32)
+    qvec.setflags(write=False)  # 캐시 공유본
+    _QUERY_CACHE.put(key, qvec)
+    if store is not None:
+        try:
+            await asyncio.to_thread(
+                store.put_query, DEFAULT_EMBEDDING_MODEL, query_hash, qvec
+            )
+        except sqlite3.Error:
+            logger.warning("query_cache_write_failed path=%s", store.path, exc_info=True)
+    return qvec
+
+
 async def search(
     query: str,
     *,
@@ -257,36 +878,173 @@ async def search(
     article_no_filter: str | None = None,
     embed_fn: EmbedFn | None = None,
     data_dir: Path | None = None,
+    nprobe: int | None = None,
+    exact: bool = False,
+    mode: SearchMode = "vector",
 ) -> tuple[list[SearchHit], int]:
     """
     자연어 query → top-K 매칭 청크 + 전체 인덱스 청크 수.
 
     필터 적용 후 후보가 0 개면 임베딩 호출 자체를 skip — 비용 + 안정성.
+    mode:
+      - "vector"  : 임베딩 cosine. 청크 수가 ANN_CONFIG.min_rows 이상이면 ANN(IVF),
+                    nprobe 로 recall/latency 조절, exact=True 면 항상 정확 검색.
+      - "lexical" : n-gram BM25 만 (임베딩 호출 없음). score = BM25.
+      - "hybrid"  : BM25 shortlist 만 cosine 으로 재정렬, score = 융합 점수.
+                    lexical 매칭이 하나도 없으면 "vector" 와 동일.
     """
-    packs = list_packs(data_dir)
-    total = sum(len(p.chunks) for p in packs)
+    snap = index_snapshot(data_dir)
+    total = snap.total_chunks
+    base = data_dir or DEFAULT_DATA_DIR
 
-    # 1) 필터링 먼저 (임베딩 비용 회피)
-    chunks_to_score: list[IndexedChunk] = []
-    for pack in packs:
-        if law_id_filter and pack.law_id != law_id_filter:
-            continue
-        for ch in pack.chunks:
-            if article_no_filter and ch.article_no != article_no_filter:
+    # 1) 필터링 먼저 (임베딩 비용 회피) — 미리 만든 mask 조합
+    masks = {
+        b.dim: b.candidates(law_id_filter, article_no_filter) for b in snap.blocks
+    }
+    n_candidates = sum(
+        len(b.pack_ids) if masks[b.dim] is None else int(masks[b.dim].sum())
+        for b in snap.blocks
+    )
+    if n_candidates == 0:
+        return [], total
+
+    # 2) lexical — 블록별 BM25 (hybrid 는 shortlist 로 사용)
+    shortlists: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+    if mode != "vector":
+        limit = (
+            top_k
+            if mode == "lexical"
+            else max(top_k * HYBRID_SHORTLIST_FACTOR, HYBRID_SHORTLIST_MIN)
+        )
+        for b in snap.blocks:
+            if b.lexical is None:
                 continue
-            chunks_to_score.append(ch)
+            rows, scores = b.lexical.search(query, limit, masks[b.dim])
+            if len(rows):
+                shortlists[b.dim] = (rows, scores)
+        if mode == "lexical":
+            return _lexical_hits(snap, shortlists, top_k), total
 
-    if not chunks_to_score:
+    # 3) 후보가 있을 때만 query 임베딩 (기본 임베딩은 캐시 경유)
+    qvec = await _embed_query(query, embed_fn, base)
+    if qvec is None:
         return [], total
 
-    # 2) 후보가 있을 때만 query 임베딩
-    embed = embed_fn or _default_embed
-    qvecs = await embed([query])
-    if not qvecs:
+    # 4) 행렬-벡터 곱 (또는 ANN / lexical 후보만) + top-K (차원이 다른 블록은 비교 불가 → 제외)
+    block = next((b for b in snap.blocks if b.dim == qvec.shape[0]), None)
+    if block is None:
         return [], total
-    qvec = qvecs[0]
+    qnorm = float(np.linalg.norm(qvec))
+    if qnorm > 0:
+        qvec = qvec / qnorm
+    mask = masks[block.dim]
+    n_rows = len(block.pack_ids) if mask is None else int(mask.sum())
+
+    ann = None
+    if mode == "vector" or block.dim not in shortlists:
+        if not exact and n_rows > ANN_CONFIG.exact_below:
+            ann = block.ann.get(ANN_CONFIG)
+            if ann is None and len(block.pack_ids) >= ANN_CONFIG.min_rows:
+                ann = await asyncio.to_thread(_load_ann_index, block, base)
+
+    if block.dim in shortlists:
+        rows, bm25 = shortlists[block.dim]
+        fused = HYBRID_VECTOR_WEIGHT * (block.matrix[rows] @ qvec) + (
+            1 - HYBRID_VECTOR_WEIGHT
+        ) * (bm25 / bm25.max())
+        picked = rag_ann.top_k_rows(fused, rows, top_k)
+        rows, scores = rows[picked], fused[picked]
+    elif ann is not None:
+        rows, scores = ann.search(
+            block.matrix, qvec, top_k, mask, nprobe or ANN_CONFIG.nprobe
+        )
+    else:
+        if mask is None:
+            rows = np.arange(len(block.pack_ids))
+            all_scores = block.matrix @ qvec
+        else:
+            rows = np.flatnonzero(mask)
+            all_scores = block.matrix[rows] @ qvec
+        picked = rag_ann.top_k_rows(all_scores, rows, top_k)
+        rows, scores = rows[picked], all_scores[picked]
+
+    return _block_hits(snap, block, rows, scores), total
+
+
+def _block_hits(
+    snap: IndexSnapshot, block: SearchBlock, rows: np.ndarray, scores: np.ndarray
+) -> list[SearchHit]:
+    return [
+        SearchHit(
+            chunk=snap.packs[block.pack_ids[r]].chunk(int(block.chunk_ids[r])),
+            score=float(score),
+        )
+        for r, score in zip(rows, scores)
+    ]
+
+
+def _lexical_hits(
+    snap: IndexSnapshot,
+    shortlists: dict[int, tuple[np.ndarray, np.ndarray]],
+    top_k: int,
+) -> list[SearchHit]:
+    """블록별 BM25 결과 병합 — 점수 내림차순, 동점은 (블록 순서, 행 번호)."""
+    merged = [
+        (-float(score), bi, int(r))
+        for bi, b in enumerate(snap.blocks)
+        if b.dim in shortlists
+        for r, score in zip(*shortlists[b.dim])
+    ]
+    merged.sort()
+    return [
+        SearchHit(
+            chunk=snap.packs[snap.blocks[bi].pack_ids[r]].chunk(
+                int(snap.blocks[bi].chunk_ids[r])
+            ),
+            score=-neg,
+        )
+        for neg, bi, r in merged[:top_k]
+    ]
 
-    scored = [(cosine(qvec, ch.embedding), ch) for ch in chunks_to_score]
-    scored.sort(key=lambda x: x[0], reverse=True)
-    hits = [SearchHit(chunk=ch, score=s) for s, ch in scored[: max(0, top_k)]]
-    return hits, total
+
+_ANN_LOCK = threading.Lock()
+
+
+def _ann_key(block: SearchBlock) -> str:
+    return rag_ann.fingerprint(list(block.identity), ANN_CONFIG)
+
+
+def _load_ann_index(block: SearchBlock, base: Path) -> AnnIndex | None:
+    """검색 경로: block 의 ANN 인덱스 (메모리 → 디스크). 없으면 None — 빌드하지 않음."""
+    with _ANN_LOCK:
+        ann = block.ann.get(ANN_CONFIG)
+        if ann is None:
+            ann = rag_ann.load(block.dim, _ann_key(block), rag_ann.ann_dir(base), ANN_CONFIG)
+            if ann is not None:
+                block.ann[ANN_CONFIG] = ann
+        return ann
+
+
+def build_ann_indexes(data_dir: Path | None = None) -> int:
+    """
+    현재 인덱스의 블록 중 ANN_CONFIG.min_rows 이상인 것의 ANN 인덱스를 빌드·저장
+    (같은 팩 구성이면 디스크 것 재사용). 이 프로세스의 snapshot 에도 부착.
+    준비된 인덱스 수 반환. CPU 작업 — async 호출자는 asyncio.to_thread 로.
+    """
+    base = data_dir or DEFAULT_DATA_DIR
+    snap = index_snapshot(base)
+    built = 0
+    for block in snap.blocks:
+        if len(block.pack_ids) < ANN_CONFIG.min_rows:
+            continue
+        with _ANN_LOCK:
+            if block.ann.get(ANN_CONFIG) is None:
+                block.ann[ANN_CONFIG] = rag_ann.load_or_build(
+                    block.matrix,
+                    block.dim,
+                    _ann_key(block),
+                    rag_ann.ann_dir(base),
+                    ANN_CONFIG,
+                )
+        built += 1
+    return built
@@ -0,0 +1,277 @@
+"""
+RAG 근사 최근접 이웃(ANN) 백엔드 — 로컬 IVF (inverted file) 구현.
+
+== 목적 ==
+법률 + 시행령 + 시행규칙 전체를 인덱싱하면 청크가 수십만 단위.
+rag.search 의 정확 검색(행렬 @ query 전체) 대신, 가까운 클러스터 몇 개만 훑음.
+
+== 구조 ==
+- build: 정규화 행렬 → spherical k-means (nlist 개 centroid, 표본으로 학습)
+  → 행을 가장 가까운 centroid 리스트에 배정 (order + offsets, CSR 형태).
+- search: centroid 점수 상위 nprobe 개 리스트의 행만 정확 cosine → top-K.
+  · nprobe ↑ = recall ↑ / latency ↑  (nprobe ≥ nlist 면 정확 검색과 동일)
+- 저장: data/rag_ann/ivf-{dim}-{fingerprint}.npz
+  (fingerprint = 팩 구성 + 설정 해시 → 재인덱싱하면 자동으로 새 파일, 옛 파일 정리)
+- 빌드(k-means) 는 인덱싱 시점에만 (load_or_build ← rag.build_ann_indexes ← index_law).
+  검색 경로는 load 만 — 파일이 없으면 정확 검색.
+
+== 원칙 ==
+- rows < AnnConfig.min_rows 면 ANN 안 씀 (정확 검색이 더 빠르고 정확).
+- 필터 후 후보가 적으면(≤ exact_below) 정확 검색으로 fallback.
+- 동점 순서는 rag 의 정확 검색과 같은 행 번호 오름차순.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+import numpy as np
+
+from app.services.atomic_io import atomic_write_bytes
+
+
+logger = logging.getLogger(__name__)
+
+ANN_SUBDIR = ("rag_ann",)
+
+
+@dataclass(frozen=True, slots=True)
+class AnnConfig:
+    """ANN 사용 조건 + recall/latency 손잡이."""
+
+    backend: str = "ivf"
+    min_rows: int = 20_000  # 이보다 작으면 정확 검색
+    nlist: int | None = None  # None → 4·√rows
+    nprobe: int = 8
+    exact_below: int = 2_048  # 필터 후 후보가 이 이하면 정확 검색
+    kmeans_iters: int = 8
+    train_sample: int = 50_000
+    seed: int = 0
+
+
+class AnnIndex(Protocol):
+    def search(
+        self,
+        matrix: np.ndarray,
+        query: np.ndarray,
+        k: int,
+        mask: np.ndarray | None,
+        nprobe: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(행 번호, 점수) — 점수 내림차순, 동점은 행 번호 오름차순."""
+        ...
+
+
+# ---------------- top-K ----------------
+
+
+def top_k_rows(scores: np.ndarray, rows: np.ndarray, k: int) -> np.ndarray:
+    """
+    점수 내림차순 top-k 의 행 번호. 동점은 행 번호 오름차순.
+    argpartition 계열로 k 개만 추린 뒤 그 안에서만 정렬.
+    """
+    n = len(rows)
+    k = min(max(0, k), n)
+    if k == 0:
+        return rows[:0]
+    if k < n:
+        kth = np.partition(scores, n - k)[n - k]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[: k - len(above)]
+        sel = np.concatenate([above, ties])
+    else:
+        sel = np.arange(n)
+    order = np.lexsort((rows[sel], -scores[sel]))
+    return sel[order]
+
+
+# ---------------- IVF ----------------
+
+
+_ASSIGN_CHUNK = 8_192
+
+
+def _assign(matrix: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """각 행의 가장 가까운(내적 최대) centroid. 메모리 제한 위해 청크 단위."""
+    out = np.empty(len(matrix), dtype=np.int32)
+    for start in range(0, len(matrix), _ASSIGN_CHUNK):
+        block = matrix[start : start + _ASSIGN_CHUNK]
+        out[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return out
+
+
+def _normalize(x: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    return np.divide(x, norms, out=np.zeros_like(x), where=norms > 0)
+
+
+def _spherical_kmeans(
+    sample: np.ndarray, nlist: int, iters: int, rng: np.random.Generator
+) -> np.ndarray:
+    centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+    for _ in range(iters):
+        assign = _assign(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        counts = np.bincount(assign, minlength=nlist)
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            # 빈 클러스터는 임의 표본으로 재시드
+            sums[empty] = sample[rng.choice(len(sample), size=len(empty))]
+        centroids = _normalize(sums).astype(np.float32)
+    return centroids
+
+
+@dataclass(frozen=True, slots=True)
+class IVFIndex:
+    centroids: np.ndarray  # (nlist, dim) float32, 정규화
+    order: np.ndarray  # 리스트 순서로 정렬된 행 번호 (리스트 내부는 오름차순)
+    offsets: np.ndarray  # (nlist + 1,) — 리스트 c 의 행 = order[offsets[c]:offsets[c+1]]
+
+    @property
+    def nlist(self) -> int:
+        return len(self.centroids)
+
+    @classmethod
+    def build(cls, matrix: np.ndarray, config: AnnConfig) -> IVFIndex:
+        rows = len(matrix)
+        nlist = config.nlist or max(1, int(4 * math.sqrt(rows)))
+        nlist = min(nlist, rows)
+        rng = np.random.default_rng(config.seed)
+        if rows > config.train_sample:
+            sample = matrix[np.sort(rng.choice(rows, config.train_sample, replace=False))]
+        else:
+            sample = matrix
+        centroids = _spherical_kmeans(
+            np.asarray(sample, dtype=np.float32), nlist, config.kmeans_iters, rng
+        )
+        assign = _assign(matrix, centroids)
+        order = np.argsort(assign, kind="stable").astype(np.int64)
+        offsets = np.zeros(nlist + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assign, minlength=nlist), out=offsets[1:])
+        return cls(centroids=centroids, order=order, offsets=offsets)
+
+    def probe_rows(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        nprobe = min(max(1, nprobe), self.nlist)
+        cscores = self.centroids @ query
+        if nprobe < self.nlist:
+            probes = np.argpartition(-cscores, nprobe - 1)[:nprobe]
+        else:
+            probes = np.arange(self.nlist)
+        parts = [self.order[self.offsets[c] : self.offsets[c + 1]] for c in probes]
+        return np.sort(np.concatenate(parts)) if parts else self.order[:0]
+
+    def search(
+        self,
+        matrix: np.ndarray,
+        query: np.ndarray,
+        k: int,
+        mask: np.ndarray | None,
+        nprobe: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        rows = self.probe_rows(query, nprobe)
+        if mask is not None:
+            rows = rows[mask[rows]]
+        scores = matrix[rows] @ query
+        picked = top_k_rows(scores, rows, k)
+        return rows[picked], scores[picked]
+
+    # ---- 저장 ----
+
+    def to_bytes(self) -> bytes:
+        buf = io.BytesIO()
+        np.savez(buf, centroids=self.centroids, order=self.order, offsets=self.offsets)
+        return buf.getvalue()
+
+    @classmethod
+    def load(cls, path: Path) -> IVFIndex:
+        with np.load(path) as data:
+            return cls(
+                centroids=data["centroids"],
+                order=data["order"],
+                offsets=data["offsets"],
+            )
+
+
+_BACKENDS: dict[str, type[IVFIndex]] = {"ivf": IVFIndex}
+
+
+# ---------------- 디스크 캐시 ----------------
+
+
+def ann_dir(data_dir: Path) -> Path:
+    return data_dir.joinpath(*ANN_SUBDIR)
+
+
+def fingerprint(parts: list[str], config: AnnConfig) -> str:
+    """팩 구성(법령/시행일/인덱싱 시각/행 수) + 빌드 설정 → 파일 키."""
+    h = hashlib.sha256()
+    for p in parts:
+        h.update(p.encode("utf-8"))
+        h.update(b"\0")
+    h.update(
+        f"{config.backend}:{config.nlist}:{config.kmeans_iters}:"
+        f"{config.train_sample}:{config.seed}".encode()
+    )
+    return h.hexdigest()[:16]
+
+
+def _backend(config: AnnConfig) -> type[IVFIndex]:
+    backend = _BACKENDS.get(config.backend)
+    if backend is None:
+        raise ValueError(f"알 수 없는 ANN backend: {config.backend}")
+    return backend
+
+
+def _index_path(dim: int, key: str, directory: Path, config: AnnConfig) -> Path:
+    return directory / f"{config.backend}-{dim}-{key}.npz"
+
+
+def load(dim: int, key: str, directory: Path, config: AnnConfig) -> AnnIndex | None:
+    """저장된 인덱스. 없거나 읽기 실패면 None (검색 경로 — 빌드하지 않음)."""
+    backend = _backend(config)
+    path = _index_path(dim, key, directory, config)
+    if not path.exists():
+        return None
+    try:
+        return backend.load(path)
+    except (OSError, ValueError, KeyError):
+        logger.warning("ann_index_load_failed path=%s", path.name)
+        return None
+
+
+def load_or_build(
+    matrix: np.ndarray, dim: int, key: str, directory: Path, config: AnnConfig
+) -> AnnIndex:
+    """
+    인덱싱 경로: directory 에 같은 key 의 인덱스가 있으면 로드, 없으면 빌드 후 저장 +
+    같은 (backend, dim) 의 옛 파일 정리.
+    """
+    loaded = load(dim, key, directory, config)
+    if loaded is not None:
+        return loaded
+
+    index = _backend(config).build(matrix, config)
+    path = _index_path(dim, key, directory, config)
+    try:
+        atomic_write_bytes(path, index.to_bytes())
+        for old in directory.glob(f"{config.backend}-{dim}-*.npz"):
+            if old != path:
+                old.unlink(missing_ok=True)
+        logger.info(
+            "ann_index_built backend=%s rows=%s nlist=%s path=%s",
+            config.backend,
+            len(matrix),
+            index.nlist,
+            path.name,
+        )
+    except OSError:
+        # 디스크 저장 실패해도 메모리 인덱스는 사용
+        logger.exception("ann_index_save_failed path=%s", path.name)
+    return index
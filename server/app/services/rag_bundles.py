@@ -0,0 +1,252 @@
+"""
+룰별 RAG 컨텍스트 번들 — /analyze 의 RAG 조회를 미리 계산해 두는 캐시.
+
+== 목적 ==
+rules/{year}.json 의 룰은 적고 잘 안 바뀜 → 평가된 룰 조합이 같으면 RAG 컨텍스트도 같음.
+/analyze 는 팩의 룰 전부를 평가해 evaluations 로 넘기므로 조회 키는 항상 "전체 룰" 조합.
+인덱싱 시점에 그 조합의 top-K 를 계산해 두고, /analyze 는 파일 캐시 조회만.
+
+== 위치 / 포맷 ==
+server/app/data/rag_bundles/{year}.json  (파생 데이터 — gitignored)
+{
+  "format": "bundles-v1", "year": 2025, "top_k": 8,
+  "index_key": 팩 구성 해시,
+  "bundles": {"rule_a+rule_b+...": {"query": ..., "hits": [{"chunk_id", "score"}]}}
+}
+- 청크 본문은 저장 안 함 → 읽을 때 현재 snapshot 의 chunk_id 색인으로 복원.
+
+== 무효화 ==
+- rag.index_law → 해당 data_dir 번들 전부 삭제 (/rag/index 가 직후 다시 빌드).
+- rule_drafts_store.approve_draft → 해당 연도 번들 삭제.
+- 다른 워커가 바꾼 경우도 읽을 때 검증: index_key(팩 구성) · query(룰 제목/anchor) ·
+  top_k 가 다르거나 chunk_id 가 사라졌으면 miss → 호출자가 실시간 계산.
+- 빌드 중 검색이 실패하면 (임베딩 API 오류 등) 저장하지 않음 — 빈/축소 컨텍스트가
+  번들로 굳지 않고 다음 /analyze 는 실시간 계산.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Protocol, Sequence
+
+from app.schemas.rag_schema import SearchHit
+from app.services import rag
+from app.services.atomic_io import atomic_write_json
+from app.services.rules_engine import load_rules
+
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT = "bundles-v1"
+BUNDLES_SUBDIR = ("rag_bundles",)
+# anchor 직접 조회 결과가 있으면 의미 검색은 보충 컨텍스트로 이만큼만
+EXTRA_TOP_K = 3
+
+
+class CitedRule(Protocol):
+    """Rule / RuleEvaluation 공통 — RAG query 재료."""
+
+    rule_id: str
+    title: str
+    legal_anchor: str
+
+
+# ---------------- 실시간 계산 ----------------
+
+
+def build_query(rules: Sequence[CitedRule]) -> str | None:
+    """룰들의 제목·anchor 를 합쳐 RAG 검색 query 로 사용."""
+    parts: list[str] = []
+    for r in rules:
+        parts.append(r.title)
+        if r.legal_anchor:
+            parts.append(r.legal_anchor)
+    query = " ".join(parts).strip()
+    return query or None
+
+
+def anchor_hits(
+    rules: Sequence[CitedRule], limit: int, data_dir: Path | None = None
+) -> list[SearchHit]:
+    """룰이 인용한 조문(legal_anchor) 청크 — 색인 직접 조회, 중복 제거."""
+    seen: set[str] = set()
+    hits: list[SearchHit] = []
+    for r in rules:
+        if not r.legal_anchor:
+            continue
+        for hit in rag.lookup_anchor(r.legal_anchor, data_dir):
+            if hit.chunk.chunk_id not in seen:
+                seen.add(hit.chunk.chunk_id)
+                hits.append(hit)
+    return hits[:limit]
+
+
+async def fetch_context(
+    rules: Sequence[CitedRule],
+    top_k: int,
+    *,
+    data_dir: Path | None = None,
+    embed_fn: rag.EmbedFn | None = None,
+    strict: bool = False,
+) -> list[SearchHit]:
+    """
+    1) 인용 조문은 anchor 색인 직접 조회
+    2) 의미 검색은 보충용 — 직접 조회가 있으면 EXTRA_TOP_K 건, 없으면 top_k 건
+    실패는 빈 결과로 흡수 (분석 흐름 유지). strict=True (번들 빌드) 면 그대로 raise.
+    """
+    query = build_query(rules)
+    if query is None:
+        return []
+    try:
+        direct = anchor_hits(rules, top_k, data_dir)
+    except Exception:
+        if strict:
+            raise
+        direct = []
+    extra_k = min(EXTRA_TOP_K, top_k - len(direct)) if direct else top_k
+    if extra_k <= 0:
+        return direct
+    try:
+        hits, _ = await rag.search(
+            query, top_k=extra_k, data_dir=data_dir, embed_fn=embed_fn
+        )
+    except Exception:
+        if strict:
+            raise
+        return direct
+    seen = {h.chunk.chunk_id for h in direct}
+    return direct + [h for h in hits if h.chunk.chunk_id not in seen]
+
+
+# ---------------- 디스크 ----------------
+
+
+def _bundles_dir(data_dir: Path) -> Path:
+    return data_dir.joinpath(*BUNDLES_SUBDIR)
+
+
+def _bundle_path(data_dir: Path, year: int) -> Path:
+    return _bundles_dir(data_dir) / f"{int(year)}.json"
+
+
+def _index_key(snap: rag.IndexSnapshot) -> str:
+    h = hashlib.sha256()
+    for p in snap.packs:
+        h.update(
+            f"{p.law_id}|{p.effective_date}|{p.indexed_at.isoformat()}|{len(p)}\0".encode()
+        )
+    return h.hexdigest()[:16]
+
+
+def _bundle_key(rule_ids: Sequence[str]) -> str:
+    return "+".join(rule_ids)
+
+
+def invalidate(data_dir: Path | None = None, year: int | None = None) -> None:
+    """year 의 번들 (None 이면 전부) 삭제."""
+    directory = _bundles_dir(data_dir or rag.DEFAULT_DATA_DIR)
+    if not directory.exists():
+        return
+    if year is None:
+        paths = list(directory.glob("*.json"))
+    else:
+        paths = [directory / f"{int(year)}.json"]
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+_FileSig = tuple[int, int, int]
+_LOADED: dict[Path, tuple[_FileSig, dict[str, Any]]] = {}
+_LOADED_LOCK = threading.Lock()
+
+
+def _load(path: Path) -> dict[str, Any] | None:
+    """번들 파일 (stat 이 같으면 메모리 사본 재사용)."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _LOADED.get(path)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        logger.warning("rag_bundle_load_failed path=%s", path)
+        return None
+    if data.get("format") != BUNDLE_FORMAT:
+        return None
+    with _LOADED_LOCK:
+        _LOADED[path] = (sig, data)
+    return data
+
+
+def get_bundle(
+    rules: Sequence[CitedRule],
+    top_k: int,
+    *,
+    year: int = 2025,
+    data_dir: Path | None = None,
+) -> list[SearchHit] | None:
+    """미리 계산된 컨텍스트. 없거나 낡았으면 None."""
+    base = data_dir or rag.DEFAULT_DATA_DIR
+    data = _load(_bundle_path(base, year))
+    if data is None or data.get("top_k") != top_k:
+        return None
+    entry = data.get("bundles", {}).get(_bundle_key([r.rule_id for r in rules]))
+    if entry is None or entry.get("query") != build_query(rules):
+        return None
+    snap = rag.index_snapshot(data_dir)
+    if data.get("index_key") != _index_key(snap):
+        return None
+    hits: list[SearchHit] = []
+    for item in entry["hits"]:
+        ref = snap.by_chunk_id.get(item["chunk_id"])
+        if ref is None:
+            return None
+        hits.append(snap.hit(ref, item["score"]))
+    return hits
+
+
+# ---------------- 사전 계산 ----------------
+
+
+async def build_bundles(
+    year: int = 2025,
+    *,
+    top_k: int = 8,
+    data_dir: Path | None = None,
+    embed_fn: rag.EmbedFn | None = None,
+) -> int:
+    """
+    year 의 전체 룰 조합 컨텍스트를 계산해 저장. 저장한 번들 수 반환.
+    검색 실패는 raise (기존 번들 파일은 그대로 — 내용 검증에서 miss 처리).
+    """
+    base = data_dir or rag.DEFAULT_DATA_DIR
+    rules = load_rules(year=year).rules
+    snap = rag.index_snapshot(data_dir)
+    bundles: dict[str, Any] = {}
+    if rules:
+        hits = await fetch_context(
+            rules, top_k, data_dir=data_dir, embed_fn=embed_fn, strict=True
+        )
+        bundles[_bundle_key([r.rule_id for r in rules])] = {
+            "query": build_query(rules),
+            "hits": [{"chunk_id": h.chunk.chunk_id, "score": h.score} for h in hits],
+        }
+
+    payload = {
+        "format": BUNDLE_FORMAT,
+        "year": int(year),
+        "top_k": top_k,
+        "index_key": _index_key(snap),
+        "bundles": bundles,
+    }
+    atomic_write_json(_bundle_path(base, year), payload)
+    logger.info("rag_bundles_built year=%s bundles=%s", year, len(bundles))
+    return len(bundles)
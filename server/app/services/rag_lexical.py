@@ -0,0 +1,104 @@
+"""
+RAG lexical 검색 — 한국어 문자 n-gram 역색인 + BM25.
+
+== 목적 ==
+"월세액", "임대차계약" 같은 정확 용어 query 는 임베딩(네트워크 왕복) 없이
+로컬 역색인으로 바로 찾고, hybrid 검색에서는 lexical 상위 후보(shortlist) 만
+벡터 점수로 재정렬.
+
+== 토큰화 ==
+NFKC + 소문자 → \\w+ 단어 → 단어마다 문자 bigram (2글자 이하 단어는 그대로 1개).
+  "월세액의 일정률" → 월세, 세액, 액의, 일정, 정률
+형태소 분석기 없이도 조사·어미 변화에 강하고, 부분 일치("월세액" ⊂ "월세액공제") 가능.
+
+== 구조 ==
+- build: SearchBlock 행 순서 그대로 문서 = 청크 text.
+  용어 → (행 번호, BM25 impact) posting. impact 는 빌드 때 문서 길이까지 반영해 미리 계산
+  → 검색은 query 용어별 scatter-add 뿐.
+- 점수: BM25 (k1=1.2, b=0.75), query 용어는 중복 제거 후 1회씩.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.services.rag_ann import top_k_rows
+
+
+NGRAM = 2
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str, n: int = NGRAM) -> list[str]:
+    """문자 n-gram 토큰 (문서 / query 공용)."""
+    out: list[str] = []
+    for word in _WORD_RE.findall(unicodedata.normalize("NFKC", text).lower()):
+        if len(word) <= n:
+            out.append(word)
+        else:
+            out.extend(word[i : i + n] for i in range(len(word) - n + 1))
+    return out
+
+
+@dataclass(frozen=True, slots=True)
+class LexicalIndex:
+    """행 번호 = SearchBlock 행 번호."""
+
+    n_rows: int
+    postings: dict[str, tuple[np.ndarray, np.ndarray]]  # 용어 → (rows int32, impact float32)
+
+    @classmethod
+    def build(cls, texts: list[str]) -> LexicalIndex:
+        counts = [Counter(tokenize(t)) for t in texts]
+        lengths = np.array([sum(c.values()) for c in counts], dtype=np.float64)
+        avgdl = float(lengths.mean()) if len(lengths) and lengths.sum() > 0 else 1.0
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / avgdl)
+
+        rows_by_term: dict[str, list[int]] = {}
+        tfs_by_term: dict[str, list[int]] = {}
+        for row, c in enumerate(counts):
+            for term, tf in c.items():
+                rows_by_term.setdefault(term, []).append(row)
+                tfs_by_term.setdefault(term, []).append(tf)
+
+        n_docs = len(texts)
+        postings: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for term, rows in rows_by_term.items():
+            r = np.array(rows, dtype=np.int32)
+            tf = np.array(tfs_by_term[term], dtype=np.float64)
+            df = len(rows)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            impact = idf * tf * (BM25_K1 + 1) / (tf + norm[r])
+            postings[term] = (r, impact.astype(np.float32))
+        return cls(n_rows=n_docs, postings=postings)
+
+    def scores(self, query: str) -> np.ndarray:
+        """전체 행 BM25 점수 (매칭 없는 행은 0)."""
+        out = np.zeros(self.n_rows, dtype=np.float32)
+        for term in dict.fromkeys(tokenize(query)):
+            posting = self.postings.get(term)
+            if posting is not None:
+                rows, impact = posting
+                out[rows] += impact
+        return out
+
+    def search(
+        self, query: str, k: int, mask: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(행 번호, 점수) — 점수 > 0 인 행만, 내림차순 (동점은 행 번호 오름차순)."""
+        scores = self.scores(query)
+        hit = scores > 0
+        if mask is not None:
+            hit &= mask
+        rows = np.flatnonzero(hit)
+        picked = top_k_rows(scores[rows], rows, k)
+        return rows[picked], scores[rows[picked]]
@@ -29,7 +29,7 @@ from app.schemas.recommend_schema import (
     RecommendResponse,
 )
 from app.schemas.tax_calculator_schema import CalcInputs, DependentsInput
-from app.services.tax_calculator import calculate
+from app.services.tax_calculator import calculate_totals
 
 
 # -------------------- baseline 변환 --------------------
@@ -214,7 +214,7 @@ def recommend(req: RecommendRequest) -> RecommendResponse:
         extra_tax_credits=req.baseline_extra_tax_credits,
         use_standard_tax_credit=req.use_standard_tax_credit,
     )
-    baseline_result = calculate(baseline_inputs)
+    baseline_result = calculate_totals(baseline_inputs)
 
     recs: list[Recommendation] = []
     for lever, eligibility, apply_fn in LEVERS:
@@ -233,7 +233,7 @@ def recommend(req: RecommendRequest) -> RecommendResponse:
             continue
 
         new_inputs = apply_fn(baseline_inputs, req.request)
-        new_result = calculate(new_inputs)
+        new_result = calculate_totals(new_inputs)
         delta = new_result.refund_or_owed - baseline_result.refund_or_owed
         recs.append(
             Recommendation(
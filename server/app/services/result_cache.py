@@ -0,0 +1,101 @@
+"""
+프로세스 내 bounded LRU + TTL 결과 캐시.
+
+== 목적 ==
+같은 위저드 세션에서 /analyze, /verify, /recommend 가 동일 베이스라인을
+반복 계산함. 순수 함수 결과를 key → value 로 잠깐 들고 있다가 재사용.
+
+== 원칙 ==
+- 용량(maxsize) 초과 시 가장 오래 안 쓴 항목부터 제거 (LRU).
+- TTL 경과 항목은 조회 시점에 miss 로 취급하고 제거.
+- thread-safe — FastAPI sync 엔드포인트는 threadpool 에서 동시 실행됨.
+- 값 복사는 호출자 책임 (캐시는 저장된 객체를 그대로 돌려줌).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class ResultCache(Generic[V]):
+    """bounded LRU + TTL. ttl_seconds=None 이면 만료 없음."""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl_seconds: float | None = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize 는 1 이상이어야 합니다.")
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> V | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < self._clock():
+                del self._data[key]
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        expires_at = (
+            float("inf")
+            if self.ttl_seconds is None
+            else self._clock() + self.ttl_seconds
+        )
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """항목 + 카운터 초기화."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._data),
+                maxsize=self.maxsize,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -27,12 +27,12 @@ from openai import AsyncOpenAI
 from app.schemas.rule_draft_schema import RuleDraft
 from app.schemas.rule_schema import (
     AllOfFlagsEvaluator,
-    FieldRef,
-    RatioOfField,
+    AmountEvaluator,
+    AnyOfFlagsEvaluator,
     Rule,
-    SumOfFields,
     ThresholdEvaluator,
 )
+from app.services.rule_expr import expr_fields
 from app.services.rules_engine import EVAL_CONTEXT_FIELDS
 
 
@@ -68,13 +68,20 @@ SYSTEM_PROMPT = """\
 법령 본문을 읽고 시스템이 정의한 Rule JSON 스키마에 정확히 맞는 JSON 만 출력합니다.
 스키마 외 임의 필드/구조 추가 금지. 설명 텍스트도 절대 출력하지 마세요.
 
-evaluator 종류는 두 가지뿐입니다:
+evaluator 종류는 네 가지뿐입니다:
 1) "threshold": 사용자 값과 기준값을 비교 (gt/gte/lt/lte/eq)
 2) "all_of_flags": 여러 boolean 플래그가 모두 True 인지
+3) "any_of_flags": 여러 boolean 플래그 중 하나라도 True 인지
+4) "amount": 금액 산식 계산 (outputs: value_key, result_key)
+
+값 표현(type)은 field / ratio_of_field / sum_of_fields / constant 와,
+이들을 중첩하는 sum(args) / sub(left, right) / scale(value, ratio) /
+min(args) / max(args) / clip(value, lo, hi) / piecewise(value, brackets) 만 씁니다.
 
 법령에서 다음 형태가 보이면:
 - "총급여의 25% 초과 사용분" → kind=threshold, threshold=ratio_of_field
 - "본인이 세대주이면서 무주택이고…" → kind=all_of_flags
+- "초과분의 15%, 연 300만원 한도" → kind=amount, value=min(scale(sub(…), 0.15), constant)
 
 threshold 와 value 를 구성할 때 반드시 시스템이 제공한 필드만 사용하세요.
 """
@@ -128,7 +135,7 @@ source_api_id: {source_api_id if source_api_id else 'null'}
   "compiled_at": "ISO timestamp",
   "compiled_by": "llm:gpt-4o-mini",
   "evaluator": {{
-    "kind": "threshold | all_of_flags",
+    "kind": "threshold | all_of_flags | any_of_flags | amount",
     ... (kind 에 맞는 필드)
   }}
 }}
@@ -184,18 +191,15 @@ def _parse_rule_json(content: str) -> Rule:
 
 
 def _collect_field_refs(rule: Rule) -> list[str]:
-    """rule.evaluator 안에서 참조된 모든 필드 이름을 수집."""
+    """rule.evaluator 안에서 참조된 모든 필드 이름을 수집 (중첩 표현 포함)."""
     refs: list[str] = []
     ev = rule.evaluator
     if isinstance(ev, ThresholdEvaluator):
         for expr in (ev.threshold, ev.value):
-            if isinstance(expr, FieldRef):
-                refs.append(expr.name)
-            elif isinstance(expr, RatioOfField):
-                refs.append(expr.field)
-            elif isinstance(expr, SumOfFields):
-                refs.extend(expr.fields)
-    elif isinstance(ev, AllOfFlagsEvaluator):
+            refs.extend(sorted(expr_fields(expr)))
+    elif isinstance(ev, AmountEvaluator):
+        refs.extend(sorted(expr_fields(ev.value)))
+    elif isinstance(ev, (AllOfFlagsEvaluator, AnyOfFlagsEvaluator)):
         refs.extend(ev.flags)
     return refs
 
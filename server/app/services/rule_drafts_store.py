@@ -10,6 +10,8 @@ server/app/data/rules/drafts/{year}/{rule_id}.json
 - load_draft(year, rule_id) -> RuleDraft | None
 - delete_draft(year, rule_id)
 - approve_draft(year, rule_id) -> Rule  : draft 의 rule 을 rules/{year}.json 에 병합 (id 일치 시 교체) 후 draft 파일 삭제
+  (rules/{year}.json 은 tmp + os.replace 로 원자 교체 → rules_engine.rule_registry 가 감지,
+   rag_bundles/{year}.json 은 삭제)
 """
 
 from __future__ import annotations
@@ -17,10 +19,10 @@ from __future__ import annotations
 import json
 import re
 from pathlib import Path
-from typing import Any
 
 from app.schemas.rule_draft_schema import RuleDraft
 from app.schemas.rule_schema import Rule, RulePack
+from app.services.atomic_io import atomic_write_json
 
 
 DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
@@ -156,11 +158,6 @@ def approve_draft(
             f"드래프트 없음: year={year}, rule_id={rule_id}"
         )
 
-    # 인메모리 캐시(load_rules @lru_cache) 무효화
-    from app.services.rules_engine import load_rules
-
-    load_rules.cache_clear()
-
     rule = draft.rule.model_copy(update={"human_reviewed": True})
 
     # 기존 팩 로드 (없으면 새로 생성)
@@ -181,11 +178,20 @@ def approve_draft(
     if not replaced:
         pack.rules.append(rule)
 
-    pub_path.parent.mkdir(parents=True, exist_ok=True)
-    pub_path.write_text(
-        json.dumps(pack.model_dump(mode="json"), ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    # 원본 데이터 — 교체 전 fsync
+    atomic_write_json(pub_path, pack.model_dump(mode="json"), fsync=True)
+
+    # 같은 프로세스는 즉시 새 팩으로 교체 (팩 + 의존성 인덱스 한 snapshot).
+    # 다른 워커는 레지스트리의 stat 비교로 check_interval 안에 수렴.
+    from app.services.rules_engine import rule_registry
+
+    if rule_registry.path_for(year).resolve() == pub_path.resolve():
+        rule_registry.refresh(year)
+
+    # 룰 구성이 바뀌었으니 미리 계산한 RAG 컨텍스트 번들도 폐기
+    from app.services import rag_bundles
+
+    rag_bundles.invalidate(base, year)
 
     # 드래프트 삭제 (review_notes 가 있으면 마지막 상태를 별도 보관해도 좋지만,
     # 1차 구현은 단순 삭제. 검수 이력은 git history 로.)
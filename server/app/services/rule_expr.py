@@ -0,0 +1,306 @@
+"""
+룰 값 표현(ValueExpr) 컴파일러 — scalar / NumPy 컬럼 겸용.
+
+== 목적 ==
+한도(min/clip)·구간 누진(piecewise)·중첩 합처럼 지금까지 Python 에 하드코딩하던
+산식을 룰 JSON 으로 표현하고, 같은 JSON 으로 요청 1건(rules_engine) 과
+회사 단위 일괄(rules_batch) 평가를 모두 구동.
+
+== 흐름 ==
+ValueExpr (Pydantic 트리) → compile_expr → CompiledExpr
+  · scalar(ctx)            : 평가 컨텍스트(Mapping) → int
+  · vector(numbers, size)  : 필드 → float64 컬럼 → int64 컬럼
+  · fields / formula       : 참조 필드 집합, 사람이 읽는 산식 문자열
+
+== 원칙 ==
+- eval() 없음. 노드 종류별 클로저를 트리 모양대로 1회 조립 (팩 로드 시점).
+- scalar 와 vector 는 값이 동일해야 함.
+  · 숫자 아닌 필드 값 → 0, 정수 변환은 int() 와 같은 0 방향 절사 (np.trunc)
+  · piecewise 의 구간 내 반올림은 세율표와 같은 int(round()) (banker's, np.rint)
+  · 연산 순서를 맞춰 float 중간값도 같은 IEEE 결과가 나오게 함
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import reduce
+from typing import Any, Callable, Mapping
+
+import numpy as np
+
+from app.schemas.rule_schema import (
+    Clip,
+    Constant,
+    FieldRef,
+    MaxOf,
+    MinOf,
+    Piecewise,
+    RatioOfField,
+    Scale,
+    Sub,
+    SumOf,
+    SumOfFields,
+    ValueExpr,
+)
+
+
+ScalarFn = Callable[[Mapping[str, Any]], int]
+VectorFn = Callable[[Mapping[str, np.ndarray], int], np.ndarray]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledExpr:
+    """ValueExpr 1개의 컴파일 결과."""
+
+    fields: frozenset[str]
+    formula: str
+    scalar: ScalarFn
+    vector: VectorFn
+
+
+# ---------------- 리프 ----------------
+
+
+def _number(v: Any) -> int:
+    return int(v) if isinstance(v, (int, float)) else 0
+
+
+def _int_column(x: np.ndarray) -> np.ndarray:
+    """int() 와 같은 0 방향 절사."""
+    return np.trunc(x).astype(np.int64)
+
+
+def _compile_field(expr: FieldRef) -> CompiledExpr:
+    name = expr.name
+    return CompiledExpr(
+        fields=frozenset({name}),
+        formula=name,
+        scalar=lambda ctx: _number(ctx.get(name, 0)),
+        vector=lambda cols, n: _int_column(cols[name]),
+    )
+
+
+def _compile_ratio(expr: RatioOfField) -> CompiledExpr:
+    base_field, ratio = expr.field, expr.ratio
+
+    def _scalar(ctx: Mapping[str, Any]) -> int:
+        base = ctx.get(base_field, 0)
+        if not isinstance(base, (int, float)) or base <= 0:
+            return 0
+        return int(base * ratio)
+
+    def _vector(cols: Mapping[str, np.ndarray], n: int) -> np.ndarray:
+        base = cols[base_field]
+        return np.where(base > 0, _int_column(base * ratio), 0)
+
+    return CompiledExpr(
+        fields=frozenset({base_field}),
+        formula=f"{base_field} × {ratio}",
+        scalar=_scalar,
+        vector=_vector,
+    )
+
+
+def _compile_sum_of_fields(expr: SumOfFields) -> CompiledExpr:
+    names = tuple(expr.fields)
+
+    def _scalar(ctx: Mapping[str, Any]) -> int:
+        total = 0
+        for fld in names:
+            v = ctx.get(fld, 0)
+            if isinstance(v, (int, float)):
+                total += int(v)
+        return total
+
+    def _vector(cols: Mapping[str, np.ndarray], n: int) -> np.ndarray:
+        total = np.zeros(n, dtype=np.int64)
+        for fld in names:
+            total += _int_column(cols[fld])
+        return total
+
+    return CompiledExpr(
+        fields=frozenset(names),
+        formula=" + ".join(names),
+        scalar=_scalar,
+        vector=_vector,
+    )
+
+
+def _compile_constant(expr: Constant) -> CompiledExpr:
+    value = int(expr.value)
+    return CompiledExpr(
+        fields=frozenset(),
+        formula=str(value),
+        scalar=lambda ctx: value,
+        vector=lambda cols, n: np.full(n, value, dtype=np.int64),
+    )
+
+
+# ---------------- 조합 ----------------
+
+
+def _union_fields(parts: list[CompiledExpr]) -> frozenset[str]:
+    return frozenset().union(*(p.fields for p in parts))
+
+
+def _compile_sum(expr: SumOf) -> CompiledExpr:
+    parts = [compile_expr(a) for a in expr.args]
+    scalars = tuple(p.scalar for p in parts)
+    vectors = tuple(p.vector for p in parts)
+
+    def _scalar(ctx: Mapping[str, Any]) -> int:
+        return sum(f(ctx) for f in scalars)
+
+    def _vector(cols: Mapping[str, np.ndarray], n: int) -> np.ndarray:
+        total = np.zeros(n, dtype=np.int64)
+        for f in vectors:
+            total += f(cols, n)
+        return total
+
+    return CompiledExpr(
+        fields=_union_fields(parts),
+        formula="(" + " + ".join(p.formula for p in parts) + ")",
+        scalar=_scalar,
+        vector=_vector,
+    )
+
+
+def _compile_sub(expr: Sub) -> CompiledExpr:
+    left, right = compile_expr(expr.left), compile_expr(expr.right)
+    ls, rs = left.scalar, right.scalar
+    lv, rv = left.vector, right.vector
+    return CompiledExpr(
+        fields=left.fields | right.fields,
+        formula=f"({left.formula} − {right.formula})",
+        scalar=lambda ctx: ls(ctx) - rs(ctx),
+        vector=lambda cols, n: lv(cols, n) - rv(cols, n),
+    )
+
+
+def _compile_scale(expr: Scale) -> CompiledExpr:
+    inner = compile_expr(expr.value)
+    fs, fv, ratio = inner.scalar, inner.vector, expr.ratio
+    return CompiledExpr(
+        fields=inner.fields,
+        formula=f"{inner.formula} × {ratio}",
+        scalar=lambda ctx: int(fs(ctx) * ratio),
+        vector=lambda cols, n: _int_column(fv(cols, n) * ratio),
+    )
+
+
+def _compile_extremum(expr: MinOf | MaxOf) -> CompiledExpr:
+    parts = [compile_expr(a) for a in expr.args]
+    scalars = tuple(p.scalar for p in parts)
+    vectors = tuple(p.vector for p in parts)
+    pick, vpick = (min, np.minimum) if isinstance(expr, MinOf) else (max, np.maximum)
+
+    def _scalar(ctx: Mapping[str, Any]) -> int:
+        return pick(f(ctx) for f in scalars)
+
+    def _vector(cols: Mapping[str, np.ndarray], n: int) -> np.ndarray:
+        return reduce(vpick, (f(cols, n) for f in vectors))
+
+    return CompiledExpr(
+        fields=_union_fields(parts),
+        formula=f"{expr.type}(" + ", ".join(p.formula for p in parts) + ")",
+        scalar=_scalar,
+        vector=_vector,
+    )
+
+
+def _compile_clip(expr: Clip) -> CompiledExpr:
+    inner = compile_expr(expr.value)
+    lo = compile_expr(expr.lo) if expr.lo is not None else None
+    hi = compile_expr(expr.hi) if expr.hi is not None else None
+
+    def _scalar(ctx: Mapping[str, Any]) -> int:
+        x = inner.scalar(ctx)
+        if lo is not None:
+            x = max(x, lo.scalar(ctx))
+        if hi is not None:
+            x = min(x, hi.scalar(ctx))
+        return x
+
+    def _vector(cols: Mapping[str, np.ndarray], n: int) -> np.ndarray:
+        x = inner.vector(cols, n)
+        if lo is not None:
+            x = np.maximum(x, lo.vector(cols, n))
+        if hi is not None:
+            x = np.minimum(x, hi.vector(cols, n))
+        return x
+
+    bounds = [p for p in (lo, hi) if p is not None]
+    return CompiledExpr(
+        fields=inner.fields.union(*(b.fields for b in bounds)),
+        formula=(
+            f"clip({inner.formula}, "
+            f"{lo.formula if lo else '-∞'}, {hi.formula if hi else '∞'})"
+        ),
+        scalar=_scalar,
+        vector=_vector,
+    )
+
+
+def _compile_piecewise(expr: Piecewise) -> CompiledExpr:
+    inner = compile_expr(expr.value)
+    uppers = tuple(
+        float("inf") if b.upto is None else float(b.upto) for b in expr.brackets
+    )
+    bases = tuple(b.base for b in expr.brackets)
+    fixeds = tuple(b.fixed for b in expr.brackets)
+    rates = tuple(b.rate for b in expr.brackets)
+    uppers_arr = np.array(uppers, dtype=np.float64)
+    bases_arr = np.array(bases, dtype=np.int64)
+    fixeds_arr = np.array(fixeds, dtype=np.int64)
+    rates_arr = np.array(rates, dtype=np.float64)
+
+    def _scalar(ctx: Mapping[str, Any]) -> int:
+        x = inner.scalar(ctx)
+        i = bisect_left(uppers, x)
+        return fixeds[i] + int(round((x - bases[i]) * rates[i]))
+
+    def _vector(cols: Mapping[str, np.ndarray], n: int) -> np.ndarray:
+        x = inner.vector(cols, n)
+        i = np.searchsorted(uppers_arr, x, side="left")
+        return fixeds_arr[i] + np.rint((x - bases_arr[i]) * rates_arr[i]).astype(
+            np.int64
+        )
+
+    return CompiledExpr(
+        fields=inner.fields,
+        formula=f"piecewise({inner.formula}; {len(expr.brackets)}구간)",
+        scalar=_scalar,
+        vector=_vector,
+    )
+
+
+_COMPILERS: dict[type, Callable[[Any], CompiledExpr]] = {
+    FieldRef: _compile_field,
+    RatioOfField: _compile_ratio,
+    SumOfFields: _compile_sum_of_fields,
+    Constant: _compile_constant,
+    SumOf: _compile_sum,
+    Sub: _compile_sub,
+    Scale: _compile_scale,
+    MinOf: _compile_extremum,
+    MaxOf: _compile_extremum,
+    Clip: _compile_clip,
+    Piecewise: _compile_piecewise,
+}
+
+
+# ---------------- 공개 API ----------------
+
+
+def compile_expr(expr: ValueExpr) -> CompiledExpr:
+    """ValueExpr 트리 → CompiledExpr. 알 수 없는 노드면 ValueError."""
+    compiler = _COMPILERS.get(type(expr))
+    if compiler is None:
+        raise ValueError(f"Unknown value expression: {type(expr).__name__}")
+    return compiler(expr)
+
+
+def expr_fields(expr: ValueExpr) -> frozenset[str]:
+    """표현이 숫자로 읽는 평가 컨텍스트 필드 (중첩 포함)."""
+    return compile_expr(expr).fields
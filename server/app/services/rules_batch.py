@@ -0,0 +1,314 @@
+"""
+회사 단위 일괄(batch) 룰 평가.
+
+== 목적 ==
+HR 이 전 직원 급여대장을 한 번에 올리면 `build_rule_context` 를 인원수만큼
+돌리게 됨. 본 모듈은 룰 1건을 직원 전체 컬럼에 대해 한 번에 평가
+(threshold 비교 / 플래그 conjunction 을 NumPy 벡터 연산으로).
+
+== 흐름 ==
+list[eval ctx dict] (또는 컬럼 dict) → BatchEvalContext (룰이 참조하는 필드만 컬럼화)
+  → 룰별 벡터 평가 → BatchRuleResult (컬럼) → 필요할 때만 사람별 RuleEvaluation
+값 표현(min/max/clip/piecewise …) 은 load 시점에 컴파일된 CompiledRule.exprs 의
+vector 경로를 그대로 사용 (services/rule_expr).
+
+== 원칙 ==
+- rules_engine 의 scalar 평가(_resolve_value / compiled rule) 와 값이 동일해야 함.
+  · 숫자 아닌 값 → 0, 정수 변환은 int() 와 같은 trunc (rule_expr 공통)
+  · threshold 0 → 판단불가(None)
+- RuleEvaluation 모델은 evaluation()/evaluations() 호출 시에만 생성 (lazy).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Sequence
+
+import numpy as np
+
+from app.schemas.rule_schema import (
+    AllOfFlagsEvaluator,
+    AmountEvaluator,
+    AnyOfFlagsEvaluator,
+    Rule,
+    RuleEvaluation,
+    RulePack,
+    ThresholdEvaluator,
+)
+from app.services.rule_expr import expr_fields
+from app.services.rules_engine import CompiledRule, compiled_rules
+
+
+# -------------------- 입력 컬럼 --------------------
+
+
+def _rule_fields(rule: Rule) -> tuple[set[str], set[str]]:
+    """(숫자로 읽는 필드, 플래그로 읽는 필드)."""
+    ev = rule.evaluator
+    if isinstance(ev, ThresholdEvaluator):
+        return set(expr_fields(ev.threshold) | expr_fields(ev.value)), set()
+    if isinstance(ev, AmountEvaluator):
+        return set(expr_fields(ev.value)), set()
+    if isinstance(ev, (AllOfFlagsEvaluator, AnyOfFlagsEvaluator)):
+        return set(), set(ev.flags)
+    raise ValueError(f"Unknown evaluator kind: {type(ev).__name__}")
+
+
+def _is_number(v: Any) -> bool:
+    return isinstance(v, (int, float))
+
+
+@dataclass
+class BatchEvalContext:
+    """
+    eval ctx 의 컬럼 버전.
+    numbers[f]: 숫자 값 (숫자가 아니거나 없으면 0.0), flags[f]: truthiness.
+    """
+
+    size: int
+    numbers: dict[str, np.ndarray]
+    flags: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return self.size
+
+    @classmethod
+    def from_contexts(
+        cls, contexts: Sequence[Mapping[str, Any]], pack: RulePack
+    ) -> BatchEvalContext:
+        """build_eval_context 결과 리스트 → 룰이 참조하는 필드만 컬럼화."""
+        number_fields, flag_fields = _pack_fields(pack)
+        numbers = {
+            f: np.fromiter(
+                (
+                    float(v) if _is_number(v := c.get(f, 0)) else 0.0
+                    for c in contexts
+                ),
+                dtype=np.float64,
+                count=len(contexts),
+            )
+            for f in number_fields
+        }
+        flags = {
+            f: np.fromiter(
+                (bool(c.get(f)) for c in contexts),
+                dtype=np.bool_,
+                count=len(contexts),
+            )
+            for f in flag_fields
+        }
+        return cls(size=len(contexts), numbers=numbers, flags=flags)
+
+    @classmethod
+    def from_columns(
+        cls, columns: Mapping[str, Iterable[Any]], pack: RulePack
+    ) -> BatchEvalContext:
+        """이미 컬럼 형태(필드 → 값 배열)인 입력. 없는 필드는 0 / False."""
+        arrays = {
+            k: v if isinstance(v, np.ndarray) else np.asarray(list(v))
+            for k, v in columns.items()
+        }
+        sizes = {a.shape[0] for a in arrays.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"컬럼 길이 mismatch: {sorted(sizes)}")
+        n = sizes.pop() if sizes else 0
+
+        number_fields, flag_fields = _pack_fields(pack)
+        numbers: dict[str, np.ndarray] = {}
+        for f in number_fields:
+            arr = arrays.get(f)
+            if arr is None:
+                numbers[f] = np.zeros(n, dtype=np.float64)
+            elif arr.dtype.kind in "biuf":
+                numbers[f] = arr.astype(np.float64)
+            else:
+                numbers[f] = np.fromiter(
+                    (float(v) if _is_number(v) else 0.0 for v in arr.tolist()),
+                    dtype=np.float64,
+                    count=n,
+                )
+        flags: dict[str, np.ndarray] = {}
+        for f in flag_fields:
+            arr = arrays.get(f)
+            if arr is None:
+                flags[f] = np.zeros(n, dtype=np.bool_)
+            else:
+                flags[f] = np.fromiter(
+                    (bool(v) for v in arr.tolist()), dtype=np.bool_, count=n
+                )
+        return cls(size=n, numbers=numbers, flags=flags)
+
+
+def _pack_fields(pack: RulePack) -> tuple[list[str], list[str]]:
+    numbers: set[str] = set()
+    flags: set[str] = set()
+    for rule in pack.rules:
+        n, f = _rule_fields(rule)
+        numbers |= n
+        flags |= f
+    return sorted(numbers), sorted(flags)
+
+
+# -------------------- 벡터 평가 --------------------
+
+
+_VECTOR_COMPARISONS = {
+    "gt": np.greater,
+    "gte": np.greater_equal,
+    "lt": np.less,
+    "lte": np.less_equal,
+    "eq": np.equal,
+}
+
+
+@dataclass
+class RuleColumns:
+    """
+    룰 1건의 전 직원 평가 결과.
+    result[i] 는 known[i] 가 False 면 None(판단불가) 로 해석.
+    computed[key] 의 None 위치는 computed_known[key] 로 표시.
+    """
+
+    rule: Rule
+    formula: str
+    result: np.ndarray
+    known: np.ndarray
+    computed: dict[str, np.ndarray]
+    computed_known: dict[str, np.ndarray]
+
+    def result_at(self, i: int) -> bool | None:
+        return bool(self.result[i]) if self.known[i] else None
+
+    def evaluation(self, i: int) -> RuleEvaluation:
+        computed: dict[str, Any] = {}
+        for key, col in self.computed.items():
+            if not self.computed_known[key][i]:
+                computed[key] = None
+            elif col.dtype == np.bool_:
+                computed[key] = bool(col[i])
+            else:
+                computed[key] = int(col[i])
+        rule = self.rule
+        return RuleEvaluation.model_construct(
+            rule_id=rule.rule_id,
+            title=rule.title,
+            legal_anchor=rule.legal_anchor,
+            legal_text_hash=rule.legal_text_hash,
+            computed=computed,
+            result=self.result_at(i),
+            formula=self.formula,
+        )
+
+
+def _evaluate_threshold(
+    compiled: CompiledRule, ev: ThresholdEvaluator, ctx: BatchEvalContext
+) -> RuleColumns:
+    threshold_val = compiled.exprs["threshold"].vector(ctx.numbers, ctx.size)
+    actual_val = compiled.exprs["value"].vector(ctx.numbers, ctx.size)
+    known = threshold_val != 0
+    result = _VECTOR_COMPARISONS[ev.comparison](actual_val, threshold_val) & known
+    everyone = np.ones(ctx.size, dtype=np.bool_)
+    return RuleColumns(
+        rule=compiled.rule,
+        formula=compiled.formula,
+        result=result,
+        known=known,
+        computed={
+            ev.outputs.threshold_key: threshold_val,
+            ev.outputs.value_key: actual_val,
+            ev.outputs.result_key: result,
+        },
+        computed_known={
+            ev.outputs.threshold_key: known,
+            ev.outputs.value_key: everyone,
+            ev.outputs.result_key: known,
+        },
+    )
+
+
+def _evaluate_flags(
+    compiled: CompiledRule,
+    ev: AllOfFlagsEvaluator | AnyOfFlagsEvaluator,
+    ctx: BatchEvalContext,
+) -> RuleColumns:
+    if ev.flags:
+        reduce_op = (
+            np.logical_and if isinstance(ev, AllOfFlagsEvaluator) else np.logical_or
+        )
+        result = reduce_op.reduce([ctx.flags[f] for f in ev.flags])
+        known = np.ones(ctx.size, dtype=np.bool_)
+    else:
+        result = np.zeros(ctx.size, dtype=np.bool_)
+        known = np.zeros(ctx.size, dtype=np.bool_)
+    return RuleColumns(
+        rule=compiled.rule,
+        formula=compiled.formula,
+        result=result,
+        known=known,
+        computed={ev.outputs.result_key: result},
+        computed_known={ev.outputs.result_key: known},
+    )
+
+
+def _evaluate_amount(
+    compiled: CompiledRule, ev: AmountEvaluator, ctx: BatchEvalContext
+) -> RuleColumns:
+    amount = compiled.exprs["value"].vector(ctx.numbers, ctx.size)
+    result = amount > 0
+    everyone = np.ones(ctx.size, dtype=np.bool_)
+    return RuleColumns(
+        rule=compiled.rule,
+        formula=compiled.formula,
+        result=result,
+        known=everyone,
+        computed={ev.outputs.value_key: amount, ev.outputs.result_key: result},
+        computed_known={ev.outputs.value_key: everyone, ev.outputs.result_key: everyone},
+    )
+
+
+@dataclass
+class BatchRuleResult:
+    """팩 전체의 컬럼 결과. rules 순서는 pack.rules 와 동일."""
+
+    year: int
+    size: int
+    rules: list[RuleColumns]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def column(self, rule_id: str) -> RuleColumns:
+        for col in self.rules:
+            if col.rule.rule_id == rule_id:
+                return col
+        raise KeyError(rule_id)
+
+    def evaluations(self, i: int) -> list[RuleEvaluation]:
+        """i 번째 직원의 RuleEvaluation 목록 (build_rule_context 의 evaluations 와 동일)."""
+        return [col.evaluation(i) for col in self.rules]
+
+
+def evaluate_pack_batch(
+    pack: RulePack,
+    contexts: Sequence[Mapping[str, Any]] | BatchEvalContext,
+) -> BatchRuleResult:
+    """
+    contexts: build_eval_context 결과 리스트 또는 미리 만든 BatchEvalContext.
+    """
+    ctx = (
+        contexts
+        if isinstance(contexts, BatchEvalContext)
+        else BatchEvalContext.from_contexts(contexts, pack)
+    )
+    columns: list[RuleColumns] = []
+    for compiled in compiled_rules(pack):
+        ev = compiled.rule.evaluator
+        if isinstance(ev, ThresholdEvaluator):
+            columns.append(_evaluate_threshold(compiled, ev, ctx))
+        elif isinstance(ev, (AllOfFlagsEvaluator, AnyOfFlagsEvaluator)):
+            columns.append(_evaluate_flags(compiled, ev, ctx))
+        elif isinstance(ev, AmountEvaluator):
+            columns.append(_evaluate_amount(compiled, ev, ctx))
+        else:
+            raise ValueError(f"Unknown evaluator kind: {type(ev).__name__}")
+    return BatchRuleResult(year=pack.year, size=ctx.size, rules=columns)
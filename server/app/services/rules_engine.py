@@ -4,53 +4,74 @@
 == 흐름 ==
 1) 사용자 입력(소득/인적공제/조건/PDF/수기) → 평가 컨텍스트(flat dict)
 2) `data/rules/{year}.json` 로드 → Rule 객체들
+   (RulePackRegistry: stat 기반 hot reload, 팩 + 파생 인덱스를 snapshot 단위로 교체)
 3) 각 Rule 의 evaluator 실행 → RuleEvaluation
 4) legacy RuleContext(@dataclass) 의 named field 도 동시에 채워서 반환
+   (평가 컨텍스트는 고정 레이아웃 EvalContext, raw 는 읽을 때 lazy 생성)
    (analyze.py / llm_client.py 가 기존 필드명에 의존하므로 호환 유지)
 
+== 컴파일 ==
+- load_rules 시점에 각 Rule 을 CompiledRule(클로저 + 미리 만든 formula 문자열)로 1회 변환.
+  요청마다 isinstance 분기 / formula 조립 / Pydantic 검증을 반복하지 않음.
+- evaluate_rule(rule, ctx) 는 단건 편의 API — 내부적으로 같은 컴파일 경로 사용.
+- 값 표현(min/max/clip/piecewise/중첩 합 …) 은 services/rule_expr 가 컴파일.
+  같은 CompiledExpr 를 rules_batch 가 NumPy 컬럼에 대해 재사용.
+
+== 증분 재평가 ==
+- update_rule_context(prev, changes): 바뀐 필드를 읽는 룰만 다시 평가
+  (field → rule_id 인덱스는 dependencies._build_indices 재사용). 위저드 live preview 용.
+
 == 보안 ==
 - eval() 안 씀. evaluator 는 전부 discriminated union 으로 분기.
 
 == 확장 ==
 - 새 룰 추가: rules/{year}.json 에 1건 추가 + (필요 시) evaluation context 에 새 필드.
-- 새 evaluator 종류 추가: rule_schema.py 에 BaseModel + Literal kind 추가, 본 파일 _evaluate_* dispatcher 추가.
+- 새 evaluator 종류 추가: rule_schema.py 에 BaseModel + Literal kind 추가, 본 파일 _compile_* + compile_rule 분기,
+  rules_batch 의 벡터 분기 추가.
+- 새 값 표현 추가: rule_schema.py ValueExpr union + rule_expr._COMPILERS 에 scalar/vector 한 쌍.
 """
 
 from __future__ import annotations
 
 import json
+import logging
+import threading
+import time
 from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Mapping
 
 from app.schemas.manual_input_schema import ManualInputRequest
 from app.schemas.pdf_schema import ParsedPdfData
 from app.schemas.rule_schema import (
     AllOfFlagsEvaluator,
-    Constant,
-    FieldRef,
-    RatioOfField,
+    AmountEvaluator,
+    AnyOfFlagsEvaluator,
+    Evaluator,
     Rule,
     RuleEvaluation,
     RulePack,
-    SumOfFields,
     ThresholdEvaluator,
     ValueExpr,
 )
 from app.schemas.user_input_schema import Conditions, Dependents, Income
+from app.services.rule_expr import CompiledExpr, compile_expr
 
 
 DEFAULT_RULES_DIR = (
     Path(__file__).resolve().parent.parent / "data" / "rules"
 )
 
+logger = logging.getLogger(__name__)
+
 
 # ---------------- 알려진 필드 화이트리스트 ----------------
 
 # build_eval_context 가 채우는 모든 키 + 한국어 라벨.
 # rule_compiler 가 LLM 프롬프트 + 검증에 이 목록을 사용.
 # 새 필드 추가 시 build_eval_context 와 여기 두 곳 모두 갱신해야 함.
+# 순서 = EvalContext 의 offset — build_eval_context 의 값 list 도 같은 순서.
 EVAL_CONTEXT_FIELDS: dict[str, str] = {
     # 소득
     "total_salary": "총급여 (원)",
@@ -98,15 +119,100 @@ EVAL_CONTEXT_FIELDS: dict[str, str] = {
     "tax_credit_type": "PDF 세액공제 유형",
 }
 
+# build_eval_context 가 bool() 로 정규화하는 필드. 나머지는 `or 0` 숫자 필드
+# (tax_credit_type 만 문자열).
+_FLAG_FIELDS: frozenset[str] = frozenset(
+    {
+        "has_spouse",
+        "single_parent",
+        "female_householder",
+        "householder",
+        "no_house",
+        "lease_contract",
+        "has_loan",
+        "child_education",
+        "self_education",
+        "mid_small_company_worker",
+    }
+)
+
+
+# ---------------- 고정 레이아웃 평가 컨텍스트 ----------------
+
+# EVAL_CONTEXT_FIELDS 순서 = EvalContext 내부 list 의 offset
+EVAL_FIELD_NAMES: tuple[str, ...] = tuple(EVAL_CONTEXT_FIELDS)
+EVAL_FIELD_OFFSETS: dict[str, int] = {
+    name: i for i, name in enumerate(EVAL_FIELD_NAMES)
+}
+
+_MISSING: Any = object()
+
+
+class EvalContext(Mapping[str, Any]):
+    """
+    build_eval_context 결과. 키별 dict 대신 EVAL_CONTEXT_FIELDS 순서의 고정 list 1개.
+    read-only Mapping — 기존 `ctx["total_salary"]` / `ctx.get(...)` 접근 그대로 동작.
+    EVAL_CONTEXT_FIELDS 밖의 키는 보관하지 않음.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: list[Any]) -> None:
+        if len(values) != len(EVAL_FIELD_NAMES):
+            raise ValueError(
+                f"EvalContext 값 개수 mismatch: {len(values)} != {len(EVAL_FIELD_NAMES)}"
+            )
+        self._values = values
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> EvalContext:
+        return cls([data.get(name, _MISSING) for name in EVAL_FIELD_NAMES])
+
+    def __getitem__(self, name: str) -> Any:
+        off = EVAL_FIELD_OFFSETS.get(name)
+        if off is None or self._values[off] is _MISSING:
+            raise KeyError(name)
+        return self._values[off]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        off = EVAL_FIELD_OFFSETS.get(name)
+        if off is None:
+            return default
+        v = self._values[off]
+        return default if v is _MISSING else v
+
+    def __iter__(self):
+        return (
+            name
+            for name, v in zip(EVAL_FIELD_NAMES, self._values)
+            if v is not _MISSING
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for v in self._values if v is not _MISSING)
+
+    def __repr__(self) -> str:
+        return f"EvalContext({dict(self)!r})"
+
+    def replace(self, changes: Mapping[str, Any]) -> EvalContext:
+        """copy-on-write. changes 키는 EVAL_CONTEXT_FIELDS 여야 함."""
+        values = list(self._values)
+        for name, value in changes.items():
+            values[EVAL_FIELD_OFFSETS[name]] = value
+        return EvalContext(values)
+
 
 # ---------------- legacy RuleContext (호환 유지) ----------------
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleContext:
     """
     기존 코드(analyze.py / llm_client.py) 와의 호환을 위해 named field 유지.
     추가로 evaluations(구조화 출력) 와 raw(디버그) 보유.
+
+    raw 는 처음 읽을 때 eval_context + evaluations.model_dump() 로 만들어 캐시
+    (대부분의 호출자는 raw 를 읽지 않음).
     """
 
     # 카드
@@ -125,27 +231,173 @@ class RuleContext:
     # PDF 메타
     tax_credit_type: str | None = None
 
-    # 디버그용 raw flat context
-    raw: dict[str, Any] = field(default_factory=dict)
-
     # Phase 2-2: 구조화 평가 결과 (Provenance·LLM 모두 이 쪽 사용 권장)
     evaluations: list[RuleEvaluation] = field(default_factory=list)
 
+    # 평가에 쓰인 컨텍스트 (증분 재평가의 출발점)
+    eval_context: EvalContext | None = field(default=None, repr=False)
+
+    # 평가에 쓰인 컴파일 룰 (팩 교체 판별 — 같은 객체일 때만 evaluations 재사용)
+    compiled: tuple[CompiledRule, ...] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    _raw: dict[str, Any] | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """디버그용 raw flat context + `_evaluations` (lazy)."""
+        if self._raw is None:
+            raw: dict[str, Any] = (
+                dict(self.eval_context) if self.eval_context is not None else {}
+            )
+            if self.eval_context is not None or self.evaluations:
+                raw["_evaluations"] = [ev.model_dump() for ev in self.evaluations]
+            self._raw = raw
+        return self._raw
+
+    @raw.setter
+    def raw(self, value: dict[str, Any]) -> None:
+        self._raw = value
+
 
 # ---------------- 룰 로드 ----------------
 
 
-@lru_cache(maxsize=4)
-def load_rules(year: int = 2025, path: str | None = None) -> RulePack:
-    file_path = Path(path) if path else DEFAULT_RULES_DIR / f"{year}.json"
+def _parse_pack_file(file_path: Path, year: int | None) -> RulePack:
+    """JSON 파싱 + 검증 + 컴파일. year 가 주어지면 파일의 연도와 일치해야 함."""
     with file_path.open("r", encoding="utf-8") as f:
         data = json.load(f)
     pack = RulePack.model_validate(data)
-    if pack.year != year and path is None:
+    if year is not None and pack.year != year:
         raise ValueError(f"룰 팩 연도 mismatch: 요청 {year}, 파일 {pack.year}")
+    compiled_rules(pack)
     return pack
 
 
+@dataclass(frozen=True, slots=True)
+class RulePackSnapshot:
+    """
+    한 시점의 룰 팩 + 그 팩에서 파생된 인덱스.
+    교체는 snapshot 단위 → 팩과 파생 인덱스(dependencies 등)가 항상 같은 버전.
+    """
+
+    year: int
+    generation: int
+    signature: tuple[int, int, int]  # (mtime_ns, size, inode)
+    pack: RulePack
+    derived: dict[str, Any] = field(default_factory=dict, compare=False)
+
+    def derive(self, key: str, build: Callable[[RulePack], Any]) -> Any:
+        """이 snapshot 의 팩으로 만든 파생값 (snapshot 당 1회 생성)."""
+        value = self.derived.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.derived.setdefault(key, build(self.pack))
+        return value
+
+
+class RulePackRegistry:
+    """
+    연도 → RulePackSnapshot. 조회 시 check_interval 마다 파일 stat 비교,
+    바뀌었으면 새로 파싱·컴파일한 snapshot 으로 통째 교체 (generation 증가).
+
+    - 멀티 워커: 각 프로세스가 독립적으로 stat → 승인 후 check_interval 안에 수렴.
+    - 쓰기 쪽은 tmp + os.replace 로 원자 교체 → 반쯤 쓰인 파일을 읽지 않음.
+      inode 가 바뀌므로 같은 mtime tick 안의 재작성도 감지.
+    - 파싱 실패 시 이전 snapshot 유지 (없으면 예외 전파).
+    """
+
+    def __init__(
+        self,
+        directory: Path = DEFAULT_RULES_DIR,
+        check_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.directory = Path(directory)
+        self.check_interval = check_interval
+        self._clock = clock
+        self._snapshots: dict[int, RulePackSnapshot] = {}
+        self._checked_at: dict[int, float] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def path_for(self, year: int) -> Path:
+        return self.directory / f"{year}.json"
+
+    def snapshot(self, year: int = 2025) -> RulePackSnapshot:
+        snap = self._snapshots.get(year)
+        if snap is not None:
+            checked_at = self._checked_at.get(year)
+            if (
+                checked_at is not None
+                and self._clock() - checked_at < self.check_interval
+            ):
+                return snap
+        return self.refresh(year)
+
+    def get(self, year: int = 2025) -> RulePack:
+        return self.snapshot(year).pack
+
+    def generation(self, year: int = 2025) -> int:
+        return self.snapshot(year).generation
+
+    def refresh(self, year: int = 2025) -> RulePackSnapshot:
+        """check_interval 무시하고 즉시 stat 비교 (승인 직후 같은 프로세스용)."""
+        with self._lock:
+            prev = self._snapshots.get(year)
+            file_path = self.path_for(year)
+            now = self._clock()
+            try:
+                st = file_path.stat()
+            except FileNotFoundError:
+                if prev is None:
+                    raise
+                logger.warning("rule_pack_missing year=%s path=%s", year, file_path)
+                self._checked_at[year] = now
+                return prev
+            sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+            self._checked_at[year] = now
+            if prev is not None and prev.signature == sig:
+                return prev
+            try:
+                pack = _parse_pack_file(file_path, year)
+            except (OSError, ValueError):
+                if prev is None:
+                    raise
+                logger.exception("rule_pack_load_failed year=%s", year)
+                return prev
+            self._generation += 1
+            snap = RulePackSnapshot(
+                year=year, generation=self._generation, signature=sig, pack=pack
+            )
+            self._snapshots[year] = snap
+            logger.info(
+                "rule_pack_loaded year=%s generation=%s rules=%s",
+                year,
+                snap.generation,
+                len(pack.rules),
+            )
+            return snap
+
+
+rule_registry = RulePackRegistry()
+
+
+@lru_cache(maxsize=4)
+def _load_pack_file(path: str) -> RulePack:
+    return _parse_pack_file(Path(path), None)
+
+
+def load_rules(year: int = 2025, path: str | None = None) -> RulePack:
+    """
+    컴파일된 룰 팩. path 인자가 있으면 그 파일(캐시), 없으면 레지스트리의
+    해당 연도 팩 (승인 후 hot reload 반영).
+    """
+    if path:
+        return _load_pack_file(path)
+    return rule_registry.get(year)
+
+
 # ---------------- 평가 컨텍스트 ----------------
 
 
@@ -155,8 +407,8 @@ def build_eval_context(
     conditions: Conditions,
     parsed_pdf: ParsedPdfData,
     manual_input: ManualInputRequest,
-) -> dict[str, Any]:
-    """모든 입력을 룰이 참조할 수 있는 flat dict 로 평탄화."""
+) -> EvalContext:
+    """모든 입력을 룰이 참조할 수 있는 flat 컨텍스트로 평탄화."""
 
     family_medical_total = 0
     if manual_input.family_medical_expenses:
@@ -164,87 +416,63 @@ def build_eval_context(
             item.amount for item in manual_input.family_medical_expenses
         )
 
-    ctx: dict[str, Any] = {
-        # 소득
-        "total_salary": income.total_salary or 0,
-        "non_taxable": income.non_taxable or 0,
-        "bonus": income.bonus or 0,
-        # 카드
-        "credit_card": parsed_pdf.credit_card or 0,
-        "debit_card": parsed_pdf.debit_card or 0,
-        "cash_receipt": parsed_pdf.cash_receipt or 0,
-        # 의료비
-        "medical_expense": parsed_pdf.medical_expense or 0,
-        "severe_medical_for_disabled": parsed_pdf.severe_medical_for_disabled
-        or 0,
-        "infertility_treatment_expense": manual_input.infertility_treatment_expense
-        or 0,
-        "assistive_devices_expense": manual_input.assistive_devices_expense
-        or 0,
-        "childbirth_care_expense": manual_input.childbirth_care_expense or 0,
-        "glasses_contacts_expense": manual_input.glasses_contacts_expense or 0,
-        "family_medical_total": family_medical_total,
-        # 기부금
-        "donation_total": parsed_pdf.donation_total or 0,
-        "donation_extra": manual_input.donation_extra or 0,
-        # 주택
-        "rent_in_pdf": parsed_pdf.rent_in_pdf or 0,
-        "housing_loan_interest": parsed_pdf.housing_loan_interest or 0,
-        # 보험·연금
-        "insurance": parsed_pdf.insurance or 0,
-        "pension_saving": parsed_pdf.pension_saving or 0,
-        "retirement_pension": parsed_pdf.retirement_pension or 0,
-        # PDF 메타
-        "tax_credit_type": parsed_pdf.tax_credit_type or "unknown",
-        # 인적공제
-        "has_spouse": bool(dependents.has_spouse),
-        "dependents_count": dependents.dependents_count or 0,
-        "disabled_count": dependents.disabled_count or 0,
-        "senior_count": dependents.senior_count or 0,
-        "single_parent": bool(dependents.single_parent),
-        "female_householder": bool(dependents.female_householder),
-        # 조건 플래그
-        "householder": bool(conditions.householder),
-        "no_house": bool(conditions.no_house),
-        "lease_contract": bool(conditions.lease_contract),
-        "has_loan": bool(conditions.has_loan),
-        "child_education": bool(conditions.child_education),
-        "self_education": bool(conditions.self_education),
-        "mid_small_company_worker": bool(
-            conditions.mid_small_company_worker
-        ),
-    }
-    return ctx
+    # 순서 = EVAL_CONTEXT_FIELDS (EvalContext offset). 필드 추가 시 세 곳 모두 갱신.
+    return EvalContext(
+        [
+            # 소득
+            income.total_salary or 0,
+            income.non_taxable or 0,
+            income.bonus or 0,
+            # 카드
+            parsed_pdf.credit_card or 0,
+            parsed_pdf.debit_card or 0,
+            parsed_pdf.cash_receipt or 0,
+            # 의료비
+            parsed_pdf.medical_expense or 0,
+            parsed_pdf.severe_medical_for_disabled or 0,
+            manual_input.infertility_treatment_expense or 0,
+            manual_input.assistive_devices_expense or 0,
+            manual_input.childbirth_care_expense or 0,
+            manual_input.glasses_contacts_expense or 0,
+            family_medical_total,
+            # 기부금
+            parsed_pdf.donation_total or 0,
+            manual_input.donation_extra or 0,
+            # 주택
+            parsed_pdf.rent_in_pdf or 0,
+            parsed_pdf.housing_loan_interest or 0,
+            # 보험·연금
+            parsed_pdf.insurance or 0,
+            parsed_pdf.pension_saving or 0,
+            parsed_pdf.retirement_pension or 0,
+            # 인적공제 — 숫자
+            dependents.dependents_count or 0,
+            dependents.disabled_count or 0,
+            dependents.senior_count or 0,
+            # 인적공제 — 플래그
+            bool(dependents.has_spouse),
+            bool(dependents.single_parent),
+            bool(dependents.female_householder),
+            # 조건 플래그
+            bool(conditions.householder),
+            bool(conditions.no_house),
+            bool(conditions.lease_contract),
+            bool(conditions.has_loan),
+            bool(conditions.child_education),
+            bool(conditions.self_education),
+            bool(conditions.mid_small_company_worker),
+            # 메타
+            parsed_pdf.tax_credit_type or "unknown",
+        ]
+    )
 
 
 # ---------------- 값 표현 평가 ----------------
 
 
-def _resolve_value(expr: ValueExpr, ctx: dict[str, Any]) -> int:
-    """ValueExpr 을 정수값으로 변환."""
-
-    if isinstance(expr, FieldRef):
-        v = ctx.get(expr.name, 0)
-        return int(v) if isinstance(v, (int, float)) else 0
-
-    if isinstance(expr, RatioOfField):
-        base = ctx.get(expr.field, 0)
-        if not isinstance(base, (int, float)) or base <= 0:
-            return 0
-        return int(base * expr.ratio)
-
-    if isinstance(expr, SumOfFields):
-        total = 0
-        for fld in expr.fields:
-            v = ctx.get(fld, 0)
-            if isinstance(v, (int, float)):
-                total += int(v)
-        return total
-
-    if isinstance(expr, Constant):
-        return int(expr.value)
-
-    raise ValueError(f"Unknown value expression: {type(expr).__name__}")
+def _resolve_value(expr: ValueExpr, ctx: Mapping[str, Any]) -> int:
+    """ValueExpr 을 정수값으로 변환. (반복 평가는 compile_expr 결과 재사용)"""
+    return compile_expr(expr).scalar(ctx)
 
 
 # ---------------- evaluator dispatcher ----------------
@@ -260,66 +488,149 @@ _COMPARISONS = {
 
 
 def _formula_str(expr: ValueExpr) -> str:
-    if isinstance(expr, FieldRef):
-        return expr.name
-    if isinstance(expr, RatioOfField):
-        return f"{expr.field} × {expr.ratio}"
-    if isinstance(expr, SumOfFields):
-        return " + ".join(expr.fields)
-    if isinstance(expr, Constant):
-        return str(expr.value)
-    return "?"
+    return compile_expr(expr).formula
+
+
+# ---------------- 컴파일 ----------------
+
+EvalFn = Callable[[dict[str, Any]], tuple[dict[str, Any], bool | None]]
+
+
+def _compile_threshold(
+    ev: ThresholdEvaluator, threshold: CompiledExpr, value: CompiledExpr
+) -> EvalFn:
+    threshold_fn = threshold.scalar
+    value_fn = value.scalar
+    op = _COMPARISONS[ev.comparison]
+    threshold_key = ev.outputs.threshold_key
+    value_key = ev.outputs.value_key
+    result_key = ev.outputs.result_key
+
+    def _run(ctx: dict[str, Any]) -> tuple[dict[str, Any], bool | None]:
+        threshold_val = threshold_fn(ctx)
+        actual_val = value_fn(ctx)
+        # threshold 가 0 이면 None (판단불가) — 데이터 부족 보수적 처리
+        result = None if threshold_val == 0 else bool(op(actual_val, threshold_val))
+        return (
+            {
+                threshold_key: threshold_val if threshold_val else None,
+                value_key: actual_val,
+                result_key: result,
+            },
+            result,
+        )
 
+    return _run
 
-def evaluate_rule(rule: Rule, ctx: dict[str, Any]) -> RuleEvaluation:
-    """단일 룰 평가 → RuleEvaluation."""
 
-    ev = rule.evaluator
-    computed: dict[str, Any] = {}
-    result: bool | None = None
-    formula: str | None = None
+def _compile_all_of_flags(ev: AllOfFlagsEvaluator) -> EvalFn:
+    flags = tuple(ev.flags)
+    result_key = ev.outputs.result_key
+
+    def _run(ctx: dict[str, Any]) -> tuple[dict[str, Any], bool | None]:
+        result = all(bool(ctx.get(f)) for f in flags) if flags else None
+        return {result_key: result}, result
+
+    return _run
+
+
+def _compile_any_of_flags(ev: AnyOfFlagsEvaluator) -> EvalFn:
+    flags = tuple(ev.flags)
+    result_key = ev.outputs.result_key
 
+    def _run(ctx: dict[str, Any]) -> tuple[dict[str, Any], bool | None]:
+        result = any(bool(ctx.get(f)) for f in flags) if flags else None
+        return {result_key: result}, result
+
+    return _run
+
+
+def _compile_amount(ev: AmountEvaluator, value: CompiledExpr) -> EvalFn:
+    value_fn = value.scalar
+    value_key = ev.outputs.value_key
+    result_key = ev.outputs.result_key
+
+    def _run(ctx: dict[str, Any]) -> tuple[dict[str, Any], bool | None]:
+        amount = value_fn(ctx)
+        result = amount > 0
+        return {value_key: amount, result_key: result}, result
+
+    return _run
+
+
+def _evaluator_formula(ev: Evaluator, exprs: Mapping[str, CompiledExpr]) -> str:
     if isinstance(ev, ThresholdEvaluator):
-        threshold_val = _resolve_value(ev.threshold, ctx)
-        actual_val = _resolve_value(ev.value, ctx)
-        op = _COMPARISONS[ev.comparison]
-
-        # 데이터가 사실상 모두 0 이면 None (판단불가) 처리: total_salary 가 0 인 경우만 보수적 판단불가
-        # 단순화: threshold 가 0 이면 None
-        if threshold_val == 0:
-            result = None
-        else:
-            result = bool(op(actual_val, threshold_val))
-
-        computed[ev.outputs.threshold_key] = threshold_val if threshold_val else None
-        computed[ev.outputs.value_key] = actual_val
-        computed[ev.outputs.result_key] = result
-
-        formula = (
-            f"{_formula_str(ev.value)} {ev.comparison} "
-            f"{_formula_str(ev.threshold)}"
+        return (
+            f"{exprs['value'].formula} {ev.comparison} "
+            f"{exprs['threshold'].formula}"
+        )
+    if isinstance(ev, AmountEvaluator):
+        return exprs["value"].formula
+    if isinstance(ev, AnyOfFlagsEvaluator):
+        return " ∨ ".join(ev.flags)
+    return " ∧ ".join(ev.flags)
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRule:
+    """Rule 1건의 컴파일 결과. formula / 메타는 미리 계산해 둠."""
+
+    rule: Rule
+    formula: str
+    run: EvalFn
+    # evaluator 의 값 표현 컴파일 결과 (threshold/value). rules_batch 가 vector 로 재사용
+    exprs: Mapping[str, CompiledExpr] = field(default_factory=dict)
+
+    def evaluate(self, ctx: dict[str, Any]) -> RuleEvaluation:
+        computed, result = self.run(ctx)
+        rule = self.rule
+        # 필드 값이 모두 이미 검증된 타입 — 생성자 검증 생략
+        return RuleEvaluation.model_construct(
+            rule_id=rule.rule_id,
+            title=rule.title,
+            legal_anchor=rule.legal_anchor,
+            legal_text_hash=rule.legal_text_hash,
+            computed=computed,
+            result=result,
+            formula=self.formula,
         )
 
-    elif isinstance(ev, AllOfFlagsEvaluator):
-        flags = [bool(ctx.get(f)) for f in ev.flags]
-        result = all(flags) if flags else None
-        computed[ev.outputs.result_key] = result
-        formula = " ∧ ".join(ev.flags)
 
+def compile_rule(rule: Rule) -> CompiledRule:
+    ev = rule.evaluator
+    exprs: dict[str, CompiledExpr] = {}
+    if isinstance(ev, ThresholdEvaluator):
+        exprs = {
+            "threshold": compile_expr(ev.threshold),
+            "value": compile_expr(ev.value),
+        }
+        run = _compile_threshold(ev, exprs["threshold"], exprs["value"])
+    elif isinstance(ev, AllOfFlagsEvaluator):
+        run = _compile_all_of_flags(ev)
+    elif isinstance(ev, AnyOfFlagsEvaluator):
+        run = _compile_any_of_flags(ev)
+    elif isinstance(ev, AmountEvaluator):
+        exprs = {"value": compile_expr(ev.value)}
+        run = _compile_amount(ev, exprs["value"])
     else:
         raise ValueError(f"Unknown evaluator kind: {type(ev).__name__}")
-
-    return RuleEvaluation(
-        rule_id=rule.rule_id,
-        title=rule.title,
-        legal_anchor=rule.legal_anchor,
-        legal_text_hash=rule.legal_text_hash,
-        computed=computed,
-        result=result,
-        formula=formula,
+    return CompiledRule(
+        rule=rule, formula=_evaluator_formula(ev, exprs), run=run, exprs=exprs
     )
 
 
+def compiled_rules(pack: RulePack) -> tuple[CompiledRule, ...]:
+    """pack 의 컴파일 결과. 처음 호출 시 1회 컴파일해 pack 에 부착."""
+    if pack._compiled is None:
+        pack._compiled = tuple(compile_rule(rule) for rule in pack.rules)
+    return pack._compiled
+
+
+def evaluate_rule(rule: Rule, ctx: dict[str, Any]) -> RuleEvaluation:
+    """단일 룰 평가 → RuleEvaluation. (팩 단위 평가는 compiled_rules 사용)"""
+    return compile_rule(rule).evaluate(ctx)
+
+
 # ---------------- 통합: build_rule_context ----------------
 
 
@@ -350,17 +661,27 @@ def build_rule_context(
     ctx_data = build_eval_context(
         income, dependents, conditions, parsed_pdf, manual_input
     )
-    pack = load_rules(year=year)
-    evaluations = [evaluate_rule(rule, ctx_data) for rule in pack.rules]
+    compiled = compiled_rules(load_rules(year=year))
+    evaluations = [rule.evaluate(ctx_data) for rule in compiled]
+    return _assemble_rule_context(
+        ctx_data,
+        evaluations,
+        tax_credit_type=parsed_pdf.tax_credit_type,
+        compiled=compiled,
+    )
+
 
+def _assemble_rule_context(
+    ctx_data: EvalContext,
+    evaluations: list[RuleEvaluation],
+    tax_credit_type: str | None,
+    compiled: tuple[CompiledRule, ...] | None = None,
+) -> RuleContext:
     # legacy named field 채우기
     flat: dict[str, Any] = {}
     for ev in evaluations:
         flat.update(ev.computed)
 
-    raw = dict(ctx_data)
-    raw["_evaluations"] = [ev.model_dump() for ev in evaluations]
-
     return RuleContext(
         card_threshold_25=flat.get("card_threshold_25"),
         card_total_usage=flat.get("card_total_usage"),
@@ -369,7 +690,71 @@ def build_rule_context(
         medical_total=flat.get("medical_total"),
         medical_meets_threshold=flat.get("medical_meets_threshold"),
         rent_conditions_met=flat.get("rent_conditions_met"),
-        tax_credit_type=parsed_pdf.tax_credit_type,
-        raw=raw,
+        tax_credit_type=tax_credit_type,
         evaluations=evaluations,
+        eval_context=ctx_data,
+        compiled=compiled,
+    )
+
+
+def _normalize_field(name: str, value: Any) -> Any:
+    """build_eval_context 와 같은 정규화 (None → 0 / bool / 'unknown')."""
+    if name in _FLAG_FIELDS:
+        return bool(value)
+    if name == "tax_credit_type":
+        return value or "unknown"
+    return value or 0
+
+
+def update_rule_context(
+    prev: RuleContext,
+    changes: Mapping[str, Any],
+    year: int = 2025,
+) -> RuleContext:
+    """
+    증분 재평가. prev 의 평가 컨텍스트에 changes(EVAL_CONTEXT_FIELDS 키 → 새 값)를
+    덮어쓰고, 값이 실제로 바뀐 필드를 읽는 룰만 다시 평가.
+    나머지 RuleEvaluation 은 prev 의 객체를 그대로 재사용. prev 는 변경하지 않음.
+    """
+    from app.services.dependencies import rule_ids_for_fields
+
+    unknown = set(changes) - set(EVAL_CONTEXT_FIELDS)
+    if unknown:
+        raise ValueError(f"알 수 없는 평가 컨텍스트 필드: {sorted(unknown)}")
+
+    base = prev.eval_context or EvalContext.from_mapping(prev.raw)
+    updates: dict[str, Any] = {}
+    for name, value in changes.items():
+        value = _normalize_field(name, value)
+        if base.get(name, _MISSING) != value:
+            updates[name] = value
+    ctx_data = base.replace(updates) if updates else base
+
+    tax_credit_type = (
+        changes["tax_credit_type"]
+        if "tax_credit_type" in changes
+        else prev.tax_credit_type
+    )
+
+    # 팩과 field → rule 인덱스를 같은 snapshot 에서 읽음 (중간에 교체돼도 일관)
+    snap = rule_registry.snapshot(year)
+    compiled = compiled_rules(snap.pack)
+    # 같은 컴파일 결과로 만든 prev 만 재사용 — 승인으로 id 는 같고 기준값/플래그만
+    # 바뀐 룰도 새 snapshot 에서는 새로 컴파일되므로 여기서 걸러짐
+    reusable = prev.compiled is compiled and len(prev.evaluations) == len(compiled)
+    if not reusable:
+        # 룰 팩이 바뀌었거나 prev 가 다른 경로에서 만들어짐 → 전체 재평가
+        evaluations = [c.evaluate(ctx_data) for c in compiled]
+    else:
+        affected = (
+            rule_ids_for_fields(updates, year, snapshot=snap)
+            if updates
+            else set()
+        )
+        evaluations = [
+            c.evaluate(ctx_data) if c.rule.rule_id in affected else ev
+            for ev, c in zip(prev.evaluations, compiled)
+        ]
+    return _assemble_rule_context(
+        ctx_data, evaluations, tax_credit_type=tax_credit_type, compiled=compiled
     )
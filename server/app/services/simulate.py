@@ -2,13 +2,18 @@
 Phase 4-1: 다년도 시뮬레이션 엔진.
 
 == 흐름 ==
-baseline AnalyzeRequest → CalcInputs 변환 → calculate() (베이스라인)
+baseline AnalyzeRequest → CalcInputs 변환 → calculate_cached() (베이스라인)
                                           ↘ 각 YearOverride: 직전 연도 inputs 에 override 덮어씀
-                                            → calculate() 재실행
+                                            → calculate_totals() 재실행 (steps 없음)
+
+== 세율표 ==
+- 연도별 세율표는 TaxTableRegistry (data/tax_tables/{year}.json) 에서 조회.
+  해당 연도 파일이 없으면 그 이전 가장 최근 연도 세율표로 대체
+  (예: 2027 투영 → 2025.json). 보유 세율표보다 이른 연도는 가장 오래된 세율표로 대체
+  (예: 2024 투영 → 2025.json). 베이스라인(baseline_year)도 같은 규칙.
+  결과(result)의 year 는 실제 적용된 세율표 연도.
 
 == 한계 ==
-- 현재는 모든 연도가 동일한 세율표 (data/tax_tables/2025.json) 사용.
-  실제 세법 변경 반영은 v2 (per-year 세율표).
 - 비과세/상여 같은 부가 항목은 베이스라인 값 고정.
 """
 
@@ -22,7 +27,11 @@ from app.schemas.simulate_schema import (
     YearProjection,
 )
 from app.schemas.tax_calculator_schema import CalcInputs, DependentsInput
-from app.services.tax_calculator import calculate
+from app.services.tax_calculator import (
+    calculate_cached,
+    calculate_totals,
+    table_registry,
+)
 
 
 def _to_calc_inputs(
@@ -88,6 +97,17 @@ def _apply_override(prev: CalcInputs, ov: YearOverride) -> CalcInputs:
     )
 
 
+def _table_year(year: int) -> int:
+    """year 에 적용할 세율표 연도 — 보유 세율표보다 이르면 가장 오래된 세율표."""
+    try:
+        return table_registry.resolve_year(year)
+    except ValueError:
+        years = table_registry.years()
+        if not years:
+            raise
+        return years[0]
+
+
 def simulate(req: SimulateRequest) -> SimulateResponse:
     baseline_inputs = _to_calc_inputs(
         req.baseline_request,
@@ -96,7 +116,9 @@ def simulate(req: SimulateRequest) -> SimulateResponse:
         extra_tax_credits=req.extra_tax_credits,
         use_standard_tax_credit=req.use_standard_tax_credit,
     )
-    baseline_result = calculate(baseline_inputs, year=req.baseline_year)
+    baseline_result = calculate_cached(
+        baseline_inputs, year=_table_year(req.baseline_year)
+    )
     baseline_proj = YearProjection(
         year=req.baseline_year,
         note="현재(베이스라인)",
@@ -108,7 +130,9 @@ def simulate(req: SimulateRequest) -> SimulateResponse:
     prev = baseline_inputs
     for ov in req.years:
         new_inputs = _apply_override(prev, ov)
-        result = calculate(new_inputs, year=req.baseline_year)
+        # 투영 연도는 숫자만 필요 — provenance 없는 fast path (steps=[])
+        table_year = _table_year(ov.year)
+        result = calculate_totals(new_inputs, year=table_year).to_result()
         projections.append(
             YearProjection(
                 year=ov.year,
@@ -0,0 +1,283 @@
+"""
+급여대장 단위 일괄(batch) 세액 계산.
+
+== 목적 ==
+수만 명 단위 급여대장을 `tax_calculator.calculate()` 로 한 명씩 돌리면
+dict 탐색 + CalcStep Pydantic 생성 비용이 인원수만큼 쌓임.
+본 모듈은 동일 산식을 NumPy 컬럼 연산으로 한 번에 수행.
+
+== 흐름 ==
+BatchCalcInputs (컬럼) → 구간 lookup(searchsorted) → 단계별 벡터 연산 → BatchCalcResult (컬럼)
+
+== 원칙 ==
+- scalar 경로와 원 단위까지 동일해야 함. 반올림은 Python round() 와 같은
+  round-half-even(np.rint), 절사는 int() 와 같은 trunc.
+- 세율표는 scalar 경로와 동일하게 `load_tax_table` 로 로드.
+- provenance(CalcStep) 는 만들지 않음 — 필요한 사람만 scalar calculate() 로 재계산.
+
+== 한계 ==
+- itemized(항목별 정밀 산식) 입력은 미지원. extra_tax_credits 합산값만 사용.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any, Sequence
+
+import numpy as np
+
+from app.schemas.tax_calculator_schema import CalcInputs
+from app.services.tax_calculator import BracketTable, CapTable, load_tax_table
+
+
+# -------------------- 입출력 컬럼 --------------------
+
+
+@dataclass
+class BatchCalcInputs:
+    """CalcInputs 의 컬럼 버전. 모든 배열 길이는 동일해야 함."""
+
+    gross_salary: np.ndarray
+    self_eligible: np.ndarray
+    spouse: np.ndarray
+    dependents_count: np.ndarray
+    senior_count: np.ndarray
+    disabled_count: np.ndarray
+    female_householder: np.ndarray
+    single_parent: np.ndarray
+    extra_income_deductions: np.ndarray
+    extra_tax_credits: np.ndarray
+    use_standard_tax_credit: np.ndarray
+    prepaid_tax: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.gross_salary.shape[0])
+
+    @classmethod
+    def from_columns(
+        cls,
+        gross_salary: Sequence[int] | np.ndarray,
+        *,
+        self_eligible: Any = True,
+        spouse: Any = False,
+        dependents_count: Any = 0,
+        senior_count: Any = 0,
+        disabled_count: Any = 0,
+        female_householder: Any = False,
+        single_parent: Any = False,
+        extra_income_deductions: Any = 0,
+        extra_tax_credits: Any = 0,
+        use_standard_tax_credit: Any = True,
+        prepaid_tax: Any = 0,
+    ) -> BatchCalcInputs:
+        """
+        gross_salary 길이에 맞춰 나머지 컬럼을 broadcast.
+        스칼라를 주면 전원 동일 값, 배열을 주면 그대로 사용.
+        """
+        gross = np.asarray(gross_salary, dtype=np.int64)
+        if gross.ndim != 1:
+            raise ValueError("gross_salary 는 1차원 배열이어야 합니다.")
+        n = gross.shape[0]
+
+        def _col(value: Any, dtype: type, name: str) -> np.ndarray:
+            arr = np.asarray(value, dtype=dtype)
+            if arr.ndim == 0:
+                return np.full(n, arr, dtype=dtype)
+            if arr.shape != (n,):
+                raise ValueError(
+                    f"{name} 길이 mismatch: gross_salary {n} / {name} {arr.shape}"
+                )
+            return arr
+
+        return cls(
+            gross_salary=gross,
+            self_eligible=_col(self_eligible, np.bool_, "self_eligible"),
+            spouse=_col(spouse, np.bool_, "spouse"),
+            dependents_count=_col(dependents_count, np.int64, "dependents_count"),
+            senior_count=_col(senior_count, np.int64, "senior_count"),
+            disabled_count=_col(disabled_count, np.int64, "disabled_count"),
+            female_householder=_col(
+                female_householder, np.bool_, "female_householder"
+            ),
+            single_parent=_col(single_parent, np.bool_, "single_parent"),
+            extra_income_deductions=_col(
+                extra_income_deductions, np.int64, "extra_income_deductions"
+            ),
+            extra_tax_credits=_col(
+                extra_tax_credits, np.int64, "extra_tax_credits"
+            ),
+            use_standard_tax_credit=_col(
+                use_standard_tax_credit, np.bool_, "use_standard_tax_credit"
+            ),
+            prepaid_tax=_col(prepaid_tax, np.int64, "prepaid_tax"),
+        )
+
+    @classmethod
+    def from_inputs(cls, items: Sequence[CalcInputs]) -> BatchCalcInputs:
+        """CalcInputs 리스트 → 컬럼. itemized 가 있는 행은 거부."""
+        for i, it in enumerate(items):
+            if it.itemized is not None:
+                raise ValueError(
+                    f"{i}번째 입력에 itemized 가 있습니다. batch 경로는 extra_tax_credits 합산값만 지원합니다."
+                )
+        return cls.from_columns(
+            [it.gross_salary for it in items],
+            self_eligible=[it.dependents.self_eligible for it in items],
+            spouse=[it.dependents.spouse for it in items],
+            dependents_count=[it.dependents.dependents_count for it in items],
+            senior_count=[it.dependents.senior_count for it in items],
+            disabled_count=[it.dependents.disabled_count for it in items],
+            female_householder=[it.dependents.female_householder for it in items],
+            single_parent=[it.dependents.single_parent for it in items],
+            extra_income_deductions=[it.extra_income_deductions for it in items],
+            extra_tax_credits=[it.extra_tax_credits for it in items],
+            use_standard_tax_credit=[it.use_standard_tax_credit for it in items],
+            prepaid_tax=[it.prepaid_tax for it in items],
+        )
+
+
+@dataclass
+class BatchCalcResult:
+    """CalcResult 의 컬럼 버전 (steps / itemized_breakdown 없음)."""
+
+    earned_income_deduction: np.ndarray
+    earned_income_amount: np.ndarray
+    personal_deduction: np.ndarray
+    taxable_income: np.ndarray
+    calculated_tax: np.ndarray
+    earned_income_tax_credit: np.ndarray
+    standard_tax_credit: np.ndarray
+    extra_tax_credits: np.ndarray
+    determined_tax: np.ndarray
+    local_income_tax: np.ndarray
+    total_tax: np.ndarray
+    prepaid_tax: np.ndarray
+    refund_or_owed: np.ndarray
+    year: int = 2025
+
+    def __len__(self) -> int:
+        return int(self.total_tax.shape[0])
+
+    def row(self, i: int) -> dict[str, int]:
+        """i 번째 사람의 결과를 CalcResult 필드명 dict 로."""
+        return {
+            f.name: int(getattr(self, f.name)[i])
+            for f in fields(self)
+            if f.name != "year"
+        }
+
+
+# -------------------- 구간 lookup --------------------
+
+
+def _apply_brackets(x: np.ndarray, bt: BracketTable) -> np.ndarray:
+    """BracketTable.apply 의 벡터 버전. 'x <= upper' 첫 매칭 → searchsorted(side='left')."""
+    idx = np.searchsorted(np.asarray(bt.uppers), x, side="left")
+    bases = np.asarray(bt.bases, dtype=np.int64)[idx]
+    fixeds = np.asarray(bt.fixeds, dtype=np.int64)[idx]
+    rates = np.asarray(bt.rates, dtype=np.float64)[idx]
+    return fixeds + np.rint((x - bases) * rates).astype(np.int64)
+
+
+def _apply_caps(gross: np.ndarray, ct: CapTable) -> np.ndarray:
+    """CapTable.apply 의 벡터 버전."""
+    idx = np.searchsorted(np.asarray(ct.uppers), gross, side="left")
+    out = np.zeros(gross.shape[0], dtype=np.int64)
+    for i, fixed in enumerate(ct.fixed_caps):
+        mask = idx == i
+        if not mask.any():
+            continue
+        if fixed is not None:
+            out[mask] = fixed
+            continue
+        excess = gross[mask] - ct.excess_bases[i]
+        deducted = ct.cap_maxes[i] - np.rint(
+            excess * ct.deduct_rates[i]
+        ).astype(np.int64)
+        out[mask] = np.maximum(deducted, ct.cap_mins[i])
+    return out
+
+
+# -------------------- 통합 함수 --------------------
+
+
+def calculate_batch(
+    inputs: BatchCalcInputs, year: int = 2025, table_path: str | None = None
+) -> BatchCalcResult:
+    """
+    컬럼 입력 → 컬럼 결과. 각 행은 scalar calculate() 와 원 단위 동일.
+    """
+    table = load_tax_table(year=year, path=table_path)
+    g = inputs.gross_salary
+
+    # 1) 근로소득공제
+    eid = _apply_brackets(g, table.earned_income_deduction)
+    eid = np.where(
+        g <= 0, 0, np.minimum(eid, table.earned_income_deduction_cap)
+    )
+    earned_income_amount = np.maximum(0, g - eid)
+
+    # 2) 인적공제 (한부모 우선, 부녀자 무시)
+    pd_cfg = table.personal_deduction
+    pd_total = (
+        np.where(inputs.self_eligible, pd_cfg.basic_self, 0)
+        + np.where(inputs.spouse, pd_cfg.basic_spouse, 0)
+        + pd_cfg.basic_dependent * np.maximum(inputs.dependents_count, 0)
+        + pd_cfg.senior * np.maximum(inputs.senior_count, 0)
+        + pd_cfg.disabled * np.maximum(inputs.disabled_count, 0)
+        + np.where(
+            inputs.single_parent,
+            pd_cfg.single_parent,
+            np.where(inputs.female_householder, pd_cfg.female_householder, 0),
+        )
+    ).astype(np.int64)
+
+    # 3) 과세표준
+    taxable_income = np.maximum(
+        0, earned_income_amount - pd_total - inputs.extra_income_deductions
+    )
+
+    # 4) 산출세액
+    calculated_tax = _apply_brackets(taxable_income, table.progressive_tax)
+    calculated_tax = np.where(taxable_income <= 0, 0, calculated_tax)
+
+    # 5) 근로소득세액공제 (비율 → 총급여 기준 한도)
+    raw_credit = _apply_brackets(calculated_tax, table.earned_income_tax_credit)
+    cap = _apply_caps(g, table.earned_income_tax_credit_cap)
+    eitc = np.where(calculated_tax <= 0, 0, np.minimum(raw_credit, cap))
+
+    # 6) 표준세액공제
+    standard_credit = np.where(
+        inputs.use_standard_tax_credit, table.standard_tax_credit, 0
+    ).astype(np.int64)
+
+    # 7) 외부 세액공제 (합산값)
+    extra = inputs.extra_tax_credits
+
+    # 8) 결정세액
+    determined_tax = np.maximum(
+        0, calculated_tax - eitc - standard_credit - extra
+    )
+
+    # 9) 지방소득세 + 환급
+    local_rate = table.local_income_tax_rate
+    local_tax = np.rint(determined_tax * local_rate).astype(np.int64)
+    total_tax = determined_tax + local_tax
+    refund = inputs.prepaid_tax - total_tax
+
+    return BatchCalcResult(
+        earned_income_deduction=eid.astype(np.int64),
+        earned_income_amount=earned_income_amount.astype(np.int64),
+        personal_deduction=pd_total,
+        taxable_income=taxable_income.astype(np.int64),
+        calculated_tax=calculated_tax.astype(np.int64),
+        earned_income_tax_credit=eitc.astype(np.int64),
+        standard_tax_credit=standard_credit,
+        extra_tax_credits=extra.astype(np.int64),
+        determined_tax=determined_tax.astype(np.int64),
+        local_income_tax=local_tax,
+        total_tax=total_tax.astype(np.int64),
+        prepaid_tax=inputs.prepaid_tax.astype(np.int64),
+        refund_or_owed=refund.astype(np.int64),
+        year=table.year or year,
+    )
@@ -20,10 +20,18 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
+import math
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
+
+from pydantic import BaseModel
 
 from app.schemas.tax_calculator_schema import (
     CalcInputs,
@@ -32,66 +40,437 @@ from app.schemas.tax_calculator_schema import (
     DependentsInput,
     ItemizedDeductions,
 )
+from app.services.result_cache import CacheStats, ResultCache
+
+TAX_TABLES_DIR = Path(__file__).resolve().parent.parent / "data" / "tax_tables"
+DEFAULT_TABLE_PATH = TAX_TABLES_DIR / "2025.json"
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------- 컴파일된 세율표 ----------------
+#
+# JSON 세율표를 로드 시점에 1회 컴파일. 단계 함수는 문자열 key dict 탐색 없이
+# slots 필드 + bisect 로만 구간을 찾는다. upper=None(마지막 구간)은 +inf.
+
+
+@dataclass(frozen=True, slots=True)
+class BracketTable:
+    """정렬된 upper 배열 + 구간별 (base, fixed, rate). 값 = fixed + (x-base)×rate."""
+
+    uppers: tuple[float, ...]
+    bases: tuple[int, ...]
+    fixeds: tuple[int, ...]
+    rates: tuple[float, ...]
+
+    def index(self, x: int) -> int:
+        """'upper is None or x <= upper' 를 만족하는 첫 구간."""
+        return bisect_left(self.uppers, x)
+
+    def apply(self, x: int) -> int:
+        i = bisect_left(self.uppers, x)
+        return self.fixeds[i] + int(round((x - self.bases[i]) * self.rates[i]))
+
+
+@dataclass(frozen=True, slots=True)
+class CapTable:
+    """근로세액공제 총급여 기준 한도. 구간별 고정 cap 또는 (cap_max - 초과분×비율, min cap_min)."""
+
+    uppers: tuple[float, ...]
+    fixed_caps: tuple[int | None, ...]
+    cap_maxes: tuple[int, ...]
+    cap_mins: tuple[int, ...]
+    deduct_rates: tuple[float, ...]
+    excess_bases: tuple[int, ...]
+
+    def apply(self, gross_salary: int) -> int:
+        i = bisect_left(self.uppers, gross_salary)
+        fixed = self.fixed_caps[i]
+        if fixed is not None:
+            return fixed
+        excess = gross_salary - self.excess_bases[i]
+        deducted = self.cap_maxes[i] - int(round(excess * self.deduct_rates[i]))
+        return max(deducted, self.cap_mins[i])
+
+
+@dataclass(frozen=True, slots=True)
+class PersonalDeductionTable:
+    basic_self: int
+    basic_spouse: int
+    basic_dependent: int
+    senior: int
+    disabled: int
+    female_householder: int
+    single_parent: int
+
+
+@dataclass(frozen=True, slots=True)
+class ChildCreditTable:
+    first_or_second_per_child: int
+    additional_per_child: int
+    newborn_first: int
+    newborn_second: int
+    newborn_third_or_more: int
+
+
+@dataclass(frozen=True, slots=True)
+class MedicalCreditTable:
+    threshold_pct_of_gross: float
+    rate: float
+    general_dependents_cap: int
+
+
+@dataclass(frozen=True, slots=True)
+class DonationCreditTable:
+    political_low_threshold: int
+    political_low_rate: float
+    political_mid_threshold: int
+    political_mid_rate: float
+    political_high_rate: float
+    general_rate_low: float
+    general_rate_high: float
+    general_high_threshold: int
+    general_cap_pct_of_earned_income: float
+
+
+@dataclass(frozen=True, slots=True)
+class LegalAnchors:
+    earned_income_deduction: str
+    progressive_tax: str
+    basic_personal_deduction: str
+    additional_personal_deduction: str
+    earned_income_tax_credit: str
+    standard_tax_credit: str
+    local_income_tax: str
+
+
+@dataclass(frozen=True, slots=True)
+class TaxTable:
+    """
+    `tax_tables/{year}.json` 의 컴파일 결과.
+    raw 는 원본 dict — `table["..."]` 형태의 기존 접근(디버그/테스트)을 위해 유지.
+    version 은 raw 의 내용 해시 — 세율표가 바뀌면 결과 캐시 key 도 바뀜.
+    """
 
-DEFAULT_TABLE_PATH = (
-    Path(__file__).resolve().parent.parent / "data" / "tax_tables" / "2025.json"
-)
+    year: int
+    anchors: LegalAnchors
+    earned_income_deduction: BracketTable
+    earned_income_deduction_cap: int
+    progressive_tax: BracketTable
+    personal_deduction: PersonalDeductionTable
+    earned_income_tax_credit: BracketTable
+    earned_income_tax_credit_cap: CapTable
+    standard_tax_credit: int
+    local_income_tax_rate: float
+    child_tax_credit: ChildCreditTable
+    medical_credit: MedicalCreditTable
+    donation_credit: DonationCreditTable
+    version: str
+    raw: dict[str, Any]
+
+    def __getitem__(self, key: str) -> Any:
+        return self.raw[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.raw.get(key, default)
+
+
+def _upper(value: int | None) -> float:
+    return math.inf if value is None else value
+
+
+def _compile_brackets(
+    brackets: list[dict[str, Any]], upper_key: str
+) -> BracketTable:
+    uppers = tuple(_upper(b[upper_key]) for b in brackets)
+    if list(uppers) != sorted(uppers) or uppers[-1] != math.inf:
+        raise ValueError(f"구간 upper 정렬/마지막 None 위반: {upper_key}")
+    return BracketTable(
+        uppers=uppers,
+        bases=tuple(int(b["base"]) for b in brackets),
+        fixeds=tuple(int(b["fixed"]) for b in brackets),
+        rates=tuple(float(b["rate"]) for b in brackets),
+    )
+
+
+def _compile_caps(cap_brackets: list[dict[str, Any]]) -> CapTable:
+    uppers = tuple(_upper(b["upper_gross"]) for b in cap_brackets)
+    if list(uppers) != sorted(uppers) or uppers[-1] != math.inf:
+        raise ValueError("근로세액공제 한도 구간 정렬/마지막 None 위반")
+    return CapTable(
+        uppers=uppers,
+        fixed_caps=tuple(
+            int(b["cap"]) if "cap" in b else None for b in cap_brackets
+        ),
+        cap_maxes=tuple(int(b.get("cap_max", 0)) for b in cap_brackets),
+        cap_mins=tuple(int(b.get("cap_min", 0)) for b in cap_brackets),
+        deduct_rates=tuple(
+            float(b.get("deduct_per_excess", 0.0)) for b in cap_brackets
+        ),
+        excess_bases=tuple(int(b.get("excess_base", 0)) for b in cap_brackets),
+    )
+
+
+def _table_version(data: dict[str, Any]) -> str:
+    canonical = json.dumps(data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def compile_tax_table(data: dict[str, Any]) -> TaxTable:
+    """세율표 JSON dict → TaxTable. 구간 정렬/필수 키 누락은 여기서 바로 실패."""
+    anchors = data["legal_anchors"]
+    eid = data["earned_income_deduction"]
+    eitc = data["earned_income_tax_credit"]
+    personal = data["personal_deduction"]
+    itemized = data["itemized"]
+    child = itemized["child_tax_credit"]
+    medical = itemized["medical_credit"]
+    political = itemized["donation_credit"]["political"]
+    general = itemized["donation_credit"]["general"]
+
+    return TaxTable(
+        year=int(data.get("year", 0)),
+        anchors=LegalAnchors(
+            earned_income_deduction=anchors["earned_income_deduction"],
+            progressive_tax=anchors["progressive_tax"],
+            basic_personal_deduction=anchors["basic_personal_deduction"],
+            additional_personal_deduction=anchors["additional_personal_deduction"],
+            earned_income_tax_credit=anchors["earned_income_tax_credit"],
+            standard_tax_credit=anchors["standard_tax_credit"],
+            local_income_tax=anchors["local_income_tax"],
+        ),
+        earned_income_deduction=_compile_brackets(eid["brackets"], "upper"),
+        earned_income_deduction_cap=int(eid["cap"]),
+        progressive_tax=_compile_brackets(
+            data["progressive_tax"]["brackets"], "upper"
+        ),
+        personal_deduction=PersonalDeductionTable(
+            basic_self=int(personal["basic"]["self"]),
+            basic_spouse=int(personal["basic"]["spouse"]),
+            basic_dependent=int(personal["basic"]["dependent"]),
+            senior=int(personal["additional"]["senior"]),
+            disabled=int(personal["additional"]["disabled"]),
+            female_householder=int(personal["additional"]["female_householder"]),
+            single_parent=int(personal["additional"]["single_parent"]),
+        ),
+        earned_income_tax_credit=_compile_brackets(
+            eitc["rate_brackets"], "upper_calculated_tax"
+        ),
+        earned_income_tax_credit_cap=_compile_caps(eitc["cap_by_gross"]),
+        standard_tax_credit=int(data["standard_tax_credit"]["amount"]),
+        local_income_tax_rate=float(data["local_income_tax"]["rate"]),
+        child_tax_credit=ChildCreditTable(
+            first_or_second_per_child=int(child["first_or_second_per_child"]),
+            additional_per_child=int(child["additional_per_child"]),
+            newborn_first=int(child["newborn"]["first"]),
+            newborn_second=int(child["newborn"]["second"]),
+            newborn_third_or_more=int(child["newborn"]["third_or_more"]),
+        ),
+        medical_credit=MedicalCreditTable(
+            threshold_pct_of_gross=float(medical["threshold_pct_of_gross"]),
+            rate=float(medical["rate"]),
+            general_dependents_cap=int(medical["general_dependents_cap"]),
+        ),
+        donation_credit=DonationCreditTable(
+            political_low_threshold=int(political["low_threshold"]),
+            political_low_rate=float(political["low_rate"]),
+            political_mid_threshold=int(political["mid_threshold"]),
+            political_mid_rate=float(political["mid_rate"]),
+            political_high_rate=float(political["high_rate"]),
+            general_rate_low=float(general["rate_low"]),
+            general_rate_high=float(general["rate_high"]),
+            general_high_threshold=int(general["high_threshold"]),
+            general_cap_pct_of_earned_income=float(
+                general["cap_pct_of_earned_income"]
+            ),
+        ),
+        version=_table_version(data),
+        raw=data,
+    )
+
+
+# ---------------- 세율표 레지스트리 ----------------
+#
+# data/tax_tables/*.json 을 기동 시 전부 컴파일해 연도별로 보관.
+# 요청 경로는 dict 조회만 — JSON 파싱은 preload / 백그라운드 watcher 에서만.
+# 파일 mtime 이 바뀌면 새로 컴파일해 dict 통째로 교체(hot swap). 파싱/컴파일이
+# 실패한 파일은 직전 정상 테이블을 유지.
+
+
+class TaxTableRegistry:
+    """연도 → 컴파일된 TaxTable. preload + mtime polling 으로 hot reload."""
+
+    def __init__(
+        self, directory: Path = TAX_TABLES_DIR, poll_interval: float = 2.0
+    ) -> None:
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+        self._tables: dict[int, TaxTable] = {}
+        self._by_path: dict[Path, tuple[tuple[int, int], TaxTable]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ---- 로드 ----
+
+    def refresh(self) -> bool:
+        """디렉토리 재스캔. 바뀐 파일만 다시 컴파일. 변경이 있었으면 True."""
+        with self._lock:
+            by_path: dict[Path, tuple[tuple[int, int], TaxTable]] = {}
+            changed = False
+            for file_path in sorted(self.directory.glob("*.json")):
+                try:
+                    st = file_path.stat()
+                except FileNotFoundError:
+                    continue
+                sig = (st.st_mtime_ns, st.st_size)
+                prev = self._by_path.get(file_path)
+                if prev is not None and prev[0] == sig:
+                    by_path[file_path] = prev
+                    continue
+                try:
+                    with file_path.open("r", encoding="utf-8") as f:
+                        table = compile_tax_table(json.load(f))
+                except (OSError, ValueError, KeyError, TypeError):
+                    logger.exception("tax_table_load_failed path=%s", file_path)
+                    if prev is not None:
+                        by_path[file_path] = prev
+                    continue
+                by_path[file_path] = (sig, table)
+                changed = True
+                logger.info(
+                    "tax_table_loaded year=%s version=%s path=%s",
+                    table.year,
+                    table.version,
+                    file_path.name,
+                )
+            if set(by_path) != set(self._by_path):
+                changed = True
+
+            self._by_path = by_path
+            self._tables = self._pick_tables(by_path, warn=changed)
+            self._loaded = True
+            return changed
+
+    @staticmethod
+    def _pick_tables(
+        by_path: dict[Path, tuple[tuple[int, int], TaxTable]], *, warn: bool
+    ) -> dict[int, TaxTable]:
+        """
+        연도별 1개. 같은 year 를 선언한 파일이 여럿이면 디렉토리 순서와 무관하게
+        `{year}.json` 우선, 그다음 파일명 순 — 나머지는 무시하고 (변경 시에만) 경고.
+        """
+        by_year: dict[int, list[tuple[Path, TaxTable]]] = {}
+        for path, (_, table) in by_path.items():
+            by_year.setdefault(table.year, []).append((path, table))
+        tables: dict[int, TaxTable] = {}
+        for year, entries in by_year.items():
+            entries.sort(key=lambda e: (e[0].stem != str(year), e[0].name))
+            tables[year] = entries[0][1]
+            if warn and len(entries) > 1:
+                logger.warning(
+                    "tax_table_duplicate_year year=%s using=%s ignored=%s",
+                    year,
+                    entries[0][0].name,
+                    ",".join(p.name for p, _ in entries[1:]),
+                )
+        return tables
+
+    def _ensure_loaded(self) -> dict[int, TaxTable]:
+        # lifespan 밖(테스트/스크립트) 첫 호출만 동기 로드
+        if not self._loaded:
+            self.refresh()
+        return self._tables
+
+    # ---- 조회 ----
+
+    def years(self) -> list[int]:
+        return sorted(self._ensure_loaded())
+
+    def get(self, year: int) -> TaxTable:
+        """정확히 해당 연도의 세율표. 없으면 ValueError."""
+        tables = self._ensure_loaded()
+        table = tables.get(year)
+        if table is None:
+            raise ValueError(
+                f"세율표 없음: {year}년 (보유: {sorted(tables)})"
+            )
+        return table
+
+    def resolve_year(self, year: int) -> int:
+        """year 이하 중 가장 최근 세율표 연도. 미래 연도는 최신 세율표로 대체."""
+        candidates = [y for y in self._ensure_loaded() if y <= year]
+        if not candidates:
+            raise ValueError(f"{year}년 이전 세율표가 없습니다.")
+        return max(candidates)
+
+    # ---- watcher ----
+
+    def start(self) -> None:
+        """preload + 백그라운드 mtime polling 시작 (중복 호출 무시)."""
+        self.refresh()
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name="tax-table-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval + 1)
+            self._thread = None
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("tax_table_watch_failed")
+
+
+table_registry = TaxTableRegistry()
 
 
 @lru_cache(maxsize=4)
-def load_tax_table(year: int = 2025, path: str | None = None) -> dict[str, Any]:
-    """세율표 캐시 로드. path 인자가 있으면 그 경로 우선."""
-    file_path = Path(path) if path else DEFAULT_TABLE_PATH
-    with file_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    if data.get("year") != year and path is None:
-        raise ValueError(f"세율표 연도 mismatch: 요청 {year}, 파일 {data.get('year')}")
-    return data
+def _load_table_file(path: str) -> TaxTable:
+    with Path(path).open("r", encoding="utf-8") as f:
+        return compile_tax_table(json.load(f))
+
+
+def load_tax_table(year: int = 2025, path: str | None = None) -> TaxTable:
+    """
+    컴파일된 세율표. path 인자가 있으면 그 파일(캐시), 없으면 레지스트리의
+    해당 연도 테이블 (hot reload 반영).
+    """
+    if path:
+        return _load_table_file(path)
+    return table_registry.get(year)
 
 
 # ---------------- 단계별 함수 ----------------
 
 
-def earned_income_deduction(gross_salary: int, table: dict[str, Any]) -> int:
+def earned_income_deduction(gross_salary: int, table: TaxTable) -> int:
     """근로소득공제 (소득세법 §47)."""
-    cfg = table["earned_income_deduction"]
-    cap = cfg["cap"]
-
     if gross_salary <= 0:
         return 0
-
-    for bracket in cfg["brackets"]:
-        upper = bracket["upper"]
-        if upper is None or gross_salary <= upper:
-            base = bracket["base"]
-            fixed = bracket["fixed"]
-            rate = bracket["rate"]
-            deduction = fixed + int(round((gross_salary - base) * rate))
-            return min(deduction, cap)
-
-    raise ValueError("근로소득공제 구간 매칭 실패")
+    deduction = table.earned_income_deduction.apply(gross_salary)
+    return min(deduction, table.earned_income_deduction_cap)
 
 
-def progressive_tax(taxable_income: int, table: dict[str, Any]) -> int:
+def progressive_tax(taxable_income: int, table: TaxTable) -> int:
     """종합소득세율 적용 (소득세법 §55)."""
-    cfg = table["progressive_tax"]
-
     if taxable_income <= 0:
         return 0
-
-    for bracket in cfg["brackets"]:
-        upper = bracket["upper"]
-        if upper is None or taxable_income <= upper:
-            base = bracket["base"]
-            fixed = bracket["fixed"]
-            rate = bracket["rate"]
-            return fixed + int(round((taxable_income - base) * rate))
-
-    raise ValueError("종합소득세율 구간 매칭 실패")
+    return table.progressive_tax.apply(taxable_income)
 
 
 def personal_deduction(
-    deps: DependentsInput, table: dict[str, Any]
+    deps: DependentsInput, table: TaxTable
 ) -> tuple[int, dict[str, int]]:
     """
     인적공제 합계 + 항목별 breakdown.
@@ -99,33 +478,27 @@ def personal_deduction(
     - 추가: 경로(100만)/장애인(200만)/한부모(100만)/부녀자(50만)
     - 한부모와 부녀자는 동시 적용 불가 — 한부모 우선.
     """
-    cfg = table["personal_deduction"]
-    basic = cfg["basic"]
-    additional = cfg["additional"]
+    cfg = table.personal_deduction
 
     breakdown: dict[str, int] = {}
 
     if deps.self_eligible:
-        breakdown["basic_self"] = basic["self"]
+        breakdown["basic_self"] = cfg.basic_self
     if deps.spouse:
-        breakdown["basic_spouse"] = basic["spouse"]
+        breakdown["basic_spouse"] = cfg.basic_spouse
     if deps.dependents_count > 0:
-        breakdown["basic_dependents"] = basic["dependent"] * deps.dependents_count
+        breakdown["basic_dependents"] = cfg.basic_dependent * deps.dependents_count
 
     if deps.senior_count > 0:
-        breakdown["additional_senior"] = additional["senior"] * deps.senior_count
+        breakdown["additional_senior"] = cfg.senior * deps.senior_count
     if deps.disabled_count > 0:
-        breakdown["additional_disabled"] = (
-            additional["disabled"] * deps.disabled_count
-        )
+        breakdown["additional_disabled"] = cfg.disabled * deps.disabled_count
 
     if deps.single_parent:
         # 한부모 우선, 부녀자 무시
-        breakdown["additional_single_parent"] = additional["single_parent"]
+        breakdown["additional_single_parent"] = cfg.single_parent
     elif deps.female_householder:
-        breakdown["additional_female_householder"] = additional[
-            "female_householder"
-        ]
+        breakdown["additional_female_householder"] = cfg.female_householder
 
     return sum(breakdown.values()), breakdown
 
@@ -133,7 +506,7 @@ def personal_deduction(
 def earned_income_tax_credit(
     calculated_tax: int,
     gross_salary: int,
-    table: dict[str, Any],
+    table: TaxTable,
 ) -> int:
     """
     근로소득세액공제 (소득세법 §59).
@@ -143,74 +516,48 @@ def earned_income_tax_credit(
     if calculated_tax <= 0:
         return 0
 
-    cfg = table["earned_income_tax_credit"]
-
     # 1) 비율 계산
-    raw_credit = 0
-    for b in cfg["rate_brackets"]:
-        upper = b["upper_calculated_tax"]
-        if upper is None or calculated_tax <= upper:
-            raw_credit = b["fixed"] + int(
-                round((calculated_tax - b["base"]) * b["rate"])
-            )
-            break
+    raw_credit = table.earned_income_tax_credit.apply(calculated_tax)
 
     # 2) 한도
-    cap = _cap_for_gross(gross_salary, cfg["cap_by_gross"])
+    cap = table.earned_income_tax_credit_cap.apply(gross_salary)
     return min(raw_credit, cap)
 
 
-def _cap_for_gross(gross_salary: int, cap_brackets: list[dict[str, Any]]) -> int:
-    for b in cap_brackets:
-        upper = b["upper_gross"]
-        if upper is not None and gross_salary > upper:
-            continue
-        # 매칭된 구간
-        if "cap" in b:
-            return int(b["cap"])
-        cap_max = b["cap_max"]
-        cap_min = b["cap_min"]
-        excess = gross_salary - b["excess_base"]
-        deducted = cap_max - int(round(excess * b["deduct_per_excess"]))
-        return max(deducted, cap_min)
-    raise ValueError("근로세액공제 한도 구간 매칭 실패")
-
-
 # ---------------- Tier 3-3: 항목별 정밀 산식 ----------------
 
 
 def _child_tax_credit(
-    child_count: int, newborn_count: int, table: dict[str, Any]
+    child_count: int, newborn_count: int, table: TaxTable
 ) -> int:
     """
     자녀세액공제 (소득세법 §59의2).
     - 1명: 15만, 2명: 30만, 3명 이상: 30만 + (n-2) × 30만
     - 출산·입양: 첫째 30만 / 둘째 50만 / 셋째 이상 70만
     """
-    cfg = table["itemized"]["child_tax_credit"]
+    cfg = table.child_tax_credit
     out = 0
 
     if child_count >= 1:
-        out += cfg["first_or_second_per_child"]
+        out += cfg.first_or_second_per_child
     if child_count >= 2:
-        out += cfg["first_or_second_per_child"]
+        out += cfg.first_or_second_per_child
     if child_count >= 3:
-        out += (child_count - 2) * cfg["additional_per_child"]
+        out += (child_count - 2) * cfg.additional_per_child
 
-    nb = cfg["newborn"]
     for n in range(1, newborn_count + 1):
         if n == 1:
-            out += nb["first"]
+            out += cfg.newborn_first
         elif n == 2:
-            out += nb["second"]
+            out += cfg.newborn_second
         else:
-            out += nb["third_or_more"]
+            out += cfg.newborn_third_or_more
 
     return out
 
 
 def _medical_credit(
-    items: ItemizedDeductions, gross_salary: int, table: dict[str, Any]
+    items: ItemizedDeductions, gross_salary: int, table: TaxTable
 ) -> int:
     """
     의료비 세액공제 (소득세법 §59의4 ②).
@@ -218,11 +565,10 @@ def _medical_credit(
     - 일반 부양가족 의료비는 700만 한도 적용
     - 난임/미숙아 차등 비율은 v1 (현재 모두 15%)
     """
-    cfg = table["itemized"]["medical_credit"]
-    threshold = int(gross_salary * cfg["threshold_pct_of_gross"])
-    cap_general = cfg["general_dependents_cap"]
+    cfg = table.medical_credit
+    threshold = int(gross_salary * cfg.threshold_pct_of_gross)
 
-    capped_general = min(items.medical_general, cap_general)
+    capped_general = min(items.medical_general, cfg.general_dependents_cap)
     total = (
         items.medical_self_etc
         + capped_general
@@ -234,51 +580,49 @@ def _medical_credit(
     if excess <= 0:
         return 0
 
-    return int(round(excess * cfg["rate"]))
+    return int(round(excess * cfg.rate))
 
 
 def _donation_credit(
     items: ItemizedDeductions,
     earned_income_amount: int,
-    table: dict[str, Any],
+    table: TaxTable,
 ) -> int:
     """
     기부금 세액공제 (조세특례제한법 §76 / 소득세법 §59의4 ④).
     - 정치자금: 10만 이하 100%, 10만~3000만 15%, 3000만 초과 25%
     - 일반(법정+지정): 1000만 이하 15%, 초과분 30%. 한도 근로소득금액 × 30%.
     """
-    cfg = table["itemized"]["donation_credit"]
-    pol_cfg = cfg["political"]
-    gen_cfg = cfg["general"]
+    cfg = table.donation_credit
 
     out = 0
 
     # 정치자금
     p = items.donation_political
     if p > 0:
-        low = pol_cfg["low_threshold"]
-        mid = pol_cfg["mid_threshold"]
+        low = cfg.political_low_threshold
+        mid = cfg.political_mid_threshold
         if p <= low:
-            out += int(round(p * pol_cfg["low_rate"]))
+            out += int(round(p * cfg.political_low_rate))
         elif p <= mid:
-            out += int(round(low * pol_cfg["low_rate"]))
-            out += int(round((p - low) * pol_cfg["mid_rate"]))
+            out += int(round(low * cfg.political_low_rate))
+            out += int(round((p - low) * cfg.political_mid_rate))
         else:
-            out += int(round(low * pol_cfg["low_rate"]))
-            out += int(round((mid - low) * pol_cfg["mid_rate"]))
-            out += int(round((p - mid) * pol_cfg["high_rate"]))
+            out += int(round(low * cfg.political_low_rate))
+            out += int(round((mid - low) * cfg.political_mid_rate))
+            out += int(round((p - mid) * cfg.political_high_rate))
 
     # 일반 (법정/지정 모두 — 한도 근로소득금액 × 30%)
     g = items.donation_general
     if g > 0:
-        cap = int(earned_income_amount * gen_cfg["cap_pct_of_earned_income"])
+        cap = int(earned_income_amount * cfg.general_cap_pct_of_earned_income)
         capped = min(g, cap)
-        high_th = gen_cfg["high_threshold"]
+        high_th = cfg.general_high_threshold
         if capped <= high_th:
-            out += int(round(capped * gen_cfg["rate_low"]))
+            out += int(round(capped * cfg.general_rate_low))
         else:
-            out += int(round(high_th * gen_cfg["rate_low"]))
-            out += int(round((capped - high_th) * gen_cfg["rate_high"]))
+            out += int(round(high_th * cfg.general_rate_low))
+            out += int(round((capped - high_th) * cfg.general_rate_high))
 
     return out
 
@@ -288,7 +632,7 @@ def compute_itemized(
     *,
     gross_salary: int,
     earned_income_amount: int,
-    table: dict[str, Any],
+    table: TaxTable,
 ) -> tuple[int, dict[str, int]]:
     """ItemizedDeductions → 총 세액공제 + 항목별 breakdown."""
     breakdown: dict[str, int] = {}
@@ -313,60 +657,203 @@ def compute_itemized(
 # ---------------- 통합 함수 ----------------
 
 
-def calculate(
-    inputs: CalcInputs, year: int = 2025, table_path: str | None = None
-) -> CalcResult:
+@dataclass(frozen=True, slots=True)
+class CalcTotals:
     """
-    풀 파이프라인. 각 단계 결과를 CalcStep 으로 기록한 CalcResult 반환.
+    provenance 없는 계산 결과 (CalcResult 의 숫자 필드만).
+    What-if 반복 평가(recommend/simulate)용 — CalcStep·Pydantic 생성 비용 없음.
     """
-    table = load_tax_table(year=year, path=table_path)
-    anchors = table["legal_anchors"]
-    steps: list[CalcStep] = []
+
+    earned_income_deduction: int
+    earned_income_amount: int
+    personal_deduction: int
+    taxable_income: int
+    calculated_tax: int
+    earned_income_tax_credit: int
+    standard_tax_credit: int
+    extra_tax_credits: int
+    determined_tax: int
+    local_income_tax: int
+    total_tax: int
+    prepaid_tax: int
+    refund_or_owed: int
+    itemized_breakdown: dict[str, int]
+    year: int
+
+    def to_result(self, steps: Sequence[CalcStep] | None = None) -> CalcResult:
+        """CalcResult 로 승격. steps 미지정 시 빈 trail (검증 생략 — 값은 이미 정수)."""
+        return CalcResult.model_construct(
+            earned_income_deduction=self.earned_income_deduction,
+            earned_income_amount=self.earned_income_amount,
+            personal_deduction=self.personal_deduction,
+            taxable_income=self.taxable_income,
+            calculated_tax=self.calculated_tax,
+            earned_income_tax_credit=self.earned_income_tax_credit,
+            standard_tax_credit=self.standard_tax_credit,
+            extra_tax_credits=self.extra_tax_credits,
+            determined_tax=self.determined_tax,
+            local_income_tax=self.local_income_tax,
+            total_tax=self.total_tax,
+            prepaid_tax=self.prepaid_tax,
+            refund_or_owed=self.refund_or_owed,
+            itemized_breakdown=dict(self.itemized_breakdown),
+            steps=tuple(steps) if steps is not None else (),
+            year=self.year,
+        )
+
+
+def _run_pipeline(
+    inputs: CalcInputs,
+    table: TaxTable,
+    year: int,
+    steps: list[CalcStep] | None,
+) -> CalcTotals:
+    """
+    단일 산식 구현. steps 가 None 이면 trail 을 만들지 않음 (fast path).
+    calculate / calculate_totals 가 공유 — 두 경로의 숫자는 항상 동일.
+    """
+    anchors = table.anchors
+    trace = steps is not None
 
     # 1) 근로소득공제
     eid = earned_income_deduction(inputs.gross_salary, table)
-    steps.append(
+    earned_income_amount = max(0, inputs.gross_salary - eid)
+
+    # 2) 인적공제
+    pd_total, pd_breakdown = personal_deduction(inputs.dependents, table)
+
+    # 3) 과세표준
+    taxable_income = max(
+        0,
+        earned_income_amount - pd_total - inputs.extra_income_deductions,
+    )
+
+    # 4) 산출세액
+    calculated_tax = progressive_tax(taxable_income, table)
+
+    # 5) 근로소득세액공제
+    eitc = earned_income_tax_credit(
+        calculated_tax, inputs.gross_salary, table
+    )
+
+    # 6) 표준세액공제
+    standard_credit = (
+        table.standard_tax_credit if inputs.use_standard_tax_credit else 0
+    )
+
+    # 7) 외부 세액공제 — itemized 우선, 없으면 extra_tax_credits 합산값
+    itemized_breakdown: dict[str, int] = {}
+    if inputs.itemized is not None:
+        effective_extra, itemized_breakdown = compute_itemized(
+            inputs.itemized,
+            gross_salary=inputs.gross_salary,
+            earned_income_amount=earned_income_amount,
+            table=table,
+        )
+    else:
+        effective_extra = inputs.extra_tax_credits
+
+    # 8) 결정세액 (국세분)
+    determined_tax = max(
+        0,
+        calculated_tax - eitc - standard_credit - effective_extra,
+    )
+
+    # 9) 지방소득세
+    local_rate = table.local_income_tax_rate
+    local_tax = int(round(determined_tax * local_rate))
+
+    total_tax = determined_tax + local_tax
+    refund = inputs.prepaid_tax - total_tax
+
+    if trace:
+        steps.extend(
+            _build_steps(
+                inputs,
+                anchors=anchors,
+                local_rate=local_rate,
+                eid=eid,
+                earned_income_amount=earned_income_amount,
+                pd_total=pd_total,
+                pd_breakdown=pd_breakdown,
+                taxable_income=taxable_income,
+                calculated_tax=calculated_tax,
+                eitc=eitc,
+                standard_credit=standard_credit,
+                effective_extra=effective_extra,
+                itemized_breakdown=itemized_breakdown,
+                determined_tax=determined_tax,
+                local_tax=local_tax,
+                total_tax=total_tax,
+                refund=refund,
+            )
+        )
+
+    return CalcTotals(
+        earned_income_deduction=eid,
+        earned_income_amount=earned_income_amount,
+        personal_deduction=pd_total,
+        taxable_income=taxable_income,
+        calculated_tax=calculated_tax,
+        earned_income_tax_credit=eitc,
+        standard_tax_credit=standard_credit,
+        extra_tax_credits=effective_extra,
+        determined_tax=determined_tax,
+        local_income_tax=local_tax,
+        total_tax=total_tax,
+        prepaid_tax=inputs.prepaid_tax,
+        refund_or_owed=refund,
+        itemized_breakdown=itemized_breakdown,
+        year=table.year or year,
+    )
+
+
+def _build_steps(
+    inputs: CalcInputs,
+    *,
+    anchors: LegalAnchors,
+    local_rate: float,
+    eid: int,
+    earned_income_amount: int,
+    pd_total: int,
+    pd_breakdown: dict[str, int],
+    taxable_income: int,
+    calculated_tax: int,
+    eitc: int,
+    standard_credit: int,
+    effective_extra: int,
+    itemized_breakdown: dict[str, int],
+    determined_tax: int,
+    local_tax: int,
+    total_tax: int,
+    refund: int,
+) -> list[CalcStep]:
+    """단계별 산출값 → CalcStep trail (Phase 3-1 Provenance)."""
+    steps: list[CalcStep] = [
         CalcStep(
             name="earned_income_deduction",
             label="근로소득공제",
-            legal_anchor=anchors["earned_income_deduction"],
+            legal_anchor=anchors.earned_income_deduction,
             formula="구간별 정액 + 초과분 비율, 한도 2,000만",
             inputs={"gross_salary": inputs.gross_salary},
             output=eid,
-        )
-    )
-
-    earned_income_amount = max(0, inputs.gross_salary - eid)
-    steps.append(
+        ),
         CalcStep(
             name="earned_income_amount",
             label="근로소득금액",
-            legal_anchor=anchors["earned_income_deduction"],
+            legal_anchor=anchors.earned_income_deduction,
             formula="총급여 - 근로소득공제",
             inputs={"gross_salary": inputs.gross_salary, "deduction": eid},
             output=earned_income_amount,
-        )
-    )
-
-    # 2) 인적공제
-    pd_total, pd_breakdown = personal_deduction(inputs.dependents, table)
-    steps.append(
+        ),
         CalcStep(
             name="personal_deduction",
             label="인적공제 (기본+추가)",
-            legal_anchor=anchors["basic_personal_deduction"],
+            legal_anchor=anchors.basic_personal_deduction,
             formula="본인 + 배우자 + 부양가족 + (경로/장애/한부모|부녀자)",
             inputs=pd_breakdown,
             output=pd_total,
-        )
-    )
-
-    # 3) 과세표준
-    taxable_income = max(
-        0,
-        earned_income_amount - pd_total - inputs.extra_income_deductions,
-    )
-    steps.append(
+        ),
         CalcStep(
             name="taxable_income",
             label="과세표준",
@@ -378,66 +865,37 @@ def calculate(
                 "extra_income_deductions": inputs.extra_income_deductions,
             },
             output=taxable_income,
-        )
-    )
-
-    # 4) 산출세액
-    calculated_tax = progressive_tax(taxable_income, table)
-    steps.append(
+        ),
         CalcStep(
             name="calculated_tax",
             label="산출세액",
-            legal_anchor=anchors["progressive_tax"],
+            legal_anchor=anchors.progressive_tax,
             formula="과세표준 구간별 정액 + 초과분 비율 (6%~45%)",
             inputs={"taxable_income": taxable_income},
             output=calculated_tax,
-        )
-    )
-
-    # 5) 근로소득세액공제
-    eitc = earned_income_tax_credit(
-        calculated_tax, inputs.gross_salary, table
-    )
-    steps.append(
+        ),
         CalcStep(
             name="earned_income_tax_credit",
             label="근로소득세액공제",
-            legal_anchor=anchors["earned_income_tax_credit"],
+            legal_anchor=anchors.earned_income_tax_credit,
             formula="산출세액 비율 (55% 또는 71.5만+30%) + 총급여 기준 한도",
             inputs={
                 "calculated_tax": calculated_tax,
                 "gross_salary": inputs.gross_salary,
             },
             output=eitc,
-        )
-    )
-
-    # 6) 표준세액공제
-    standard_credit = (
-        table["standard_tax_credit"]["amount"]
-        if inputs.use_standard_tax_credit
-        else 0
-    )
-    steps.append(
+        ),
         CalcStep(
             name="standard_tax_credit",
             label="표준세액공제",
-            legal_anchor=anchors["standard_tax_credit"],
+            legal_anchor=anchors.standard_tax_credit,
             formula="13만 (특별세액공제 미선택 시)" if standard_credit else "미적용",
             inputs={"applied": inputs.use_standard_tax_credit},
             output=standard_credit,
-        )
-    )
+        ),
+    ]
 
-    # 7) 외부 세액공제 — itemized 우선, 없으면 extra_tax_credits 합산값
-    itemized_breakdown: dict[str, int] = {}
     if inputs.itemized is not None:
-        effective_extra, itemized_breakdown = compute_itemized(
-            inputs.itemized,
-            gross_salary=inputs.gross_salary,
-            earned_income_amount=earned_income_amount,
-            table=table,
-        )
         steps.append(
             CalcStep(
                 name="itemized_tax_credits",
@@ -448,86 +906,135 @@ def calculate(
                 output=effective_extra,
             )
         )
-    else:
-        effective_extra = inputs.extra_tax_credits
-        if effective_extra:
-            steps.append(
-                CalcStep(
-                    name="extra_tax_credits",
-                    label="기타 세액공제 (외부 합산)",
-                    legal_anchor=None,
-                    formula="외부에서 합산해 전달된 값을 그대로 차감",
-                    inputs={"amount": effective_extra},
-                    output=effective_extra,
-                )
+    elif effective_extra:
+        steps.append(
+            CalcStep(
+                name="extra_tax_credits",
+                label="기타 세액공제 (외부 합산)",
+                legal_anchor=None,
+                formula="외부에서 합산해 전달된 값을 그대로 차감",
+                inputs={"amount": effective_extra},
+                output=effective_extra,
             )
-
-    # 8) 결정세액 (국세분)
-    determined_tax = max(
-        0,
-        calculated_tax - eitc - standard_credit - effective_extra,
-    )
-    steps.append(
-        CalcStep(
-            name="determined_tax",
-            label="결정세액 (국세)",
-            legal_anchor=None,
-            formula="산출세액 - (근로세액공제 + 표준세액공제 + 기타 세액공제), 0 이상",
-            inputs={
-                "calculated_tax": calculated_tax,
-                "earned_income_tax_credit": eitc,
-                "standard_tax_credit": standard_credit,
-                "extra_tax_credits": effective_extra,
-            },
-            output=determined_tax,
         )
-    )
 
-    # 9) 지방소득세
-    local_rate = table["local_income_tax"]["rate"]
-    local_tax = int(round(determined_tax * local_rate))
-    steps.append(
-        CalcStep(
-            name="local_income_tax",
-            label="지방소득세",
-            legal_anchor=anchors["local_income_tax"],
-            formula=f"결정세액 × {local_rate * 100:.0f}%",
-            inputs={"determined_tax": determined_tax},
-            output=local_tax,
-        )
+    steps.extend(
+        [
+            CalcStep(
+                name="determined_tax",
+                label="결정세액 (국세)",
+                legal_anchor=None,
+                formula="산출세액 - (근로세액공제 + 표준세액공제 + 기타 세액공제), 0 이상",
+                inputs={
+                    "calculated_tax": calculated_tax,
+                    "earned_income_tax_credit": eitc,
+                    "standard_tax_credit": standard_credit,
+                    "extra_tax_credits": effective_extra,
+                },
+                output=determined_tax,
+            ),
+            CalcStep(
+                name="local_income_tax",
+                label="지방소득세",
+                legal_anchor=anchors.local_income_tax,
+                formula=f"결정세액 × {local_rate * 100:.0f}%",
+                inputs={"determined_tax": determined_tax},
+                output=local_tax,
+            ),
+            CalcStep(
+                name="refund_or_owed",
+                label="환급/추징",
+                legal_anchor=None,
+                formula="기납부세액 - 총 부담세액 (양수=환급, 음수=추징)",
+                inputs={
+                    "prepaid_tax": inputs.prepaid_tax,
+                    "total_tax": total_tax,
+                },
+                output=refund,
+            ),
+        ]
     )
+    return steps
 
-    total_tax = determined_tax + local_tax
-    refund = inputs.prepaid_tax - total_tax
-    steps.append(
-        CalcStep(
-            name="refund_or_owed",
-            label="환급/추징",
-            legal_anchor=None,
-            formula="기납부세액 - 총 부담세액 (양수=환급, 음수=추징)",
-            inputs={
-                "prepaid_tax": inputs.prepaid_tax,
-                "total_tax": total_tax,
-            },
-            output=refund,
-        )
-    )
 
+def calculate_totals(
+    inputs: CalcInputs, year: int = 2025, table_path: str | None = None
+) -> CalcTotals:
+    """
+    provenance 없는 fast path. 숫자는 calculate() 와 동일하지만
+    CalcStep trail / CalcResult 모델을 만들지 않음.
+    """
+    table = load_tax_table(year=year, path=table_path)
+    return _run_pipeline(inputs, table, year, None)
+
+
+def calculate(
+    inputs: CalcInputs, year: int = 2025, table_path: str | None = None
+) -> CalcResult:
+    """
+    풀 파이프라인. 각 단계 결과를 CalcStep 으로 기록한 CalcResult 반환.
+    """
+    table = load_tax_table(year=year, path=table_path)
+    steps: list[CalcStep] = []
+    totals = _run_pipeline(inputs, table, year, steps)
     return CalcResult(
-        earned_income_deduction=eid,
-        earned_income_amount=earned_income_amount,
-        personal_deduction=pd_total,
-        taxable_income=taxable_income,
-        calculated_tax=calculated_tax,
-        earned_income_tax_credit=eitc,
-        standard_tax_credit=standard_credit,
-        extra_tax_credits=effective_extra,
-        determined_tax=determined_tax,
-        local_income_tax=local_tax,
-        total_tax=total_tax,
-        prepaid_tax=inputs.prepaid_tax,
-        refund_or_owed=refund,
-        itemized_breakdown=itemized_breakdown,
-        steps=steps,
-        year=table.get("year", year),
+        earned_income_deduction=totals.earned_income_deduction,
+        earned_income_amount=totals.earned_income_amount,
+        personal_deduction=totals.personal_deduction,
+        taxable_income=totals.taxable_income,
+        calculated_tax=totals.calculated_tax,
+        earned_income_tax_credit=totals.earned_income_tax_credit,
+        standard_tax_credit=totals.standard_tax_credit,
+        extra_tax_credits=totals.extra_tax_credits,
+        determined_tax=totals.determined_tax,
+        local_income_tax=totals.local_income_tax,
+        total_tax=totals.total_tax,
+        prepaid_tax=totals.prepaid_tax,
+        refund_or_owed=totals.refund_or_owed,
+        itemized_breakdown=totals.itemized_breakdown,
+        steps=tuple(steps),
+        year=totals.year,
+    )
+
+
+# ---------------- 결과 캐시 ----------------
+#
+# 같은 세션의 /analyze · /verify 가 동일 베이스라인을 반복 계산.
+# key = (CalcInputs 필드 값 tuple, year, 세율표 version, table_path).
+# CalcResult 는 frozen (steps tuple) → 저장본을 복사 없이 그대로 돌려줌.
+# 숫자만 필요한 호출자(recommend / simulate)는 calculate_totals 가 더 쌈.
+
+_RESULT_CACHE: ResultCache[CalcResult] = ResultCache(
+    maxsize=1024, ttl_seconds=600.0
+)
+
+
+def _model_key(model: BaseModel | None) -> tuple[Any, ...] | None:
+    """pydantic 모델 → 필드 값 tuple (중첩 모델 재귀). JSON 직렬화 / 해시 없이 hashable."""
+    if model is None:
+        return None
+    return tuple(
+        _model_key(v) if isinstance(v, BaseModel) else v
+        for v in model.__dict__.values()  # pydantic v2: 필드 값만, 정의 순서
     )
+
+
+def calculate_cached(
+    inputs: CalcInputs, year: int = 2025, table_path: str | None = None
+) -> CalcResult:
+    """calculate() 의 memoized 버전. 반환값은 공유되는 frozen CalcResult."""
+    table = load_tax_table(year=year, path=table_path)
+    key = (_model_key(inputs), year, table.version, table_path)
+    cached = _RESULT_CACHE.get(key)
+    if cached is None:
+        cached = calculate(inputs, year=year, table_path=table_path)
+        _RESULT_CACHE.put(key, cached)
+    return cached
+
+
+def calculate_cache_stats() -> CacheStats:
+    return _RESULT_CACHE.stats()
+
+
+def clear_calculate_cache() -> None:
+    _RESULT_CACHE.clear()
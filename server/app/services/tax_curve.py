@@ -0,0 +1,428 @@
+"""
+세액 파이프라인의 구간 선형(piecewise-linear) 해석.
+
+== 목적 ==
+"연금저축을 얼마 더 넣어야 환급이 X 가 되나", "이 급여에서 실효 한계세율은?"
+같은 what-if 질문을 calculate() 반복 호출(전수 bisection) 없이 구간 수 O(brackets)
+로 답함.
+
+== 흐름 ==
+입력 1개(x)를 변수로, 나머지는 CalcInputs 고정값으로 두고 각 단계를
+PiecewiseLinear(x) 로 합성:
+  총급여 → 근로소득공제(구간 + 한도 min) → 근로소득금액(max 0) → 과세표준(max 0)
+  → 산출세액(구간) → 근로세액공제(구간, 총급여 한도와 min) → 결정세액(max 0)
+  → ×(1 + 지방세율) → 환급 = 기납부 - 총 부담세액
+합성 시 breakpoint 는 (안쪽 함수 knot) ∪ (바깥 함수 knot 의 역상) 만 생김.
+
+== 원칙 ==
+- 세율표는 `load_tax_table` 의 컴파일된 BracketTable / CapTable 그대로 사용.
+- 곡선은 반올림 없는 실수 모델 — scalar calculate() 와는 단계별 int(round())
+  누적분(수 원) 만큼 차이날 수 있음. 역산 solver 는 해석해 근처에서
+  calculate_totals() 로 원 단위 보정.
+
+== 한계 ==
+- itemized(항목별 정밀 산식) 입력은 미지원 (tax_batch 와 동일).
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Callable, Literal, Sequence
+
+from app.schemas.tax_calculator_schema import CalcInputs
+from app.services.tax_calculator import (
+    BracketTable,
+    CapTable,
+    TaxTable,
+    calculate_totals,
+    load_tax_table,
+    personal_deduction,
+)
+
+CurveVariable = Literal[
+    "gross_salary", "extra_income_deductions", "extra_tax_credits"
+]
+CURVE_VARIABLES: tuple[str, ...] = (
+    "gross_salary",
+    "extra_income_deductions",
+    "extra_tax_credits",
+)
+# 역산 대상 — 늘릴수록 환급이 단조 증가하는 입력만
+SOLVABLE_VARIABLES: tuple[str, ...] = (
+    "extra_income_deductions",
+    "extra_tax_credits",
+)
+
+_SLOPE_EPS = 1e-9
+
+
+# -------------------- 구간 선형 함수 --------------------
+
+
+@dataclass(frozen=True, slots=True)
+class PiecewiseLinear:
+    """[xs[0], xs[-1]] 위의 연속 구간 선형 함수. knot 사이는 선형 보간."""
+
+    xs: tuple[float, ...]
+    ys: tuple[float, ...]
+
+    @classmethod
+    def constant(cls, lo: float, hi: float, value: float) -> PiecewiseLinear:
+        return cls((lo, hi), (value, value))
+
+    @classmethod
+    def identity(cls, lo: float, hi: float) -> PiecewiseLinear:
+        return cls((lo, hi), (lo, hi))
+
+    def __call__(self, x: float) -> float:
+        i = self._segment(x, side="right")
+        x0, x1 = self.xs[i], self.xs[i + 1]
+        y0, y1 = self.ys[i], self.ys[i + 1]
+        return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+
+    def _segment(self, x: float, side: str) -> int:
+        if side == "right":
+            i = bisect_right(self.xs, x) - 1
+        else:
+            i = bisect_left(self.xs, x) - 1
+        return min(max(i, 0), len(self.xs) - 2)
+
+    def slope(self, x: float, side: Literal["left", "right"] = "right") -> float:
+        """x 에서의 기울기. knot 위에서는 side 쪽 구간 기준."""
+        i = self._segment(x, side=side)
+        return (self.ys[i + 1] - self.ys[i]) / (self.xs[i + 1] - self.xs[i])
+
+    def knots(self) -> list[tuple[float, float]]:
+        return list(zip(self.xs, self.ys))
+
+    # ---- 합성 연산 ----
+
+    def map(
+        self, fn: Callable[[float], float], fn_knots: Sequence[float]
+    ) -> PiecewiseLinear:
+        """
+        fn ∘ self. fn 은 fn_knots 사이에서 선형이어야 함.
+        새 knot = 기존 knot ∪ {self(x) 가 fn_knot 을 가로지르는 x}.
+        """
+        xs: list[float] = []
+        inner: list[float] = []
+        for i in range(len(self.xs) - 1):
+            x0, x1 = self.xs[i], self.xs[i + 1]
+            y0, y1 = self.ys[i], self.ys[i + 1]
+            xs.append(x0)
+            inner.append(y0)
+            crossings = sorted(
+                ((k - y0) / (y1 - y0), k)
+                for k in fn_knots
+                if (y0 - k) * (y1 - k) < 0
+            )
+            for t, k in crossings:
+                xs.append(x0 + t * (x1 - x0))
+                inner.append(k)
+        xs.append(self.xs[-1])
+        inner.append(self.ys[-1])
+        return PiecewiseLinear(tuple(xs), tuple(fn(y) for y in inner)).simplify()
+
+    def _zip(
+        self,
+        other: PiecewiseLinear,
+        op: Callable[[float, float], float],
+        split_on_cross: bool,
+    ) -> PiecewiseLinear:
+        xs = sorted(set(self.xs) | set(other.xs))
+        if split_on_cross:
+            extra: list[float] = []
+            for x0, x1 in zip(xs, xs[1:]):
+                d0 = self(x0) - other(x0)
+                d1 = self(x1) - other(x1)
+                if d0 * d1 < 0:
+                    extra.append(x0 + (x1 - x0) * d0 / (d0 - d1))
+            xs = sorted(set(xs) | set(extra))
+        return PiecewiseLinear(
+            tuple(xs), tuple(op(self(x), other(x)) for x in xs)
+        ).simplify()
+
+    def __add__(self, other: PiecewiseLinear) -> PiecewiseLinear:
+        return self._zip(other, lambda a, b: a + b, split_on_cross=False)
+
+    def __sub__(self, other: PiecewiseLinear) -> PiecewiseLinear:
+        return self._zip(other, lambda a, b: a - b, split_on_cross=False)
+
+    def minimum(self, other: PiecewiseLinear) -> PiecewiseLinear:
+        return self._zip(other, min, split_on_cross=True)
+
+    def shift(self, c: float) -> PiecewiseLinear:
+        return PiecewiseLinear(self.xs, tuple(y + c for y in self.ys))
+
+    def scale(self, c: float) -> PiecewiseLinear:
+        return PiecewiseLinear(self.xs, tuple(y * c for y in self.ys))
+
+    def simplify(self) -> PiecewiseLinear:
+        """중복 x / 기울기가 같은 인접 구간의 중간 knot 제거."""
+        xs: list[float] = [self.xs[0]]
+        ys: list[float] = [self.ys[0]]
+        for x, y in zip(self.xs[1:], self.ys[1:]):
+            if x <= xs[-1]:
+                continue
+            if len(xs) >= 2:
+                s_prev = (ys[-1] - ys[-2]) / (xs[-1] - xs[-2])
+                s_new = (y - ys[-1]) / (x - xs[-1])
+                if abs(s_prev - s_new) <= _SLOPE_EPS:
+                    xs[-1], ys[-1] = x, y
+                    continue
+            xs.append(x)
+            ys.append(y)
+        if len(xs) == 1:
+            xs.append(self.xs[-1])
+            ys.append(self.ys[-1])
+        return PiecewiseLinear(tuple(xs), tuple(ys))
+
+
+# -------------------- 세율표 → 실수 모델 --------------------
+
+
+def _finite(uppers: Sequence[float]) -> list[float]:
+    return [u for u in uppers if u != math.inf]
+
+
+def _bracket_fn(bt: BracketTable) -> tuple[Callable[[float], float], list[float]]:
+    """BracketTable.apply 의 반올림 없는 버전 + knot."""
+
+    def fn(x: float) -> float:
+        i = bisect_left(bt.uppers, x)
+        return bt.fixeds[i] + (x - bt.bases[i]) * bt.rates[i]
+
+    return fn, _finite(bt.uppers)
+
+
+def _cap_fn(ct: CapTable) -> tuple[Callable[[float], float], list[float]]:
+    """CapTable.apply 의 반올림 없는 버전 + knot (구간 경계 + cap_min 도달점)."""
+
+    def fn(g: float) -> float:
+        i = bisect_left(ct.uppers, g)
+        fixed = ct.fixed_caps[i]
+        if fixed is not None:
+            return float(fixed)
+        deducted = ct.cap_maxes[i] - (g - ct.excess_bases[i]) * ct.deduct_rates[i]
+        return max(deducted, ct.cap_mins[i])
+
+    knots = _finite(ct.uppers)
+    for i, fixed in enumerate(ct.fixed_caps):
+        if fixed is None and ct.deduct_rates[i] > 0:
+            knots.append(
+                ct.excess_bases[i]
+                + (ct.cap_maxes[i] - ct.cap_mins[i]) / ct.deduct_rates[i]
+            )
+    return fn, sorted(knots)
+
+
+def _clip_at(floor: float = 0.0) -> tuple[Callable[[float], float], list[float]]:
+    return (lambda y: max(floor, y)), [floor]
+
+
+def _cap_at(ceiling: float) -> tuple[Callable[[float], float], list[float]]:
+    return (lambda y: min(ceiling, y)), [ceiling]
+
+
+# -------------------- 곡선 합성 --------------------
+
+
+@dataclass(frozen=True, slots=True)
+class TaxCurves:
+    """변수 x 에 대한 단계별 곡선 (모두 같은 [lo, hi] 정의역)."""
+
+    variable: str
+    taxable_income: PiecewiseLinear
+    calculated_tax: PiecewiseLinear
+    determined_tax: PiecewiseLinear
+    total_tax: PiecewiseLinear
+    refund_or_owed: PiecewiseLinear
+
+
+def _check_inputs(inputs: CalcInputs, variable: str) -> None:
+    if variable not in CURVE_VARIABLES:
+        raise ValueError(f"지원하지 않는 변수: {variable} (가능: {CURVE_VARIABLES})")
+    if inputs.itemized is not None:
+        raise ValueError(
+            "itemized 입력은 구간 선형 해석을 지원하지 않습니다. extra_tax_credits 합산값을 사용하세요."
+        )
+
+
+def build_curves(
+    inputs: CalcInputs,
+    variable: CurveVariable,
+    lo: float,
+    hi: float,
+    table: TaxTable,
+) -> TaxCurves:
+    """
+    variable 을 [lo, hi] 에서 움직이고 나머지 입력은 고정한 단계별 곡선.
+    다른 변수의 현재 값은 inputs 에서 읽음.
+    """
+    _check_inputs(inputs, variable)
+    if not (0 <= lo < hi):
+        raise ValueError(f"정의역 오류: 0 <= lo < hi 이어야 합니다 (lo={lo}, hi={hi})")
+
+    def _var_or_const(name: str) -> PiecewiseLinear:
+        if name == variable:
+            return PiecewiseLinear.identity(lo, hi)
+        return PiecewiseLinear.constant(lo, hi, float(getattr(inputs, name)))
+
+    gross = _var_or_const("gross_salary")
+    income_deductions = _var_or_const("extra_income_deductions")
+    tax_credits = _var_or_const("extra_tax_credits")
+
+    # 1) 근로소득공제 → 근로소득금액
+    eid = gross.map(*_bracket_fn(table.earned_income_deduction)).map(
+        *_cap_at(table.earned_income_deduction_cap)
+    )
+    earned_income_amount = (gross - eid).map(*_clip_at())
+
+    # 2~3) 인적공제 → 과세표준
+    pd_total, _ = personal_deduction(inputs.dependents, table)
+    taxable_income = (
+        (earned_income_amount - income_deductions).shift(-pd_total).map(*_clip_at())
+    )
+
+    # 4) 산출세액
+    calculated_tax = taxable_income.map(*_bracket_fn(table.progressive_tax))
+
+    # 5) 근로소득세액공제 = min(비율 공제, 총급여 기준 한도)
+    raw_credit = calculated_tax.map(*_bracket_fn(table.earned_income_tax_credit))
+    cap = gross.map(*_cap_fn(table.earned_income_tax_credit_cap))
+    eitc = raw_credit.minimum(cap)
+
+    # 6~8) 결정세액
+    standard_credit = (
+        table.standard_tax_credit if inputs.use_standard_tax_credit else 0
+    )
+    determined_tax = (
+        (calculated_tax - eitc - tax_credits).shift(-standard_credit).map(*_clip_at())
+    )
+
+    # 9) 지방소득세 합산 → 환급
+    total_tax = determined_tax.scale(1 + table.local_income_tax_rate)
+    refund = total_tax.scale(-1).shift(inputs.prepaid_tax)
+
+    return TaxCurves(
+        variable=variable,
+        taxable_income=taxable_income,
+        calculated_tax=calculated_tax,
+        determined_tax=determined_tax,
+        total_tax=total_tax,
+        refund_or_owed=refund,
+    )
+
+
+def refund_curve(
+    inputs: CalcInputs,
+    variable: CurveVariable,
+    lo: float,
+    hi: float,
+    year: int = 2025,
+    table_path: str | None = None,
+) -> PiecewiseLinear:
+    """환급/추징(refund_or_owed) 을 variable 의 함수로. knot = breakpoint."""
+    table = load_tax_table(year=year, path=table_path)
+    return build_curves(inputs, variable, lo, hi, table).refund_or_owed
+
+
+def refund_breakpoints(
+    inputs: CalcInputs,
+    variable: CurveVariable,
+    lo: float,
+    hi: float,
+    year: int = 2025,
+    table_path: str | None = None,
+) -> list[tuple[float, float]]:
+    """[lo, hi] 의 환급 곡선 breakpoint (양 끝점 포함) — (x, refund) 목록."""
+    return refund_curve(inputs, variable, lo, hi, year, table_path).knots()
+
+
+# -------------------- 한계세율 --------------------
+
+
+def marginal_rate(
+    inputs: CalcInputs,
+    variable: CurveVariable = "gross_salary",
+    year: int = 2025,
+    table_path: str | None = None,
+) -> float:
+    """
+    현재 입력점에서 총 부담세액의 한계 변화율 d(total_tax)/d(variable) (우미분).
+    gross_salary → 실효 한계세율 (지방세 포함), 공제 변수 → 1원당 절세액(음수).
+    """
+    table = load_tax_table(year=year, path=table_path)
+    x = float(getattr(inputs, variable))
+    curves = build_curves(inputs, variable, x, x + 1.0, table)
+    return curves.total_tax.slope(x, side="right")
+
+
+# -------------------- 역산 solver --------------------
+
+
+def solve_for_refund(
+    inputs: CalcInputs,
+    variable: CurveVariable,
+    target_refund: int,
+    year: int = 2025,
+    table_path: str | None = None,
+) -> int | None:
+    """
+    환급(refund_or_owed) 이 target_refund 이상이 되도록 variable 에 더해야 할
+    최소 추가 금액(원). 이미 달성 → 0, 결정세액을 전부 없애도 불가 → None.
+
+    해석해(곡선의 첫 교차 구간에서 선형 역산) 를 구한 뒤, 단계별 반올림 차이만
+    calculate_totals() 로 좁은 범위에서 보정.
+    """
+    if variable not in SOLVABLE_VARIABLES:
+        raise ValueError(f"역산 가능한 변수: {SOLVABLE_VARIABLES}")
+    _check_inputs(inputs, variable)
+    table = load_tax_table(year=year, path=table_path)
+    current = int(getattr(inputs, variable))
+
+    def exact(value: int) -> int:
+        updated = inputs.model_copy(update={variable: value})
+        return calculate_totals(
+            updated, year=year, table_path=table_path
+        ).refund_or_owed
+
+    if exact(current) >= target_refund:
+        return 0
+
+    # 변수를 이만큼 늘리면 결정세액이 0 → 환급은 그 이후 평탄
+    base = calculate_totals(inputs, year=year, table_path=table_path)
+    reach = (
+        base.taxable_income
+        if variable == "extra_income_deductions"
+        else base.determined_tax
+    )
+    hi = current + reach + 1
+    if exact(hi) < target_refund:
+        return None
+
+    curve = build_curves(inputs, variable, current, hi, table).refund_or_owed
+    guess = hi
+    for (x0, y0), (x1, y1) in zip(curve.knots(), curve.knots()[1:]):
+        if y1 >= target_refund:
+            guess = x0 + (target_refund - y0) * (x1 - x0) / (y1 - y0)
+            break
+    guess = min(max(math.ceil(guess), current), hi)
+
+    # 원 단위 보정: exact(ok) >= target > exact(ng) 를 만족하는 구간을 찾아 bisection
+    ok, ng, step = guess, guess - 1, 1
+    while exact(ok) < target_refund:
+        ng, ok = ok, min(ok + step, hi)
+        step *= 2
+    while ng >= current and exact(ng) >= target_refund:
+        ok, ng = ng, max(ng - step, current - 1)
+        step *= 2
+    while ok - ng > 1:
+        mid = (ok + ng) // 2
+        if exact(mid) >= target_refund:
+            ok = mid
+        else:
+            ng = mid
+    return ok - current
@@ -17,7 +17,7 @@ from app.schemas.verification_schema import (
     StepDiff,
     VerificationReport,
 )
-from app.services.tax_calculator import calculate
+from app.services.tax_calculator import calculate_cached
 
 
 # 비교할 필드 (tax_calculator 의 attribute 이름 == CompanyFiling 의 attribute 이름)
@@ -105,7 +105,7 @@ def verify(
     inputs = _to_calc_inputs(
         request, filing, extra_income_deductions, extra_tax_credits
     )
-    our = calculate(inputs)
+    our = calculate_cached(inputs)
 
     # CalcStep 에서 anchor 매핑 추출
     anchors_by_name = {s.name: s.legal_anchor for s in our.steps}
@@ -1,6 +1,7 @@
 import logging
 import os
 import uuid
+from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 
@@ -15,6 +16,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from app.logging_config import configure_logging
 from app.rate_limit import limiter
 from app.routers import (
+    admin_cache,
     admin_rules,
     analyze,
     dependencies,
@@ -22,10 +24,12 @@ from app.routers import (
     pdf_parse,
     rag,
     recommend,
+    refund_curve,
     simulate,
     user_input,
     verify,
 )
+from app.services.tax_calculator import table_registry
 
 
 # 로깅 설정 — import 시점 로그도 잡힘
@@ -33,11 +37,21 @@ configure_logging()
 logger = logging.getLogger("susemi")
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # 세율표 전 연도 preload + mtime watcher — 요청 경로에서 JSON 파싱 없음
+    table_registry.start()
+    try:
+        yield
+    finally:
+        table_registry.stop()
+
 
 app = FastAPI(
     title="Susemi Backend",
     description="근로소득자 연말정산 Why 설명용 수세미 백엔드",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Rate limit — 데코레이터로 명시한 엔드포인트만 적용 (app/rate_limit.py)
@@ -98,11 +112,13 @@ app.include_router(pdf_parse.router, prefix="/api/v1", tags=["pdf"])
 app.include_router(manual_input.router, prefix="/api/v1", tags=["manual-input"])
 app.include_router(analyze.router, prefix="/api/v1", tags=["analyze"])
 app.include_router(admin_rules.router, prefix="/api/v1", tags=["admin-rules"])
+app.include_router(admin_cache.router, prefix="/api/v1", tags=["admin-cache"])
 app.include_router(verify.router, prefix="/api/v1", tags=["verify"])
 app.include_router(simulate.router, prefix="/api/v1", tags=["simulate"])
 app.include_router(rag.router, prefix="/api/v1", tags=["rag"])
 app.include_router(recommend.router, prefix="/api/v1", tags=["recommend"])
 app.include_router(dependencies.router, prefix="/api/v1", tags=["ripple"])
+app.include_router(refund_curve.router, prefix="/api/v1", tags=["refund-curve"])
 
 
 @app.get("/")
@@ -111,6 +111,47 @@ async def test_fetch_rag_context_calls_search_and_returns_hits(monkeypatch):
     assert "X §1" in captured["query"]
 
 
+async def test_fetch_rag_context_anchor_hits_first(monkeypatch):
+    from app.services import rag as rag_module
+
+    def fake_lookup(anchor, data_dir=None):
+        assert anchor == "X §1"
+        return [_make_hit("인용 조문")]
+
+    captured = {}
+
+    async def fake_search(query, **kwargs):
+        captured["top_k"] = kwargs.get("top_k")
+        other = _make_hit("보충 본문")
+        other.chunk.chunk_id = "X-§2"
+        return [_make_hit("중복"), other], 5
+
+    monkeypatch.setattr(rag_module, "lookup_anchor", fake_lookup)
+    monkeypatch.setattr(rag_module, "search", fake_search)
+
+    rc = rules_engine.RuleContext()
+    rc.evaluations = [_ev("r1"), _ev("r2")]  # 같은 anchor 두 번 → 1건
+    hits = await _fetch_rag_context(rc)
+    assert [h.chunk.text for h in hits] == ["인용 조문", "보충 본문"]
+    assert captured["top_k"] == 3  # 보충 컨텍스트만
+
+
+async def test_fetch_rag_context_anchor_hits_fill_top_k(monkeypatch):
+    from app.services import rag as rag_module
+
+    async def no_search(query, **kwargs):
+        raise AssertionError("직접 조회로 top_k 를 채우면 검색 안 함")
+
+    monkeypatch.setattr(
+        rag_module, "lookup_anchor", lambda anchor, data_dir=None: [_make_hit()]
+    )
+    monkeypatch.setattr(rag_module, "search", no_search)
+
+    rc = rules_engine.RuleContext()
+    rc.evaluations = [_ev()]
+    assert len(await _fetch_rag_context(rc, top_k=1)) == 1
+
+
 async def test_fetch_rag_context_silent_fallback_on_error(monkeypatch):
     async def raising_search(query, **kwargs):
         raise RuntimeError("openai down")
@@ -0,0 +1,244 @@
+"""
+/analyze/stream (SSE) 테스트.
+
+- llm_client.stream_analysis: 가짜 스트리밍 클라이언트 (_get_client monkeypatch)
+- 라우터: analyze 라우터만 마운트한 최소 앱 + stream_analysis / RAG monkeypatch
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from app.routers import analyze as analyze_module
+from app.schemas.analysis_schema import Section, Summary
+from app.schemas.manual_input_schema import (
+    HousingLoanInfo,
+    ManualInputRequest,
+    RentInfo,
+)
+from app.schemas.pdf_schema import ParsedPdfData
+from app.schemas.user_input_schema import Conditions, Dependents, Income
+from app.services import llm_cache, llm_client
+from app.services.rules_engine import RuleContext
+
+
+DOC = {
+    "summary": {"headline": "환급 예상", "key_points": ["a"]},
+    "sections": [
+        {"id": "card", "title": "카드", "highlight": "h", "detail": "d", "tips": []},
+        {"id": "medical", "title": "의료비", "highlight": "h", "detail": "d", "tips": []},
+    ],
+    "tax_tips": ["팁"],
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(monkeypatch, tmp_path):
+    """테스트마다 빈 응답 캐시 — 같은 프롬프트가 테스트 간에 적중하지 않게."""
+    cache = llm_cache.LlmResponseCache(tmp_path / "llm_cache.sqlite3")
+    monkeypatch.setattr(llm_cache, "default_cache", lambda: cache)
+    return cache
+
+
+def _chunk(text: str | None):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+class _FakeCompletions:
+    def __init__(self, pieces: list[str], log: list[str]):
+        self.pieces = pieces
+        self.log = log
+        self.kwargs: dict = {}
+
+    async def create(self, **kwargs):
+        self.kwargs = kwargs
+
+        async def gen():
+            for p in self.pieces:
+                self.log.append(f"chunk:{p}")
+                yield _chunk(p)
+            yield SimpleNamespace(choices=[])  # usage-only 청크
+
+        return gen()
+
+
+def _install_fake(monkeypatch, pieces: list[str]) -> tuple[_FakeCompletions, list[str]]:
+    log: list[str] = []
+    completions = _FakeCompletions(pieces, log)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    monkeypatch.setattr(llm_client, "_get_client", lambda: client)
+    return completions, log
+
+
+def _stream_kwargs() -> dict:
+    return dict(
+        income=Income(total_salary=30_000_000, non_taxable=0, bonus=0),
+        dependents=Dependents(has_spouse=False),
+        conditions=Conditions(
+            householder=True, no_house=True, lease_contract=False, has_loan=False
+        ),
+        parsed_pdf=ParsedPdfData(),
+        manual_input=ManualInputRequest(
+            rent=RentInfo(has_rent=False),
+            housing_loan=HousingLoanInfo(has_loan=False),
+        ),
+        rule_context=RuleContext(),
+    )
+
+
+def _split(text: str, n: int = 7) -> list[str]:
+    return [text[i : i + n] for i in range(0, len(text), n)]
+
+
+# -------------------- llm_client.stream_analysis --------------------
+
+
+async def test_stream_analysis_yields_sections_before_stream_ends(monkeypatch):
+    text = json.dumps(DOC, ensure_ascii=False)
+    completions, log = _install_fake(monkeypatch, _split(text))
+
+    events = []
+    async for kind, value in llm_client.stream_analysis(**_stream_kwargs()):
+        events.append((kind, value, len(log)))
+
+    assert completions.kwargs["stream"] is True
+    assert completions.kwargs["model"] == "gpt-4o-mini"
+    assert [k for k, _, _ in events] == ["summary", "section", "section", "tax_tips"]
+    first_section = events[1]
+    assert isinstance(first_section[1], Section)
+    assert first_section[1].id == "card"
+    # 첫 섹션은 마지막 청크가 오기 전에 방출
+    assert first_section[2] < len(log)
+    assert isinstance(events[0][1], Summary)
+    assert events[3][1] == ["팁"]
+
+
+async def test_stream_analysis_invalid_section_raises(monkeypatch):
+    # Section 스키마에 안 맞는 객체는 스트림 중엔 건너뛰고,
+    # 종료 후 전체 파싱 보충에서 generate_analysis 와 같이 ValidationError
+    bad = dict(DOC, sections=[{"id": "card"}])
+    _install_fake(monkeypatch, _split(json.dumps(bad, ensure_ascii=False)))
+    with pytest.raises(ValidationError):
+        async for _ in llm_client.stream_analysis(**_stream_kwargs()):
+            pass
+
+
+async def test_stream_analysis_parses_fenced_output(monkeypatch):
+    text = "```json\n" + json.dumps(DOC, ensure_ascii=False) + "\n```"
+    _install_fake(monkeypatch, _split(text, 3))
+    kinds = [k async for k, _ in llm_client.stream_analysis(**_stream_kwargs())]
+    assert kinds.count("section") == 2
+    assert kinds.count("summary") == 1
+    assert kinds.count("tax_tips") == 1
+
+
+async def test_stream_analysis_non_json_raises(monkeypatch):
+    _install_fake(monkeypatch, ["죄송합니다", " 분석할 수 없습니다"])
+    with pytest.raises(ValueError):
+        async for _ in llm_client.stream_analysis(**_stream_kwargs()):
+            pass
+
+
+# -------------------- 라우터 (SSE) --------------------
+
+
+def _build_test_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(analyze_module.router, prefix="/api/v1")
+    return app
+
+
+def _request_body() -> dict:
+    kw = _stream_kwargs()
+    kw.pop("rule_context")
+    return {k: v.model_dump() for k, v in kw.items()}
+
+
+def _parse_sse(body: str) -> list[tuple[str, object]]:
+    out = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        out.append((lines["event"], json.loads(lines["data"])))
+    return out
+
+
+def test_stream_endpoint_event_order(monkeypatch):
+    async def no_rag(rule_context, top_k=analyze_module.RAG_TOP_K):
+        return []
+
+    async def fake_stream(**kwargs):
+        yield "summary", Summary(**DOC["summary"])
+        for sec in DOC["sections"]:
+            yield "section", Section(**sec)
+        yield "tax_tips", DOC["tax_tips"]
+
+    monkeypatch.setattr(analyze_module, "_fetch_rag_context", no_rag)
+    monkeypatch.setattr(analyze_module, "stream_analysis", fake_stream)
+
+    client = TestClient(_build_test_app())
+    res = client.post("/api/v1/analyze/stream", json=_request_body())
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/event-stream")
+
+    events = _parse_sse(res.text)
+    kinds = [k for k, _ in events]
+    assert kinds[:2] == ["evaluations", "calc"]
+    assert kinds[2:] == ["summary", "section", "section", "tax_tips", "done"]
+    expected_calc = analyze_module._run_tax_calc(
+        analyze_module.AnalyzeRequest(**_request_body())
+    )
+    assert events[1][1] == (expected_calc.model_dump() if expected_calc else None)
+
+    done = events[-1][1]
+    assert [s["id"] for s in done["sections"]] == ["card", "medical"]
+    assert done["tax_tips"] == ["팁"]
+    assert done["evaluations"] == events[0][1]
+    assert done["cached"] is False
+    # 스트림 중 보낸 섹션에도 provenance 부착 (done 과 동일)
+    assert events[3][1] == done["sections"][0]
+
+
+def test_stream_endpoint_reports_cache_hit(monkeypatch):
+    async def no_rag(rule_context, top_k=analyze_module.RAG_TOP_K):
+        return []
+
+    async def cached_stream(**kwargs):
+        yield "cached", True
+        yield "summary", Summary(**DOC["summary"])
+        yield "tax_tips", DOC["tax_tips"]
+
+    monkeypatch.setattr(analyze_module, "_fetch_rag_context", no_rag)
+    monkeypatch.setattr(analyze_module, "stream_analysis", cached_stream)
+
+    client = TestClient(_build_test_app())
+    res = client.post("/api/v1/analyze/stream", json=_request_body())
+    events = _parse_sse(res.text)
+    assert "cached" not in [k for k, _ in events]
+    assert events[-1][0] == "done"
+    assert events[-1][1]["cached"] is True
+
+
+def test_stream_endpoint_emits_error_event(monkeypatch, caplog):
+    async def no_rag(rule_context, top_k=analyze_module.RAG_TOP_K):
+        return []
+
+    async def failing_stream(**kwargs):
+        yield "section", Section(**DOC["sections"][0])
+        raise ValueError("boom")
+
+    monkeypatch.setattr(analyze_module, "_fetch_rag_context", no_rag)
+    monkeypatch.setattr(analyze_module, "stream_analysis", failing_stream)
+
+    client = TestClient(_build_test_app())
+    with caplog.at_level("ERROR", logger=analyze_module.logger.name):
+        res = client.post("/api/v1/analyze/stream", json=_request_body())
+    events = _parse_sse(res.text)
+    assert [k for k, _ in events][-2:] == ["section", "error"]
+    assert events[-1][1] == {"detail": analyze_module.STREAM_ERROR_DETAIL}
+    assert "boom" not in res.text
+    # 원인은 서버 로그에
+    assert any("boom" in (r.exc_text or "") for r in caplog.records)
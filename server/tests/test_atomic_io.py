@@ -0,0 +1,67 @@
+"""
+atomic_io 테스트 — 교체 / 실패 시 원본 유지 / tmp 정리 / 권한 유지.
+"""
+
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from app.services import atomic_io
+from app.services.atomic_io import atomic_write_bytes, atomic_write_json
+
+
+def test_write_creates_parent_and_replaces(tmp_path: Path):
+    path = tmp_path / "a" / "b.bin"
+    atomic_write_bytes(path, b"one")
+    inode = path.stat().st_ino
+    atomic_write_bytes(path, b"two", fsync=True)
+    assert path.read_bytes() == b"two"
+    # 새 파일로 교체 (열린 mmap 은 옛 inode 유지)
+    assert path.stat().st_ino != inode
+    assert [p.name for p in path.parent.iterdir()] == ["b.bin"]
+
+
+def test_failed_replace_keeps_original_and_cleans_tmp(tmp_path: Path, monkeypatch):
+    path = tmp_path / "x.json"
+    atomic_write_json(path, {"v": 1})
+
+    def broken_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(atomic_io.os, "replace", broken_replace)
+    with pytest.raises(OSError):
+        atomic_write_json(path, {"v": 2})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"v": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["x.json"]
+
+
+def test_json_is_utf8_and_indented(tmp_path: Path):
+    path = tmp_path / "k.json"
+    atomic_write_json(path, {"법": [1]})
+    text = path.read_text(encoding="utf-8")
+    assert "법" in text
+    assert text.startswith("{\n  ")
+
+
+posix_only = pytest.mark.skipif(os.name != "posix", reason="POSIX 권한 비트")
+
+
+@posix_only
+def test_new_file_gets_umask_default_mode(tmp_path: Path):
+    path = tmp_path / "rules.json"
+    atomic_write_json(path, {"v": 1})
+    # mkstemp 의 0600 이 아니라 일반 open() 과 같은 권한
+    assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~atomic_io._UMASK
+
+
+@posix_only
+def test_replace_keeps_existing_mode(tmp_path: Path):
+    path = tmp_path / "rules.json"
+    path.write_text("{}", encoding="utf-8")
+    os.chmod(path, 0o640)
+    atomic_write_json(path, {"v": 2}, fsync=True)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+    assert json.loads(path.read_text(encoding="utf-8")) == {"v": 2}
@@ -0,0 +1,185 @@
+"""
+embedding_batch (배치 + 동시성 제한 + 재시도) 테스트.
+"""
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import openai
+import pytest
+
+from app.services import rag
+from app.services.embedding_batch import EmbedBatchConfig, embed_in_batches, is_transient
+
+from tests.test_rag import _law, make_deterministic_embedder
+
+
+_REQUEST = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+
+
+def _status_error(cls, status: int):
+    return cls("err", response=httpx.Response(status, request=_REQUEST), body=None)
+
+
+def _rate_limited():
+    return _status_error(openai.RateLimitError, 429)
+
+
+def _connection_error():
+    return openai.APIConnectionError(request=_REQUEST)
+
+
+def _sleeps():
+    delays: list[float] = []
+
+    async def _sleep(d: float) -> None:
+        delays.append(d)
+
+    return _sleep, delays
+
+
+async def test_order_preserved_and_concurrency_bounded():
+    in_flight = 0
+    peak = 0
+    calls: list[list[str]] = []
+
+    async def embed(texts):
+        nonlocal in_flight, peak
+        calls.append(texts)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # 뒤 배치가 먼저 끝나도록 역순 지연
+        await asyncio.sleep(0.001 * (10 - int(texts[0])))
+        in_flight -= 1
+        return [[float(t)] for t in texts]
+
+    texts = [str(i) for i in range(10)]
+    progress: list[tuple[int, int]] = []
+    out = await embed_in_batches(
+        texts,
+        embed,
+        config=EmbedBatchConfig(batch_size=3, concurrency=2),
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+    assert out == [[float(i)] for i in range(10)]
+    assert sorted(len(c) for c in calls) == [1, 3, 3, 3]
+    assert peak == 2
+    assert [d for d, _ in progress] == sorted(d for d, _ in progress)
+    assert progress[-1] == (10, 10)
+
+
+async def test_retries_with_exponential_backoff():
+    failures = {"n": 0}
+
+    async def flaky(texts):
+        if failures["n"] < 3:
+            failures["n"] += 1
+            raise _rate_limited()
+        return [[1.0] for _ in texts]
+
+    sleep, delays = _sleeps()
+    out = await embed_in_batches(
+        ["a", "b"],
+        flaky,
+        config=EmbedBatchConfig(max_retries=3, backoff_base=0.5, backoff_max=1.5),
+        sleep=sleep,
+    )
+    assert out == [[1.0], [1.0]]
+    assert delays == [0.5, 1.0, 1.5]
+
+
+async def test_gives_up_after_max_retries():
+    async def down(texts):
+        raise _connection_error()
+
+    sleep, delays = _sleeps()
+    with pytest.raises(openai.APIConnectionError):
+        await embed_in_batches(
+            ["a"], down, config=EmbedBatchConfig(max_retries=2), sleep=sleep
+        )
+    assert len(delays) == 2
+
+
+@pytest.mark.parametrize(
+    "make_error",
+    [
+        lambda: _status_error(openai.AuthenticationError, 401),
+        lambda: _status_error(openai.BadRequestError, 400),
+        lambda: ValueError("bug"),
+    ],
+)
+async def test_non_transient_errors_not_retried(make_error):
+    calls = {"n": 0}
+
+    async def broken(texts):
+        calls["n"] += 1
+        raise make_error()
+
+    sleep, delays = _sleeps()
+    with pytest.raises(Exception):
+        await embed_in_batches(
+            ["a"], broken, config=EmbedBatchConfig(max_retries=3), sleep=sleep
+        )
+    assert calls["n"] == 1
+    assert delays == []
+
+
+def test_is_transient():
+    assert is_transient(_rate_limited())
+    assert is_transient(_connection_error())
+    assert is_transient(openai.APITimeoutError(request=_REQUEST))
+    assert is_transient(_status_error(openai.InternalServerError, 503))
+    assert not is_transient(_status_error(openai.NotFoundError, 404))
+    assert not is_transient(ConnectionError("not from the client"))
+
+
+async def test_count_mismatch_not_retried():
+    calls = {"n": 0}
+
+    async def bad(texts):
+        calls["n"] += 1
+        return []
+
+    with pytest.raises(RuntimeError):
+        await embed_in_batches(["a", "b"], bad, sleep=_sleeps()[0])
+    assert calls["n"] == 1
+
+
+def test_config_validated():
+    with pytest.raises(ValueError):
+        EmbedBatchConfig(batch_size=0)
+
+
+async def test_index_law_resumes_after_failed_batch(tmp_path: Path):
+    base = make_deterministic_embedder({"공제": [1.0, 0.0]})
+    seen: list[list[str]] = []
+    broken = {"on": True}
+
+    async def embed(texts):
+        seen.append(list(texts))
+        if broken["on"] and "무주택" in texts[0]:
+            raise openai.APITimeoutError(request=_REQUEST)
+        return await base(texts)
+
+    config = EmbedBatchConfig(batch_size=1, concurrency=1, max_retries=0)
+    with pytest.raises(openai.APITimeoutError):
+        await rag.index_law(
+            _law(), embed_fn=embed, data_dir=tmp_path, batch_config=config
+        )
+    assert rag.list_pack_indexes(tmp_path) == []
+
+    # 재실행 — 앞서 끝난 두 배치는 저장소에서 재사용, 실패한 청크만 임베딩
+    broken["on"] = False
+    seen.clear()
+    progress: list[tuple[int, int]] = []
+    pack = await rag.index_law(
+        _law(),
+        embed_fn=embed,
+        data_dir=tmp_path,
+        batch_config=config,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+    assert len(seen) == 1 and "무주택" in seen[0][0]
+    assert progress == [(1, 1)]
+    assert len(pack.chunks) == 3
@@ -0,0 +1,94 @@
+"""
+embedding_store (모델, text_hash) → 벡터 저장소 테스트.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from app.services.embedding_store import EmbeddingStore, store_for
+
+
+def test_put_and_get_roundtrip(tmp_path: Path):
+    store = EmbeddingStore(tmp_path / "e.sqlite3")
+    assert store.get_many("m", ["a"]) == {}
+    assert store.put_many("m", [("a", [0.5, -1.0]), ("b", np.ones(2))]) == 2
+
+    got = store.get_many("m", ["a", "b", "missing", "a"])
+    assert sorted(got) == ["a", "b"]
+    assert got["a"].dtype == np.float32
+    assert got["a"].tolist() == [0.5, -1.0]
+
+
+def test_keyed_by_model(tmp_path: Path):
+    store = store_for(tmp_path)
+    store.put_many("m1", [("a", [1.0])])
+    assert store.get_many("m2", ["a"]) == {}
+    assert store.count("m1") == 1
+    assert store.count() == 1
+
+
+def test_overwrite_and_reopen(tmp_path: Path):
+    path = tmp_path / "nested" / "e.sqlite3"
+    EmbeddingStore(path).put_many("m", [("a", [1.0, 2.0])])
+    EmbeddingStore(path).put_many("m", [("a", [3.0, 4.0])])
+    reopened = EmbeddingStore(path)
+    assert reopened.get_many("m", ["a"])["a"].tolist() == [3.0, 4.0]
+    assert reopened.count() == 1
+
+
+def test_lookup_batches_large_key_sets(tmp_path: Path):
+    store = EmbeddingStore(tmp_path / "e.sqlite3")
+    store.put_many("m", [(f"h{i}", [float(i)]) for i in range(1_200)])
+    got = store.get_many("m", [f"h{i}" for i in range(1_200)])
+    assert len(got) == 1_200
+    assert got["h1199"].tolist() == [1199.0]
+
+
+# -------------------- query 벡터 테이블 --------------------
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_query_vectors_kept_apart_from_chunks(tmp_path: Path):
+    store = store_for(tmp_path)
+    store.put_query("m", "q1", [0.25, 0.5])
+    assert store.get_query("m", "q1").tolist() == [0.25, 0.5]
+    assert store.get_query("other", "q1") is None
+    assert store.count() == 0
+    assert store.get_many("m", ["q1"]) == {}
+    assert store.query_count() == 1
+
+
+def test_query_vectors_expire(tmp_path: Path):
+    clock = _Clock()
+    store = EmbeddingStore(tmp_path / "e.sqlite3", query_ttl_seconds=60, clock=clock)
+    store.put_query("m", "q", [1.0])
+    clock.now += 59
+    assert store.get_query("m", "q") is not None
+    clock.now += 1
+    assert store.get_query("m", "q") is None
+    assert store.query_count() == 0
+
+
+def test_query_table_size_bounded_lru(tmp_path: Path):
+    clock = _Clock()
+    store = EmbeddingStore(
+        tmp_path / "e.sqlite3", query_ttl_seconds=None, query_max_entries=2, clock=clock
+    )
+    store.put_query("m", "a", [1.0])
+    clock.now += 1
+    store.put_query("m", "b", [2.0])
+    clock.now += 1
+    store.get_query("m", "a")  # a 를 최근 사용으로
+    clock.now += 1
+    store.put_query("m", "c", [3.0])
+    assert store.query_count() == 2
+    assert store.get_query("m", "b") is None
+    assert store.get_query("m", "a") is not None
@@ -0,0 +1,89 @@
+"""
+json_stream.JsonStreamParser 테스트 — 조각 경계와 무관하게 같은 이벤트가 나오는지.
+"""
+
+import json
+import random
+
+from app.services.json_stream import ItemEvent, JsonStreamParser, ValueEvent
+
+
+DOC = {
+    "summary": {"headline": "환급 예상", "key_points": ["카드 {25%} 초과", 'a "quoted" ]']},
+    "sections": [
+        {"id": "card", "title": "카드", "highlight": "h", "detail": "[card_25_threshold] }{", "tips": []},
+        {"id": "medical", "title": "의료비", "highlight": "h", "detail": "d\\n", "tips": ["x"]},
+    ],
+    "tax_tips": ["팁1", "팁2"],
+}
+
+
+def _feed_all(text: str, cuts: list[int]) -> list:
+    parser = JsonStreamParser()
+    events = []
+    prev = 0
+    for cut in cuts + [len(text)]:
+        events.extend(parser.feed(text[prev:cut]))
+        prev = cut
+    assert parser.done
+    return events
+
+
+def _expected() -> list:
+    return [
+        ValueEvent("summary", DOC["summary"]),
+        ItemEvent("sections", 0, DOC["sections"][0]),
+        ItemEvent("sections", 1, DOC["sections"][1]),
+        ValueEvent("sections", DOC["sections"]),
+        ValueEvent("tax_tips", DOC["tax_tips"]),
+    ]
+
+
+def test_whole_document_at_once():
+    text = json.dumps(DOC, ensure_ascii=False)
+    assert _feed_all(text, []) == _expected()
+
+
+def test_random_chunk_boundaries_give_same_events():
+    text = json.dumps(DOC, ensure_ascii=False, indent=2)
+    rng = random.Random(0)
+    for _ in range(50):
+        cuts = sorted(rng.sample(range(1, len(text)), 20))
+        assert _feed_all(text, cuts) == _expected()
+
+
+def test_single_char_chunks():
+    text = json.dumps(DOC, ensure_ascii=False)
+    assert _feed_all(text, list(range(1, len(text)))) == _expected()
+
+
+def test_section_emitted_before_document_closes():
+    text = json.dumps(DOC, ensure_ascii=False)
+    first_end = text.index('"medical"')
+    parser = JsonStreamParser()
+    events = parser.feed(text[:first_end])
+    assert ItemEvent("sections", 0, DOC["sections"][0]) in events
+    assert not parser.done
+
+
+def test_ignores_code_fence_and_trailing_text():
+    text = "```json\n" + json.dumps(DOC, ensure_ascii=False) + "\n```\n{ignored"
+    assert _feed_all(text, [3, 10]) == _expected()
+
+
+def test_trailing_comma_is_tolerated():
+    text = '{"sections": [{"id": "a", "tips": ["x",],}, {"id": "b"}], "tax_tips": []}'
+    events = _feed_all(text, [])
+    assert events[0] == ItemEvent("sections", 0, {"id": "a", "tips": ["x"]})
+    assert events[1] == ItemEvent("sections", 1, {"id": "b"})
+
+
+def test_unparseable_item_is_skipped_but_index_advances():
+    text = '{"sections": [{"id": nope}, {"id": "b"}]}'
+    events = _feed_all(text, [])
+    assert events == [ItemEvent("sections", 1, {"id": "b"})]
+
+
+def test_scalar_values_are_not_emitted():
+    events = _feed_all('{"note": "x", "n": 3, "tax_tips": ["a"]}', [])
+    assert events == [ValueEvent("tax_tips", ["a"])]
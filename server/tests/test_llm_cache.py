@@ -0,0 +1,351 @@
+"""
+llm_cache (LLM 응답 캐시) + generate_analysis / stream_analysis 연동 테스트.
+
+LLM 은 가짜 클라이언트 (_get_client monkeypatch), 캐시는 tmp_path SQLite.
+"""
+
+import json
+import os
+import sqlite3
+import stat
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.schemas.manual_input_schema import (
+    HousingLoanInfo,
+    ManualInputRequest,
+    RentInfo,
+)
+from app.schemas.pdf_schema import ParsedPdfData
+from app.schemas.user_input_schema import Conditions, Dependents, Income
+from app.services import llm_cache, llm_client
+from app.services.llm_cache import LlmResponseCache, cache_key
+from app.services.rules_engine import RuleContext
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# -------------------- 저장소 --------------------
+
+
+def test_get_missing_returns_none(tmp_path):
+    cache = LlmResponseCache(tmp_path / "c.sqlite3")
+    assert cache.get("nope") is None
+    assert cache.count() == 0
+
+
+def test_put_then_get_roundtrip(tmp_path):
+    cache = LlmResponseCache(tmp_path / "c.sqlite3")
+    cache.put("k", "gpt-4o-mini", '{"a": "한글"}')
+    assert cache.get("k") == '{"a": "한글"}'
+    # 새 인스턴스 (다른 워커) 에서도 보임
+    assert LlmResponseCache(tmp_path / "c.sqlite3").get("k") == '{"a": "한글"}'
+
+
+def test_put_overwrites_same_key(tmp_path):
+    cache = LlmResponseCache(tmp_path / "c.sqlite3")
+    cache.put("k", "m", "old")
+    cache.put("k", "m", "new")
+    assert cache.get("k") == "new"
+    assert cache.count() == 1
+
+
+def test_ttl_expiry_removes_entry(tmp_path):
+    clock = _Clock()
+    cache = LlmResponseCache(tmp_path / "c.sqlite3", ttl_seconds=60, clock=clock)
+    cache.put("k", "m", "v")
+    clock.now += 59
+    assert cache.get("k") == "v"
+    clock.now += 1
+    assert cache.get("k") is None
+    assert cache.count() == 0
+
+
+def test_ttl_counts_from_creation_not_access(tmp_path):
+    clock = _Clock()
+    cache = LlmResponseCache(tmp_path / "c.sqlite3", ttl_seconds=60, clock=clock)
+    cache.put("k", "m", "v")
+    for _ in range(3):
+        clock.now += 25
+        cache.get("k")
+    assert cache.get("k") is None
+
+
+def test_put_purges_expired_entries(tmp_path):
+    clock = _Clock()
+    cache = LlmResponseCache(tmp_path / "c.sqlite3", ttl_seconds=60, clock=clock)
+    cache.put("old", "m", "v")
+    clock.now += 120
+    cache.put("new", "m", "v")
+    assert cache.count() == 1
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path):
+    clock = _Clock()
+    cache = LlmResponseCache(
+        tmp_path / "c.sqlite3", ttl_seconds=None, max_entries=2, clock=clock
+    )
+    cache.put("a", "m", "A")
+    clock.now += 1
+    cache.put("b", "m", "B")
+    clock.now += 1
+    assert cache.get("a") == "A"  # a 를 최근 사용으로
+    clock.now += 1
+    cache.put("c", "m", "C")
+    assert cache.count() == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+
+
+def test_invalid_max_entries_raises(tmp_path):
+    with pytest.raises(ValueError):
+        LlmResponseCache(tmp_path / "c.sqlite3", max_entries=0)
+
+
+def test_clear(tmp_path):
+    cache = LlmResponseCache(tmp_path / "c.sqlite3")
+    cache.put("a", "m", "A")
+    cache.clear()
+    assert cache.count() == 0
+
+
+def test_default_cache_is_opt_in():
+    # 모듈 상수는 import 시점 env — 깨끗한 프로세스에서 확인
+    env = {k: v for k, v in os.environ.items() if k != "LLM_CACHE_ENABLED"}
+    code = "from app.services import llm_cache; print(llm_cache.default_cache())"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == "None"
+
+
+def test_default_cache_disabled(monkeypatch):
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_ENABLED", False)
+    assert llm_cache.default_cache() is None
+
+
+@pytest.fixture
+def fresh_default(monkeypatch, tmp_path):
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_ENABLED", True)
+    monkeypatch.setattr(llm_cache, "DEFAULT_PATH", tmp_path / "llm_cache.sqlite3")
+    monkeypatch.setattr(llm_cache, "_DEFAULT", None)
+
+
+def test_default_cache_reads_env(monkeypatch, fresh_default):
+    monkeypatch.setenv("LLM_CACHE_TTL_SECONDS", "60")
+    monkeypatch.setenv("LLM_CACHE_MAX_ENTRIES", "10")
+    cache = llm_cache.default_cache()
+    assert cache.ttl_seconds == 60.0
+    assert cache.max_entries == 10
+
+
+@pytest.mark.parametrize("ttl, max_entries", [("7d", "lots"), ("-1", "0"), ("inf", "1.5")])
+def test_default_cache_invalid_env_falls_back(monkeypatch, fresh_default, ttl, max_entries):
+    monkeypatch.setenv("LLM_CACHE_TTL_SECONDS", ttl)
+    monkeypatch.setenv("LLM_CACHE_MAX_ENTRIES", max_entries)
+    cache = llm_cache.default_cache()
+    assert cache.ttl_seconds == llm_cache.DEFAULT_TTL_SECONDS
+    assert cache.max_entries == llm_cache.DEFAULT_MAX_ENTRIES
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX 권한 비트")
+def test_db_file_is_owner_only(tmp_path):
+    cache = LlmResponseCache(tmp_path / "c.sqlite3")
+    cache.put("k", "m", "v")
+    assert stat.S_IMODE((tmp_path / "c.sqlite3").stat().st_mode) == 0o600
+
+
+# -------------------- 키 --------------------
+
+
+def _kwargs(**over):
+    base = llm_client._completion_kwargs("프롬프트")
+    base.update(over)
+    return base
+
+
+def test_cache_key_is_deterministic():
+    assert cache_key(_kwargs()) == cache_key(_kwargs())
+
+
+@pytest.mark.parametrize(
+    "over",
+    [
+        {"model": "gpt-4o"},
+        {"temperature": 0.0},
+        {"max_tokens": 100},
+        {"messages": llm_client._completion_kwargs("프롬프트 ")["messages"]},
+    ],
+)
+def test_cache_key_changes_with_response_inputs(over):
+    assert cache_key(_kwargs(**over)) != cache_key(_kwargs())
+
+
+def test_cache_key_ignores_stream_flag():
+    assert cache_key({**_kwargs(), "stream": True}) == cache_key(_kwargs())
+
+
+# -------------------- generate_analysis 연동 --------------------
+
+
+DOC = {
+    "summary": {"headline": "환급 예상", "key_points": ["a"]},
+    "sections": [
+        {"id": "card", "title": "카드", "highlight": "h", "detail": "d", "tips": []},
+    ],
+    "tax_tips": ["팁"],
+}
+
+
+class _FakeCompletions:
+    def __init__(self, content: str):
+        self.content = content
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        if kwargs.get("stream"):
+
+            async def gen():
+                for i in range(0, len(self.content), 5):
+                    delta = SimpleNamespace(content=self.content[i : i + 5])
+                    yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+            return gen()
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    c = LlmResponseCache(tmp_path / "llm_cache.sqlite3")
+    monkeypatch.setattr(llm_cache, "default_cache", lambda: c)
+    return c
+
+
+def _install_fake(monkeypatch, content: str) -> _FakeCompletions:
+    completions = _FakeCompletions(content)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    monkeypatch.setattr(llm_client, "_get_client", lambda: client)
+    return completions
+
+
+def _analysis_kwargs(total_salary: int = 30_000_000) -> dict:
+    return dict(
+        income=Income(total_salary=total_salary, non_taxable=0, bonus=0),
+        dependents=Dependents(has_spouse=False),
+        conditions=Conditions(
+            householder=True, no_house=True, lease_contract=False, has_loan=False
+        ),
+        parsed_pdf=ParsedPdfData(),
+        manual_input=ManualInputRequest(
+            rent=RentInfo(has_rent=False),
+            housing_loan=HousingLoanInfo(has_loan=False),
+        ),
+        rule_context=RuleContext(),
+    )
+
+
+async def test_generate_analysis_second_call_hits_cache(monkeypatch, cache):
+    completions = _install_fake(monkeypatch, json.dumps(DOC, ensure_ascii=False))
+
+    first = await llm_client.generate_analysis(**_analysis_kwargs())
+    second = await llm_client.generate_analysis(**_analysis_kwargs())
+
+    assert completions.calls == 1
+    assert first[3] is False
+    assert second[3] is True
+    assert second[:3] == first[:3]
+    assert cache.count() == 1
+
+
+async def test_generate_analysis_different_prompt_misses(monkeypatch, cache):
+    completions = _install_fake(monkeypatch, json.dumps(DOC, ensure_ascii=False))
+    await llm_client.generate_analysis(**_analysis_kwargs(30_000_000))
+    *_, cached = await llm_client.generate_analysis(**_analysis_kwargs(40_000_000))
+    assert cached is False
+    assert completions.calls == 2
+
+
+async def test_invalid_response_is_not_cached(monkeypatch, cache):
+    _install_fake(monkeypatch, "분석할 수 없습니다")
+    with pytest.raises(ValueError):
+        await llm_client.generate_analysis(**_analysis_kwargs())
+    assert cache.count() == 0
+
+
+async def test_stale_entry_is_regenerated(monkeypatch, cache):
+    kw = _analysis_kwargs()
+    key = cache_key(llm_client._completion_kwargs(llm_client.build_prompt(**kw)))
+    cache.put(key, "gpt-4o-mini", '{"summary": {}}')
+    completions = _install_fake(monkeypatch, json.dumps(DOC, ensure_ascii=False))
+
+    *_, cached = await llm_client.generate_analysis(**kw)
+    assert cached is False
+    assert completions.calls == 1
+    # 새 응답으로 덮어씀
+    *_, cached = await llm_client.generate_analysis(**kw)
+    assert cached is True
+
+
+async def test_storage_error_falls_back_to_llm(monkeypatch, tmp_path):
+    class _Broken:
+        def get(self, key):
+            raise sqlite3.OperationalError("database is locked")
+
+        def put(self, key, model, content):
+            raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(llm_cache, "default_cache", lambda: _Broken())
+    completions = _install_fake(monkeypatch, json.dumps(DOC, ensure_ascii=False))
+    *_, cached = await llm_client.generate_analysis(**_analysis_kwargs())
+    assert cached is False
+    assert completions.calls == 1
+
+
+async def test_cache_disabled_always_calls_llm(monkeypatch):
+    monkeypatch.setattr(llm_cache, "default_cache", lambda: None)
+    completions = _install_fake(monkeypatch, json.dumps(DOC, ensure_ascii=False))
+    await llm_client.generate_analysis(**_analysis_kwargs())
+    await llm_client.generate_analysis(**_analysis_kwargs())
+    assert completions.calls == 2
+
+
+# -------------------- stream_analysis 공유 --------------------
+
+
+async def test_stream_populates_cache_for_generate(monkeypatch, cache):
+    completions = _install_fake(monkeypatch, json.dumps(DOC, ensure_ascii=False))
+
+    kinds = [k async for k, _ in llm_client.stream_analysis(**_analysis_kwargs())]
+    assert "cached" not in kinds
+
+    *_, cached = await llm_client.generate_analysis(**_analysis_kwargs())
+    assert cached is True
+    assert completions.calls == 1
+
+
+async def test_stream_replays_cached_response(monkeypatch, cache):
+    completions = _install_fake(monkeypatch, json.dumps(DOC, ensure_ascii=False))
+    await llm_client.generate_analysis(**_analysis_kwargs())
+
+    events = [ev async for ev in llm_client.stream_analysis(**_analysis_kwargs())]
+    assert [k for k, _ in events] == ["cached", "summary", "section", "tax_tips"]
+    assert events[2][1].id == "card"
+    assert completions.calls == 1
@@ -12,6 +12,7 @@ import pytest
 
 from app.schemas.legal_schema import Law, LawArticle, LawChunk
 from app.services import rag
+from app.services.embedding_store import store_for
 
 
 # -------------------- helpers --------------------
@@ -331,3 +332,342 @@ async def test_index_raises_on_embedding_count_mismatch(tmp_path: Path):
 
     with pytest.raises(RuntimeError):
         await rag.index_law(law, embed_fn=bad_embed, data_dir=tmp_path)
+
+
+# -------------------- 임베딩 재사용 --------------------
+
+
+def _recording(embed):
+    calls: list[list[str]] = []
+
+    async def _embed(texts: list[str]) -> list[list[float]]:
+        calls.append(list(texts))
+        return await embed(texts)
+
+    return _embed, calls
+
+
+async def test_reindex_embeds_only_changed_chunks(tmp_path: Path):
+    embed, calls = _recording(
+        make_deterministic_embedder({"신용카드": [1.0, 0.0], "의료비": [0.0, 1.0]})
+    )
+    await rag.index_law(_law(), embed_fn=embed, data_dir=tmp_path)
+    assert len(calls[0]) == 3
+
+    # 개정: §52② 만 문구 변경 (text_hash 도 바뀜)
+    amended = _law()
+    changed = amended.articles[0].paragraphs[1]
+    changed.text = "의료비가 총급여의 5%를 초과한 분에 대해 세액공제한다."
+    changed.text_hash = "h:amended"
+    pack = await rag.index_law(amended, embed_fn=embed, data_dir=tmp_path)
+
+    assert calls[1] == [changed.text]
+    assert [c.embedding for c in pack.chunks] == [[1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]
+    hits, _ = await rag.search("의료비", top_k=1, embed_fn=embed, data_dir=tmp_path)
+    assert hits[0].chunk.text == changed.text
+
+
+async def test_reindex_unchanged_law_skips_embedding(tmp_path: Path):
+    embed, calls = _recording(make_deterministic_embedder({"공제": [1.0, 0.0]}))
+    first = await rag.index_law(_law(), embed_fn=embed, data_dir=tmp_path)
+    second = await rag.index_law(_law(), embed_fn=embed, data_dir=tmp_path)
+    assert len(calls) == 1
+    assert [c.embedding for c in second.chunks] == [c.embedding for c in first.chunks]
+
+
+async def test_duplicate_text_hash_embedded_once(tmp_path: Path):
+    law = _law()
+    for para in law.articles[0].paragraphs:
+        para.text_hash = "h:same"
+    embed, calls = _recording(make_deterministic_embedder({"공제": [1.0, 0.0]}))
+    pack = await rag.index_law(law, embed_fn=embed, data_dir=tmp_path)
+    assert len(calls[0]) == 2
+    assert len(pack.chunks) == 3
+
+
+# -------------------- query 임베딩 캐시 --------------------
+
+
+@pytest.fixture
+def default_embed(monkeypatch):
+    """기본 임베딩(_default_embed) 을 호출 기록되는 가짜로 교체 + 캐시 격리."""
+    embed, calls = _recording(make_deterministic_embedder({"의료비": [0.0, 1.0]}))
+    monkeypatch.setattr(rag, "_default_embed", embed)
+    rag._QUERY_CACHE.clear()
+    yield calls
+    rag._QUERY_CACHE.clear()
+
+
+async def test_query_embedding_cached_across_searches(tmp_path: Path, default_embed):
+    index_embed = make_deterministic_embedder({"신용카드": [1.0, 0.0], "의료비": [0.0, 1.0]})
+    await rag.index_law(_law(), embed_fn=index_embed, data_dir=tmp_path)
+
+    first, _ = await rag.search("의료비  공제", top_k=1, data_dir=tmp_path)
+    # 공백 / 전각 차이는 같은 키
+    second, _ = await rag.search(" 의료비 공제 ", top_k=1, data_dir=tmp_path)
+    third, _ = await rag.search("의료비　공제", top_k=1, data_dir=tmp_path)
+
+    assert default_embed == [["의료비 공제"]]
+    assert first == second == third
+    assert first[0].chunk.paragraph_no == "②"
+
+
+async def test_query_embedding_persisted_to_store(tmp_path: Path, default_embed):
+    index_embed = make_deterministic_embedder({"의료비": [0.0, 1.0]})
+    await rag.index_law(_law(), embed_fn=index_embed, data_dir=tmp_path)
+    store = store_for(tmp_path)
+    chunk_vectors = store.count()
+    await rag.search("의료비", data_dir=tmp_path)
+
+    rag._QUERY_CACHE.clear()  # 재시작 흉내
+    hits, _ = await rag.search("의료비", top_k=1, data_dir=tmp_path)
+    assert len(default_embed) == 1
+    assert hits[0].chunk.paragraph_no == "②"
+    # query 벡터는 청크 벡터 테이블과 분리
+    assert store.query_count() == 1
+    assert store.count() == chunk_vectors
+
+
+async def test_query_cache_persist_off(tmp_path: Path, default_embed, monkeypatch):
+    monkeypatch.setattr(rag, "QUERY_CACHE_PERSIST", False)
+    index_embed = make_deterministic_embedder({"의료비": [0.0, 1.0]})
+    await rag.index_law(_law(), embed_fn=index_embed, data_dir=tmp_path)
+    await rag.search("의료비", data_dir=tmp_path)
+    rag._QUERY_CACHE.clear()
+    await rag.search("의료비", data_dir=tmp_path)
+    assert len(default_embed) == 2
+
+
+async def test_injected_embed_fn_bypasses_query_cache(tmp_path: Path, default_embed):
+    embed, calls = _recording(make_deterministic_embedder({"의료비": [0.0, 1.0]}))
+    await rag.index_law(_law(), embed_fn=embed, data_dir=tmp_path)
+    for _ in range(2):
+        await rag.search("의료비", embed_fn=embed, data_dir=tmp_path)
+    assert len(calls) == 3  # 인덱싱 1 + 검색 2
+    assert default_embed == []
+
+
+# -------------------- 조문 anchor 색인 --------------------
+
+
+@pytest.mark.parametrize(
+    "anchor, key",
+    [
+        ("소득세법 §59의4 ②", ("소득세법", "59의4", "2")),
+        ("조세특례제한법 제126조의2 제1항 제3호", ("조세특례제한법", "126의2", "1", "3")),
+        ("조세특례제한법 §95의2", ("조세특례제한법", "95의2")),
+        ("소득세법", None),
+    ],
+)
+def test_parse_anchor(anchor, key):
+    assert rag.parse_anchor(anchor) == key
+
+
+async def test_lookup_anchor_without_embedding(tmp_path: Path):
+    embed = make_deterministic_embedder({"공제": [1.0, 0.0]})
+    await rag.index_law(_law(), embed_fn=embed, data_dir=tmp_path)
+
+    (hit,) = rag.lookup_anchor("테스트법 §52 ②", tmp_path)
+    assert hit.chunk.chunk_id == "테스트법-§52-②"
+    assert hit.score == 1.0
+    # 같은 조문, 다른 표기
+    assert rag.lookup_anchor("테스트법 제52조 제2항", tmp_path) == [hit]
+    # 조 단위 → 그 조의 전체 청크
+    assert [h.chunk.paragraph_no for h in rag.lookup_anchor("테스트법 §52", tmp_path)] == [
+        "①",
+        "②",
+    ]
+    # 없는 항은 조 단위로 물러남, 없는 조·법령은 빈 결과
+    assert len(rag.lookup_anchor("테스트법 §59 ③", tmp_path)) == 1
+    assert rag.lookup_anchor("테스트법 §60", tmp_path) == []
+    assert rag.lookup_anchor("다른법 §52", tmp_path) == []
+
+    assert rag.get_chunk("테스트법-§59-①", tmp_path).article_no == "59"
+    assert rag.get_chunk("nope", tmp_path) is None
+
+
+async def test_lookup_anchor_prefers_latest_effective_date(tmp_path: Path):
+    embed = make_deterministic_embedder({"공제": [1.0, 0.0]})
+    old = _law()
+    old.effective_date = "20240101"
+    new = _law()
+    new.effective_date = "20250101"
+    new.articles[1].paragraphs[0].text = "개정된 월세 조문"
+    await rag.index_law(new, embed_fn=embed, data_dir=tmp_path)
+    await rag.index_law(old, embed_fn=embed, data_dir=tmp_path)
+
+    (hit,) = rag.lookup_anchor("테스트법 §59 ①", tmp_path)
+    assert hit.chunk.text == "개정된 월세 조문"
+
+
+# -------------------- 바이너리 포맷 --------------------
+
+
+async def test_index_writes_float32_matrix_and_compact_sidecar(tmp_path: Path):
+    import json
+
+    import numpy as np
+
+    embed = make_deterministic_embedder(
+        {"신용카드": [1.0, 0.0, 0.0], "의료비": [0.0, 1.0, 0.0], "무주택": [0.0, 0.0, 1.0]}
+    )
+    await rag.index_law(_law(), embed_fn=embed, data_dir=tmp_path)
+
+    law_dir = tmp_path / "rag_index" / "L1"
+    sidecar = json.loads((law_dir / "latest.json").read_text(encoding="utf-8"))
+    assert sidecar["format"] == rag.INDEX_FORMAT
+    assert (sidecar["rows"], sidecar["dim"]) == (3, 3)
+    assert all("embedding" not in c for c in sidecar["chunks"])
+    assert sorted(p.name for p in law_dir.iterdir()) == ["latest.json", "latest.npy"]
+
+    (pack,) = rag.list_pack_indexes(tmp_path)
+    assert isinstance(pack.embeddings, np.memmap)
+    assert pack.embeddings.dtype == np.float32
+    assert pack.chunk(1).embedding == [0.0, 1.0, 0.0]
+
+
+async def test_reindex_keeps_open_mmap_valid(tmp_path: Path):
+    embed_a = make_deterministic_embedder({"공제": [1.0, 0.0]})
+    embed_b = make_deterministic_embedder({"공제": [0.0, 1.0]})
+    await rag.index_law(_law(), embed_fn=embed_a, data_dir=tmp_path)
+    (old,) = rag.list_pack_indexes(tmp_path)
+
+    # 모델이 다르면 임베딩 저장소 재사용 없음 → 새 벡터
+    await rag.index_law(
+        _law(), embed_fn=embed_b, embedding_model="other-model", data_dir=tmp_path
+    )
+    (new,) = rag.list_pack_indexes(tmp_path)
+    # os.replace → 이전 mmap 은 옛 파일 내용을 그대로 봄
+    assert old.embeddings[0].tolist() == [1.0, 0.0]
+    assert new.embeddings[0].tolist() == [0.0, 1.0]
+
+
+async def test_legacy_json_pack_still_searchable(tmp_path: Path):
+    import json
+
+    embed = make_deterministic_embedder(
+        {"신용카드": [1.0, 0.0, 0.0], "의료비": [0.0, 1.0, 0.0], "무주택": [0.0, 0.0, 1.0]}
+    )
+    pack = await rag.index_law(_law(), embed_fn=embed, data_dir=tmp_path)
+    law_dir = tmp_path / "rag_index" / "L1"
+    (law_dir / "latest.npy").unlink()
+    (law_dir / "latest.json").write_text(
+        json.dumps(pack.model_dump(mode="json"), ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+
+    hits, total = await rag.search(
+        "의료비", top_k=1, embed_fn=embed, data_dir=tmp_path
+    )
+    assert total == 3
+    assert hits[0].chunk.paragraph_no == "②"
+    assert rag.list_packs(tmp_path)[0].chunks == pack.chunks
+
+
+# -------------------- 상주 인덱스 캐시 --------------------
+
+
+async def test_snapshot_shared_until_index_law(tmp_path: Path):
+    embed = make_deterministic_embedder({"공제": [1.0, 0.0]})
+    await rag.index_law(_law(law_id="A", law_name="A법"), embed_fn=embed, data_dir=tmp_path)
+
+    snap = rag.index_snapshot(tmp_path)
+    assert rag.index_snapshot(tmp_path) is snap  # 같은 불변 snapshot 공유
+    (pack_a,) = snap.packs
+
+    # 같은 프로세스의 index_law → 즉시 새 snapshot, 안 바뀐 팩은 객체 재사용
+    await rag.index_law(_law(law_id="B", law_name="B법"), embed_fn=embed, data_dir=tmp_path)
+    new = rag.index_snapshot(tmp_path)
+    assert new.generation > snap.generation
+    assert new.total_chunks == 6
+    assert new.packs[0] is pack_a
+
+
+async def test_cache_detects_external_rewrite_after_interval(tmp_path: Path):
+    embed_a = make_deterministic_embedder({"공제": [1.0, 0.0]})
+    embed_b = make_deterministic_embedder({"공제": [0.0, 1.0]})
+    await rag.index_law(_law(), embed_fn=embed_a, data_dir=tmp_path)
+
+    now = [0.0]
+    cache = rag.IndexCache(tmp_path / "rag_index", check_interval=1.0, clock=lambda: now[0])
+    snap = cache.snapshot()
+
+    # 다른 워커의 재인덱싱 흉내 — 이 캐시는 invalidate 되지 않음
+    await rag.index_law(
+        _law(), embed_fn=embed_b, embedding_model="other-model", data_dir=tmp_path
+    )
+    now[0] = 0.5
+    assert cache.snapshot() is snap
+    now[0] = 1.5
+    fresh = cache.snapshot()
+    assert fresh.generation == snap.generation + 1
+    assert fresh.packs[0].embeddings[0].tolist() == [0.0, 1.0]
+
+    # 변경 없으면 재스캔해도 snapshot 유지
+    now[0] = 3.0
+    assert cache.snapshot() is fresh
+
+
+# -------------------- 행렬 검색 --------------------
+
+
+async def test_matrix_search_matches_bruteforce_ordering(tmp_path: Path):
+    """정규화 행렬 + argpartition top-K == 기존 cosine 전체 정렬 (동점은 인덱스 순)."""
+    import random
+
+    import numpy as np
+
+    rng = random.Random(11)
+    dim = 16
+    law = Law(
+        law_id="L1",
+        law_name="L",
+        articles=[
+            LawArticle(
+                law_id="L1",
+                law_name="L",
+                article_no=str(a),
+                paragraphs=[
+                    _chunk(f"c{a}-{i}", f"t{a}-{i}", article_no=str(a)) for i in range(40)
+                ],
+            )
+            for a in range(5)
+        ],
+        raw_text="x",
+        text_hash="h",
+        fetched_at=datetime.now(timezone.utc),
+    )
+    # 일부는 중복 벡터(동점) / 영벡터
+    pool = [[rng.uniform(-1, 1) for _ in range(dim)] for _ in range(120)]
+    pool.append([0.0] * dim)
+    vectors = {f"t{a}-{i}": rng.choice(pool) for a in range(5) for i in range(40)}
+
+    async def embed(texts):
+        return [vectors.get(t) or [rng.uniform(-1, 1) for _ in range(dim)] for t in texts]
+
+    pack = await rag.index_law(law, embed_fn=embed, data_dir=tmp_path)
+    # 디스크는 float32 — 기준값도 float32 로 반올림한 벡터로 계산
+    rows = [(c, np.float32(c.embedding).tolist()) for c in pack.chunks]
+
+    for _ in range(5):
+        q = [rng.uniform(-1, 1) for _ in range(dim)]
+
+        async def qembed(texts, q=q):
+            return [q]
+
+        for article in (None, "3"):
+            expected = sorted(
+                (
+                    (rag.cosine(q, emb), idx, c)
+                    for idx, (c, emb) in enumerate(rows)
+                    if article is None or c.article_no == article
+                ),
+                key=lambda x: x[0],
+                reverse=True,
+            )[:7]
+            hits, _ = await rag.search(
+                "q", top_k=7, article_no_filter=article, embed_fn=qembed, data_dir=tmp_path
+            )
+            assert [h.chunk.chunk_id for h in hits] == [c.chunk_id for _, _, c in expected]
+            for h, (score, _, _) in zip(hits, expected):
+                assert math.isclose(h.score, score, abs_tol=1e-5)
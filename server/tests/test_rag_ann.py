@@ -0,0 +1,191 @@
+"""
+rag_ann (IVF ANN) 테스트.
+
+- recall: 군집 데이터에서 정확 검색 대비 top-K 재현율
+- nprobe = nlist → 정확 검색과 동일
+- 디스크 저장 / 재사용 / 옛 파일 정리
+- rag.search 통합: 큰 코퍼스만 ANN, 작은 코퍼스·exact=True 는 정확 검색
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.schemas.legal_schema import Law, LawArticle, LawChunk
+from app.services import rag, rag_ann
+from app.services.rag_ann import AnnConfig, IVFIndex, top_k_rows
+
+
+def _clustered(rows: int, dim: int, clusters: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    x = centers[rng.integers(0, clusters, rows)] + 0.3 * rng.normal(size=(rows, dim))
+    x /= np.linalg.norm(x, axis=1, keepdims=True)
+    return x.astype(np.float32)
+
+
+def _exact(matrix, q, k, mask=None):
+    rows = np.flatnonzero(mask) if mask is not None else np.arange(len(matrix))
+    scores = matrix[rows] @ q
+    return rows[top_k_rows(scores, rows, k)]
+
+
+def test_ivf_recall_on_clustered_data():
+    matrix = _clustered(4_000, 32, 40)
+    index = IVFIndex.build(matrix, AnnConfig(nlist=64, seed=1))
+    queries = _clustered(50, 32, 40, seed=9)
+
+    recall = []
+    for q in queries:
+        got, scores = index.search(matrix, q, 10, None, nprobe=8)
+        assert np.all(np.diff(scores) <= 0)
+        recall.append(len(set(got) & set(_exact(matrix, q, 10))) / 10)
+    assert np.mean(recall) >= 0.9
+
+
+def test_ivf_full_probe_equals_exact_with_mask():
+    matrix = _clustered(1_500, 16, 10, seed=2)
+    index = IVFIndex.build(matrix, AnnConfig(nlist=20))
+    mask = np.zeros(len(matrix), dtype=np.bool_)
+    mask[::3] = True
+    for q in _clustered(10, 16, 10, seed=5):
+        got, _ = index.search(matrix, q, 7, mask, nprobe=index.nlist)
+        assert got.tolist() == _exact(matrix, q, 7, mask).tolist()
+
+
+def test_load_or_build_persists_and_reuses(tmp_path: Path, monkeypatch):
+    matrix = _clustered(600, 8, 6)
+    config = AnnConfig(nlist=12)
+    built = rag_ann.load_or_build(matrix, 8, "k1", tmp_path, config)
+    assert (tmp_path / "ivf-8-k1.npz").exists()
+
+    def no_build(*a, **kw):
+        raise AssertionError("디스크에 있으면 다시 빌드하지 않음")
+
+    monkeypatch.setattr(IVFIndex, "build", classmethod(no_build))
+    loaded = rag_ann.load_or_build(matrix, 8, "k1", tmp_path, config)
+    np.testing.assert_array_equal(loaded.order, built.order)
+
+    # 새 key 로 빌드되면 옛 파일 정리
+    monkeypatch.undo()
+    rag_ann.load_or_build(matrix, 8, "k2", tmp_path, config)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["ivf-8-k2.npz"]
+
+
+# -------------------- rag.search 통합 --------------------
+
+
+def _law(rows: int, dim: int) -> tuple[Law, dict[str, list[float]]]:
+    matrix = _clustered(rows, dim, 12, seed=4)
+    chunks = [
+        LawChunk(
+            chunk_id=f"c{i}",
+            law_id="L1",
+            law_name="L",
+            article_no=str(i % 7),
+            text=f"t{i}",
+            text_hash=f"h{i}",
+        )
+        for i in range(rows)
+    ]
+    law = Law(
+        law_id="L1",
+        law_name="L",
+        articles=[LawArticle(law_id="L1", law_name="L", article_no="0", paragraphs=chunks)],
+        raw_text="x",
+        text_hash="h",
+        fetched_at=datetime.now(timezone.utc),
+    )
+    return law, {f"t{i}": matrix[i].tolist() for i in range(rows)}
+
+
+async def _index(tmp_path, rows, dim):
+    law, vectors = _law(rows, dim)
+
+    async def embed(texts):
+        return [vectors[t] for t in texts]
+
+    await rag.index_law(law, embed_fn=embed, data_dir=tmp_path)
+    return vectors
+
+
+@pytest.mark.parametrize("exact", [False, True])
+async def test_search_uses_ann_only_for_large_corpus(tmp_path: Path, monkeypatch, exact):
+    monkeypatch.setattr(
+        rag, "ANN_CONFIG", AnnConfig(min_rows=1_000, nlist=32, exact_below=100)
+    )
+    vectors = await _index(tmp_path, 2_000, 16)
+    q = vectors["t5"]
+
+    async def qembed(texts):
+        return [q]
+
+    hits, total = await rag.search(
+        "q", top_k=5, embed_fn=qembed, data_dir=tmp_path, exact=exact
+    )
+    assert total == 2_000
+    assert hits[0].chunk.chunk_id == "c5"
+    # 인덱스는 index_law 시점에 이미 빌드·저장됨 (exact 여부와 무관)
+    assert len(list((tmp_path / "rag_ann").glob("*.npz"))) == 1
+
+    # 전체 probe 면 정확 검색과 같은 결과
+    full, _ = await rag.search(
+        "q", top_k=5, embed_fn=qembed, data_dir=tmp_path, nprobe=4096
+    )
+    exact_hits, _ = await rag.search(
+        "q", top_k=5, embed_fn=qembed, data_dir=tmp_path, exact=True
+    )
+    assert [h.chunk.chunk_id for h in full] == [h.chunk.chunk_id for h in exact_hits]
+
+
+async def test_index_law_builds_ann_and_search_only_loads(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(
+        rag, "ANN_CONFIG", AnnConfig(min_rows=1_000, nlist=32, exact_below=100)
+    )
+    vectors = await _index(tmp_path, 2_000, 16)
+    (path,) = (tmp_path / "rag_ann").glob("*.npz")
+
+    # 다른 워커(메모리 인덱스 없음) 의 검색은 디스크에서 로드만 — k-means 빌드 없음
+    for block in rag.index_snapshot(tmp_path).blocks:
+        block.ann.clear()
+
+    def no_build(*a, **kw):
+        raise AssertionError("검색 경로에서 빌드하지 않음")
+
+    monkeypatch.setattr(IVFIndex, "build", classmethod(no_build))
+    loads = []
+    real_load = rag_ann.load
+
+    def counting_load(*a, **kw):
+        loads.append(a)
+        return real_load(*a, **kw)
+
+    monkeypatch.setattr(rag_ann, "load", counting_load)
+
+    async def qembed(texts):
+        return [vectors["t5"]]
+
+    hits, _ = await rag.search("q", top_k=5, embed_fn=qembed, data_dir=tmp_path)
+    assert hits[0].chunk.chunk_id == "c5"
+    assert len(loads) == 1
+
+    # 인덱스 파일이 없으면 빌드 대신 정확 검색
+    path.unlink()
+    for block in rag.index_snapshot(tmp_path).blocks:
+        block.ann.clear()
+    hits, _ = await rag.search("q", top_k=5, embed_fn=qembed, data_dir=tmp_path)
+    assert hits[0].chunk.chunk_id == "c5"
+    assert not list((tmp_path / "rag_ann").glob("*.npz"))
+
+
+async def test_small_corpus_stays_exact(tmp_path: Path):
+    vectors = await _index(tmp_path, 300, 8)
+
+    async def qembed(texts):
+        return [vectors["t1"]]
+
+    hits, _ = await rag.search("q", top_k=3, embed_fn=qembed, data_dir=tmp_path)
+    assert hits[0].chunk.chunk_id == "c1"
+    assert not (tmp_path / "rag_ann").exists()
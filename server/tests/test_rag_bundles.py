@@ -0,0 +1,106 @@
+"""
+rag_bundles (룰 조합별 RAG 컨텍스트 사전 계산) 테스트.
+
+- build_bundles → get_bundle 이 실시간 fetch_context 와 같은 결과
+- 빌드 중 검색 실패 → 저장 안 함
+- index_law / 룰 제목 변경 / top_k 차이 → miss
+- analyze._fetch_rag_context 는 번들이 있으면 검색 안 함
+"""
+
+from pathlib import Path
+
+import pytest
+
+from app.routers.analyze import _fetch_rag_context
+from app.services import rag, rag_bundles, rules_engine
+from app.services.rules_engine import load_rules
+
+from tests.test_rag import _law, make_deterministic_embedder
+
+EMBED = make_deterministic_embedder(
+    {"신용카드": [1.0, 0.0, 0.0], "의료비": [0.0, 1.0, 0.0], "월세": [0.0, 0.0, 1.0]}
+)
+
+
+async def _index_and_build(tmp_path: Path) -> int:
+    await rag.index_law(_law(), embed_fn=EMBED, data_dir=tmp_path)
+    return await rag_bundles.build_bundles(2025, top_k=2, data_dir=tmp_path, embed_fn=EMBED)
+
+
+async def test_bundles_match_live_context(tmp_path: Path):
+    rules = load_rules(year=2025).rules
+    n = await _index_and_build(tmp_path)
+    # /analyze 가 조회하는 전체 룰 조합만
+    assert n == 1
+
+    bundled = rag_bundles.get_bundle(rules, 2, data_dir=tmp_path)
+    live = await rag_bundles.fetch_context(rules, 2, data_dir=tmp_path, embed_fn=EMBED)
+    assert bundled is not None and len(bundled) == 2
+    assert [(h.chunk.chunk_id, h.score) for h in bundled] == [
+        (h.chunk.chunk_id, h.score) for h in live
+    ]
+
+    # 부분 조합 / 다른 top_k → miss
+    assert rag_bundles.get_bundle([rules[0]], 2, data_dir=tmp_path) is None
+    assert rag_bundles.get_bundle(rules, 5, data_dir=tmp_path) is None
+
+
+async def test_bundle_key_matches_analyze_evaluations(tmp_path: Path):
+    await _index_and_build(tmp_path)
+    compiled = rules_engine.compiled_rules(load_rules(year=2025))
+    evaluations = [c.evaluate({}) for c in compiled]
+    assert rag_bundles.get_bundle(evaluations, 2, data_dir=tmp_path) is not None
+
+
+async def test_search_failure_is_not_stored(tmp_path: Path):
+    await rag.index_law(_law(), embed_fn=EMBED, data_dir=tmp_path)
+
+    async def broken_embed(texts):
+        raise RuntimeError("embedding API down")
+
+    with pytest.raises(RuntimeError):
+        await rag_bundles.build_bundles(
+            2025, top_k=2, data_dir=tmp_path, embed_fn=broken_embed
+        )
+    assert not (tmp_path / "rag_bundles" / "2025.json").exists()
+    # 실시간 경로는 여전히 실패를 흡수
+    rules = load_rules(year=2025).rules
+    assert await rag_bundles.fetch_context(
+        rules, 2, data_dir=tmp_path, embed_fn=broken_embed
+    ) is not None
+
+
+async def test_index_law_invalidates_bundles(tmp_path: Path):
+    rules = load_rules(year=2025).rules
+    await _index_and_build(tmp_path)
+    assert rag_bundles.get_bundle(rules, 2, data_dir=tmp_path) is not None
+
+    await rag.index_law(_law(law_id="L2", law_name="다른법"), embed_fn=EMBED, data_dir=tmp_path)
+    assert not (tmp_path / "rag_bundles" / "2025.json").exists()
+    assert rag_bundles.get_bundle(rules, 2, data_dir=tmp_path) is None
+
+
+async def test_changed_rule_title_misses(tmp_path: Path):
+    rules = load_rules(year=2025).rules
+    await _index_and_build(tmp_path)
+    edited = [rules[0].model_copy(update={"title": "바뀐 제목"})]
+    assert rag_bundles.get_bundle(edited, 2, data_dir=tmp_path) is None
+
+
+async def test_fetch_rag_context_reads_bundle(monkeypatch):
+    rc = rules_engine.RuleContext()
+    rc.evaluations = [
+        rules_engine.compiled_rules(load_rules(year=2025))[0].evaluate({})
+    ]
+    sentinel = [object()]
+
+    def fake_get_bundle(rules, top_k, **kwargs):
+        assert [r.rule_id for r in rules] == [rc.evaluations[0].rule_id]
+        return sentinel
+
+    async def no_live(*args, **kwargs):
+        raise AssertionError("번들이 있으면 실시간 계산 안 함")
+
+    monkeypatch.setattr(rag_bundles, "get_bundle", fake_get_bundle)
+    monkeypatch.setattr(rag_bundles, "fetch_context", no_live)
+    assert await _fetch_rag_context(rc) is sentinel
@@ -0,0 +1,139 @@
+"""
+rag_lexical (문자 n-gram BM25) + rag.search lexical / hybrid 모드 테스트.
+"""
+
+import math
+import random
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.services import rag
+from app.services.rag_lexical import BM25_B, BM25_K1, LexicalIndex, tokenize
+
+from tests.test_rag import _law, make_deterministic_embedder
+
+
+def test_tokenize_korean_bigrams():
+    assert tokenize("월세액의 일정률") == ["월세", "세액", "액의", "일정", "정률"]
+    assert tokenize("§59의4 ②") == ["59", "9의", "의4", "2"]  # NFKC: ② → 2
+    assert tokenize("ＡＢ 공") == ["ab", "공"]
+
+
+def _reference_bm25(texts, query):
+    docs = [Counter(tokenize(t)) for t in texts]
+    lens = [sum(d.values()) for d in docs]
+    avgdl = sum(lens) / len(lens)
+    out = []
+    for d, dl in zip(docs, lens):
+        score = 0.0
+        for term in set(tokenize(query)):
+            df = sum(1 for x in docs if term in x)
+            if not df or term not in d:
+                continue
+            idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+            tf = d[term]
+            score += idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * dl / avgdl))
+        out.append(score)
+    return out
+
+
+def test_scores_match_reference_bm25():
+    rng = random.Random(5)
+    vocab = ["월세", "세액", "공제", "의료비", "신용카드", "무주택", "총급여", "초과"]
+    texts = [" ".join(rng.choices(vocab, k=rng.randint(1, 12))) for _ in range(200)]
+    index = LexicalIndex.build(texts)
+    for query in ["월세액 공제", "의료비", "신용카드 총급여 초과", "없는말"]:
+        got = index.scores(query)
+        assert np.allclose(got, _reference_bm25(texts, query), rtol=1e-5, atol=1e-6)
+
+
+def test_search_orders_and_masks():
+    texts = ["월세액 공제", "월세 월세 월세", "의료비", "월세액"]
+    index = LexicalIndex.build(texts)
+    rows, scores = index.search("월세액", k=10)
+    assert set(rows.tolist()) == {0, 1, 3}
+    assert list(scores) == sorted(scores, reverse=True)
+    assert rows[0] == 3  # 짧은 문서 + 두 bigram 모두 일치
+
+    mask = np.array([True, True, True, False])
+    rows, _ = index.search("월세액", k=10, mask=mask)
+    assert 3 not in rows.tolist()
+    assert index.search("연금", k=5)[0].tolist() == []
+
+
+# -------------------- rag.search 통합 --------------------
+
+
+async def _failing_embed(texts):
+    raise AssertionError("lexical 모드는 임베딩을 호출하면 안 됨")
+
+
+async def test_lexical_mode_skips_embedding(tmp_path: Path):
+    embed = make_deterministic_embedder({"공제": [1.0, 0.0]})
+    await rag.index_law(_law(), embed_fn=embed, data_dir=tmp_path)
+
+    hits, total = await rag.search(
+        "월세액", top_k=3, embed_fn=_failing_embed, data_dir=tmp_path, mode="lexical"
+    )
+    assert total == 3
+    # "세액" bigram 은 §52② "세액공제" 에도 걸리지만 "월세" 까지 맞는 §59 가 1위
+    assert [h.chunk.article_no for h in hits] == ["59", "52"]
+    assert hits[0].score > hits[1].score > 0
+
+    none, _ = await rag.search(
+        "월세",
+        embed_fn=_failing_embed,
+        data_dir=tmp_path,
+        mode="lexical",
+        article_no_filter="52",
+    )
+    assert none == []
+
+
+async def test_lexical_index_built_at_index_time(tmp_path: Path, monkeypatch):
+    embed = make_deterministic_embedder({"공제": [1.0, 0.0]})
+    await rag.index_law(_law(), embed_fn=embed, data_dir=tmp_path)
+    assert all(b.lexical is not None for b in rag.index_snapshot(tmp_path).blocks)
+
+    def no_build(cls, texts):
+        raise AssertionError("검색 요청에서 BM25 역색인을 빌드하면 안 됨")
+
+    monkeypatch.setattr(LexicalIndex, "build", classmethod(no_build))
+    hits, _ = await rag.search(
+        "월세액", top_k=3, embed_fn=_failing_embed, data_dir=tmp_path, mode="lexical"
+    )
+    assert hits
+
+
+async def test_hybrid_reranks_lexical_shortlist(tmp_path: Path):
+    embed = make_deterministic_embedder(
+        {"신용카드": [1.0, 0.0], "의료비": [0.0, 1.0], "무주택": [0.6, 0.8]}
+    )
+    await rag.index_law(_law(), embed_fn=embed, data_dir=tmp_path)
+
+    # "총급여" 는 §52 ①② 에만 있음 → shortlist 2건, query 벡터(의료비) 로 ② 가 1위
+    async def qembed(texts):
+        return [[0.0, 1.0]]
+
+    hits, _ = await rag.search(
+        "총급여", top_k=5, embed_fn=qembed, data_dir=tmp_path, mode="hybrid"
+    )
+    assert [h.chunk.paragraph_no for h in hits] == ["②", "①"]
+    assert hits[0].score == pytest.approx(0.5 * 1.0 + 0.5 * 1.0)
+
+
+async def test_hybrid_without_lexical_match_falls_back_to_vector(tmp_path: Path):
+    embed = make_deterministic_embedder({"신용카드": [1.0, 0.0], "의료비": [0.0, 1.0]})
+    await rag.index_law(_law(), embed_fn=embed, data_dir=tmp_path)
+
+    async def qembed(texts):
+        return [[0.0, 1.0]]
+
+    hybrid, _ = await rag.search(
+        "zzz", top_k=3, embed_fn=qembed, data_dir=tmp_path, mode="hybrid"
+    )
+    vector, _ = await rag.search("zzz", top_k=3, embed_fn=qembed, data_dir=tmp_path)
+    assert hybrid == vector
@@ -0,0 +1,63 @@
+"""
+result_cache (LRU + TTL) 단위 테스트.
+"""
+
+import pytest
+
+from app.services.result_cache import ResultCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_hit_miss_counters():
+    cache: ResultCache[int] = ResultCache(maxsize=4)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache: ResultCache[int] = ResultCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # a 를 최근 사용으로
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_ttl_expiry():
+    clock = _Clock()
+    cache: ResultCache[int] = ResultCache(maxsize=4, ttl_seconds=10, clock=clock)
+    cache.put("a", 1)
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    clock.now = 10.1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_clear_resets_counters():
+    cache: ResultCache[int] = ResultCache(maxsize=4)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (0, 0, 0)
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        ResultCache(maxsize=0)
@@ -6,6 +6,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import json
+import os
+import stat
 
 import pytest
 
@@ -194,6 +196,23 @@ def test_approve_replaces_existing_rule_id(tmp_path: Path):
     assert matching[0].title == "신버전 카드 25%"
 
 
+@pytest.mark.skipif(os.name != "posix", reason="POSIX 권한 비트")
+def test_approve_keeps_published_pack_mode(tmp_path: Path):
+    """원자 교체 후에도 published 팩 권한 유지 — 다른 계정 워커가 계속 읽을 수 있게."""
+    pub_dir = tmp_path / "rules"
+    pub_dir.mkdir()
+    pub_path = pub_dir / "2025.json"
+    pub_path.write_text(
+        json.dumps(RulePack(year=2025, rules=[]).model_dump(mode="json")),
+        encoding="utf-8",
+    )
+    os.chmod(pub_path, 0o644)
+    rule_drafts_store.save_draft(_make_draft(_make_card_rule()), data_dir=tmp_path)
+
+    rule_drafts_store.approve_draft(2025, "card_25_threshold", data_dir=tmp_path)
+    assert stat.S_IMODE(pub_path.stat().st_mode) == 0o644
+
+
 def test_approve_missing_draft_raises(tmp_path: Path):
     with pytest.raises(FileNotFoundError):
         rule_drafts_store.approve_draft(2025, "nope", data_dir=tmp_path)
@@ -253,3 +272,44 @@ def test_reject_deletes_draft(tmp_path: Path):
         rule_drafts_store.load_draft(2025, "card_25_threshold", data_dir=tmp_path)
         is None
     )
+
+
+def test_approve_swaps_registry_pack_atomically(tmp_path: Path, monkeypatch):
+    """승인 직후 같은 프로세스의 레지스트리가 새 팩 + 새 인덱스로 교체."""
+    from app.services import rules_engine
+    from app.services.dependencies import rule_ids_for_fields
+
+    pub_dir = tmp_path / "rules"
+    pub_dir.mkdir()
+    (pub_dir / "2025.json").write_text(
+        json.dumps(RulePack(year=2025, rules=[_make_card_rule()]).model_dump(mode="json")),
+        encoding="utf-8",
+    )
+    registry = rules_engine.RulePackRegistry(pub_dir, check_interval=3600)
+    monkeypatch.setattr(rules_engine, "rule_registry", registry)
+    before = registry.snapshot(2025)
+
+    rule_drafts_store.save_draft(_make_draft(_make_flags_rule()), data_dir=tmp_path)
+    rule_drafts_store.approve_draft(2025, "rent_eligibility", data_dir=tmp_path)
+
+    after = registry.snapshot(2025)  # check_interval 과 무관하게 이미 교체됨
+    assert after.generation > before.generation
+    assert [r.rule_id for r in after.pack.rules] == [
+        "card_25_threshold",
+        "rent_eligibility",
+    ]
+    assert rule_ids_for_fields({"householder"}, snapshot=after) == {"rent_eligibility"}
+    # tmp 파일이 남지 않음
+    assert sorted(p.name for p in pub_dir.iterdir()) == ["2025.json", "drafts"]
+
+
+def test_approve_invalidates_rag_bundles(tmp_path: Path):
+    bundles = tmp_path / "rag_bundles"
+    bundles.mkdir()
+    (bundles / "2025.json").write_text("{}", encoding="utf-8")
+    (bundles / "2024.json").write_text("{}", encoding="utf-8")
+
+    rule_drafts_store.save_draft(_make_draft(_make_card_rule()), data_dir=tmp_path)
+    rule_drafts_store.approve_draft(2025, "card_25_threshold", data_dir=tmp_path)
+
+    assert sorted(p.name for p in bundles.iterdir()) == ["2024.json"]
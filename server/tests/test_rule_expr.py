@@ -0,0 +1,163 @@
+"""
+rule_expr (값 표현 컴파일러) 테스트.
+
+- 중첩 표현: scalar == vector (무작위 컨텍스트)
+- piecewise: 세율표 progressive_tax 와 동일 결과
+- 참조 필드 수집 / formula / 스키마 검증
+"""
+
+import json
+import random
+
+import numpy as np
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from app.schemas.rule_schema import ValueExpr
+from app.services.rule_expr import compile_expr, expr_fields
+from app.services.tax_calculator import (
+    DEFAULT_TABLE_PATH,
+    load_tax_table,
+    progressive_tax,
+)
+
+_ADAPTER = TypeAdapter(ValueExpr)
+
+
+def _expr(data: dict):
+    return _ADAPTER.validate_python(data)
+
+
+def _f(name):
+    return {"type": "field", "name": name}
+
+
+def _c(value):
+    return {"type": "constant", "value": value}
+
+
+# 카드 공제 모양: min((카드 - 총급여×25%) 의 15% 를 0 이상으로, 300만)
+CARD_DEDUCTION = {
+    "type": "min",
+    "args": [
+        {
+            "type": "clip",
+            "lo": _c(0),
+            "value": {
+                "type": "scale",
+                "ratio": 0.15,
+                "value": {
+                    "type": "sub",
+                    "left": {"type": "sum_of_fields", "fields": ["credit_card", "debit_card"]},
+                    "right": {"type": "ratio_of_field", "field": "salary", "ratio": 0.25},
+                },
+            },
+        },
+        _c(3_000_000),
+    ],
+}
+
+NESTED = {
+    "type": "sum",
+    "args": [
+        {"type": "max", "args": [_f("a"), _f("b"), _c(-3)]},
+        {"type": "clip", "value": _f("a"), "hi": _f("b")},
+        {
+            "type": "piecewise",
+            "value": {"type": "sum", "args": [_f("a"), _f("salary")]},
+            "brackets": [
+                {"upto": 1_000, "rate": 0.5},
+                {"upto": 10_000_000, "base": 1_000, "fixed": 500, "rate": 0.125},
+                {"base": 10_000_000, "fixed": 1_249_875, "rate": 0.333},
+            ],
+        },
+    ],
+}
+
+
+def _columns(contexts, fields):
+    return {
+        f: np.array(
+            [
+                float(v) if isinstance(v := c.get(f, 0), (int, float)) else 0.0
+                for c in contexts
+            ],
+            dtype=np.float64,
+        )
+        for f in fields
+    }
+
+
+@pytest.mark.parametrize("data", [CARD_DEDUCTION, NESTED])
+def test_scalar_matches_vector(data):
+    compiled = compile_expr(_expr(data))
+    rng = random.Random(13)
+
+    def num():
+        return rng.choice(
+            [0, -7, 1_000, rng.randint(-5_000, 80_000_000), rng.random() * 1e7, "x", None, True]
+        )
+
+    contexts = [
+        {f: num() for f in ("a", "b", "salary", "credit_card", "debit_card")}
+        for _ in range(1_000)
+    ]
+    cols = _columns(contexts, compiled.fields)
+    vector = compiled.vector(cols, len(contexts))
+    assert vector.dtype == np.int64
+    assert vector.tolist() == [compiled.scalar(c) for c in contexts]
+
+
+def test_card_deduction_values():
+    compiled = compile_expr(_expr(CARD_DEDUCTION))
+    ctx = {"salary": 40_000_000, "credit_card": 15_000_000, "debit_card": 5_000_000}
+    assert compiled.scalar(ctx) == 1_500_000  # (2000만 - 1000만) × 15%
+    ctx["credit_card"] = 60_000_000
+    assert compiled.scalar(ctx) == 3_000_000  # 한도
+    ctx["credit_card"] = 0
+    assert compiled.scalar(ctx) == 0  # 미달은 0 으로 clip
+
+
+def test_piecewise_mirrors_progressive_tax_table():
+    raw = json.loads(DEFAULT_TABLE_PATH.read_text(encoding="utf-8"))
+    brackets = [
+        {"upto": b["upper"], "base": b["base"], "fixed": b["fixed"], "rate": b["rate"]}
+        for b in raw["progressive_tax"]["brackets"]
+    ]
+    compiled = compile_expr(
+        _expr({"type": "piecewise", "value": _f("taxable"), "brackets": brackets})
+    )
+    table = load_tax_table(2025)
+    xs = [1, 14_000_000, 14_000_001, 49_999_999, 88_000_000, 1_500_000_000]
+    xs += random.Random(3).sample(range(1, 400_000_000), 500)
+    for x in xs:
+        assert compiled.scalar({"taxable": x}) == progressive_tax(x, table), x
+    vec = compiled.vector({"taxable": np.array(xs, dtype=np.float64)}, len(xs))
+    assert vec.tolist() == [progressive_tax(x, table) for x in xs]
+
+
+def test_fields_and_formula():
+    expr = _expr(CARD_DEDUCTION)
+    assert expr_fields(expr) == {"credit_card", "debit_card", "salary"}
+    assert compile_expr(expr).formula == (
+        "min(clip((credit_card + debit_card − salary × 0.25) × 0.15, 0, ∞), 3000000)"
+    )
+
+
+@pytest.mark.parametrize(
+    "brackets",
+    [
+        [{"upto": 10, "rate": 0.1}],  # 마지막이 상한 있음
+        [{"upto": 10}, {"upto": 5}, {}],  # 오름차순 아님
+        [{}, {"upto": 10}, {}],  # 중간 구간 상한 없음
+        [],
+    ],
+)
+def test_piecewise_brackets_validated(brackets):
+    with pytest.raises(ValidationError):
+        _expr({"type": "piecewise", "value": _f("a"), "brackets": brackets})
+
+
+def test_min_requires_args():
+    with pytest.raises(ValidationError):
+        _expr({"type": "min", "args": []})
@@ -0,0 +1,217 @@
+"""
+rules_batch (일괄 룰 평가) 테스트.
+
+- 무작위 직원 컨텍스트: batch 결과 == rules_engine scalar 평가 (RuleEvaluation 단위)
+- threshold 0 → None, 빈 플래그, 숫자 아닌 값 처리
+- 컬럼 입력 경로
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from app.schemas.rule_schema import (
+    AllOfFlagsEvaluator,
+    AllOfFlagsOutputs,
+    AmountEvaluator,
+    AmountOutputs,
+    AnyOfFlagsEvaluator,
+    Clip,
+    Constant,
+    FieldRef,
+    MinOf,
+    Piecewise,
+    PiecewiseBracket,
+    RatioOfField,
+    Rule,
+    RulePack,
+    Scale,
+    Sub,
+    SumOfFields,
+    ThresholdEvaluator,
+    ThresholdOutputs,
+)
+from app.services.rules_batch import BatchEvalContext, evaluate_pack_batch
+from app.services.rules_engine import compiled_rules, load_rules
+
+
+def _threshold_rule(rule_id, threshold, value, comparison):
+    return Rule(
+        rule_id=rule_id,
+        title=rule_id,
+        year=2025,
+        legal_anchor="X §1",
+        evaluator=ThresholdEvaluator(
+            threshold=threshold,
+            value=value,
+            comparison=comparison,
+            outputs=ThresholdOutputs(
+                threshold_key=f"{rule_id}_thr",
+                value_key=f"{rule_id}_val",
+                result_key=f"{rule_id}_ok",
+            ),
+        ),
+    )
+
+
+def _flags_rule(rule_id, flags):
+    return Rule(
+        rule_id=rule_id,
+        title=rule_id,
+        year=2025,
+        legal_anchor="X §2",
+        evaluator=AllOfFlagsEvaluator(
+            flags=flags, outputs=AllOfFlagsOutputs(result_key=f"{rule_id}_ok")
+        ),
+    )
+
+
+def _custom_pack() -> RulePack:
+    rules = [
+        _threshold_rule(
+            f"r_{cmp}",
+            RatioOfField(field="salary", ratio=0.25),
+            SumOfFields(fields=["a", "b"]),
+            cmp,
+        )
+        for cmp in ("gt", "gte", "lt", "lte", "eq")
+    ]
+    rules.append(
+        _threshold_rule("r_const", Constant(value=1_000), FieldRef(name="a"), "gte")
+    )
+    rules.append(_flags_rule("flags", ["f1", "f2"]))
+    rules.append(_flags_rule("no_flags", []))
+    rules.append(
+        Rule(
+            rule_id="any_flags",
+            title="any_flags",
+            year=2025,
+            legal_anchor="X §3",
+            evaluator=AnyOfFlagsEvaluator(
+                flags=["f1", "f2"], outputs=AllOfFlagsOutputs(result_key="any_ok")
+            ),
+        )
+    )
+    rules.append(
+        Rule(
+            rule_id="amount",
+            title="amount",
+            year=2025,
+            legal_anchor="X §4",
+            evaluator=AmountEvaluator(
+                value=MinOf(
+                    args=[
+                        Clip(
+                            value=Scale(
+                                value=Sub(
+                                    left=SumOfFields(fields=["a", "b"]),
+                                    right=RatioOfField(field="salary", ratio=0.25),
+                                ),
+                                ratio=0.15,
+                            ),
+                            lo=Constant(value=0),
+                        ),
+                        Piecewise(
+                            value=FieldRef(name="salary"),
+                            brackets=[
+                                PiecewiseBracket(upto=70_000_000, fixed=3_000_000),
+                                PiecewiseBracket(fixed=2_500_000),
+                            ],
+                        ),
+                    ]
+                ),
+                outputs=AmountOutputs(value_key="amount_val", result_key="amount_ok"),
+            ),
+        )
+    )
+    return RulePack(year=2025, rules=rules)
+
+
+def _random_context(rng: random.Random) -> dict:
+    def num():
+        return rng.choice(
+            [0, -5, rng.randint(0, 50_000_000), rng.random() * 1e6, "x", None, True]
+        )
+
+    return {
+        "salary": num(),
+        "a": num(),
+        "b": num(),
+        "f1": rng.choice([True, False, 1, 0, "", "y", None]),
+        "f2": rng.random() > 0.3,
+    }
+
+
+def _assert_matches_scalar(pack, contexts):
+    batch = evaluate_pack_batch(pack, contexts)
+    assert len(batch) == len(contexts)
+    compiled = compiled_rules(pack)
+    for i, ctx in enumerate(contexts):
+        expected = [c.evaluate(ctx).model_dump() for c in compiled]
+        got = [ev.model_dump() for ev in batch.evaluations(i)]
+        assert got == expected, (i, ctx)
+
+
+def test_batch_matches_scalar_on_random_contexts():
+    rng = random.Random(2025)
+    contexts = [_random_context(rng) for _ in range(500)]
+    # 경계: threshold 와 value 가 정확히 같은 경우
+    contexts.append({"salary": 4_000, "a": 600, "b": 400, "f1": True, "f2": True})
+    _assert_matches_scalar(_custom_pack(), contexts)
+
+
+def test_batch_matches_scalar_on_published_pack():
+    rng = random.Random(7)
+    contexts = [
+        {
+            "total_salary": rng.randint(0, 120_000_000),
+            "credit_card": rng.randint(0, 30_000_000),
+            "debit_card": rng.randint(0, 10_000_000),
+            "cash_receipt": rng.randint(0, 5_000_000),
+            "medical_expense": rng.randint(0, 5_000_000),
+            "family_medical_total": rng.randint(0, 2_000_000),
+            "householder": rng.random() > 0.5,
+            "no_house": rng.random() > 0.5,
+            "lease_contract": rng.random() > 0.5,
+        }
+        for _ in range(200)
+    ]
+    _assert_matches_scalar(load_rules(year=2025), contexts)
+
+
+def test_from_columns_and_column_access():
+    pack = _custom_pack()
+    ctx = BatchEvalContext.from_columns(
+        {
+            "salary": np.array([40_000_000, 0]),
+            "a": [8_000_000, 5],
+            "b": [3_000_000, 5],
+            "f1": [True, True],
+        },
+        pack,
+    )
+    batch = evaluate_pack_batch(pack, ctx)
+    col = batch.column("r_gte")
+    assert col.result_at(0) is True
+    assert col.result_at(1) is None  # threshold 0 → 판단불가
+    # 없는 플래그 컬럼(f2) 은 False
+    assert batch.column("flags").result_at(0) is False
+    assert batch.column("no_flags").result_at(0) is None
+    assert batch.column("any_flags").result_at(0) is True
+    # (1100만 - 1000만) × 15% = 15만, 한도 300만
+    assert batch.evaluations(0)[-1].computed == {
+        "amount_val": 150_000,
+        "amount_ok": True,
+    }
+
+
+def test_from_columns_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        BatchEvalContext.from_columns({"a": [1, 2], "b": [1]}, _custom_pack())
+
+
+def test_empty_batch():
+    batch = evaluate_pack_batch(_custom_pack(), [])
+    assert len(batch) == 0
+    assert batch.column("r_gt").result.shape == (0,)
@@ -207,6 +207,107 @@ def test_build_eval_context_flattens_inputs():
     assert ctx["lease_contract"] is True
 
 
+def test_build_eval_context_fixed_layout_maps_every_field():
+    from app.services.rules_engine import EVAL_CONTEXT_FIELDS, EvalContext
+
+    income = Income(total_salary=1, non_taxable=2, bonus=3)
+    deps = Dependents(
+        has_spouse=True,
+        dependents_count=21,
+        disabled_count=22,
+        senior_count=23,
+        single_parent=False,
+        female_householder=True,
+    )
+    conds = Conditions(
+        householder=True,
+        no_house=False,
+        lease_contract=True,
+        has_loan=False,
+        child_education=True,
+        self_education=False,
+        mid_small_company_worker=True,
+    )
+    pdf = ParsedPdfData(
+        credit_card=4,
+        debit_card=5,
+        cash_receipt=6,
+        medical_expense=7,
+        severe_medical_for_disabled=8,
+        donation_total=14,
+        rent_in_pdf=16,
+        housing_loan_interest=17,
+        insurance=18,
+        pension_saving=19,
+        retirement_pension=20,
+        tax_credit_type="special",
+    )
+    manual = ManualInputRequest(
+        infertility_treatment_expense=9,
+        assistive_devices_expense=10,
+        childbirth_care_expense=11,
+        glasses_contacts_expense=12,
+        family_medical_expenses=[FamilyMedicalItem(name="a", amount=13)],
+        donation_extra=15,
+        rent=RentInfo(has_rent=False),
+        housing_loan=HousingLoanInfo(has_loan=False),
+    )
+    ctx = build_eval_context(income, deps, conds, pdf, manual)
+    assert isinstance(ctx, EvalContext)
+    assert list(ctx) == list(EVAL_CONTEXT_FIELDS)
+    assert dict(ctx) == {
+        "total_salary": 1,
+        "non_taxable": 2,
+        "bonus": 3,
+        "credit_card": 4,
+        "debit_card": 5,
+        "cash_receipt": 6,
+        "medical_expense": 7,
+        "severe_medical_for_disabled": 8,
+        "infertility_treatment_expense": 9,
+        "assistive_devices_expense": 10,
+        "childbirth_care_expense": 11,
+        "glasses_contacts_expense": 12,
+        "family_medical_total": 13,
+        "donation_total": 14,
+        "donation_extra": 15,
+        "rent_in_pdf": 16,
+        "housing_loan_interest": 17,
+        "insurance": 18,
+        "pension_saving": 19,
+        "retirement_pension": 20,
+        "dependents_count": 21,
+        "disabled_count": 22,
+        "senior_count": 23,
+        "has_spouse": True,
+        "single_parent": False,
+        "female_householder": True,
+        "householder": True,
+        "no_house": False,
+        "lease_contract": True,
+        "has_loan": False,
+        "child_education": True,
+        "self_education": False,
+        "mid_small_company_worker": True,
+        "tax_credit_type": "special",
+    }
+    assert ctx.get("not_a_field", 0) == 0
+    with pytest.raises(KeyError):
+        ctx["not_a_field"]
+
+
+def test_rule_context_raw_is_lazy():
+    income, deps, conds, pdf, manual = _basic_inputs()
+    rc = build_rule_context(income, deps, conds, pdf, manual)
+    assert rc._raw is None
+    raw = rc.raw
+    assert raw["total_salary"] == 50_000_000
+    assert [e["rule_id"] for e in raw["_evaluations"]] == [
+        e.rule_id for e in rc.evaluations
+    ]
+    assert rc.raw is raw  # 1회 생성 후 캐시
+
+
 # ---------------- build_rule_context (통합) ----------------
 
 
@@ -287,3 +388,259 @@ def test_legacy_fields_match_evaluations():
     assert rc.card_meets_threshold == card.computed["card_meets_threshold"]
     assert rc.medical_total == medical.computed["medical_total"]
     assert rc.rent_conditions_met == rent.computed["rent_conditions_met"]
+
+
+# ---------------- 컴파일된 룰 ----------------
+
+
+def test_load_rules_attaches_compiled_rules():
+    from app.services.rules_engine import compiled_rules
+
+    pack = load_rules(year=2025)
+    compiled = compiled_rules(pack)
+    assert compiled is compiled_rules(pack)  # load 시점 1회 컴파일, 재사용
+    assert [c.rule.rule_id for c in compiled] == [r.rule_id for r in pack.rules]
+    assert all(c.formula for c in compiled)
+
+
+@pytest.mark.parametrize(
+    "expr, expected",
+    [
+        (FieldRef(name="a"), 1_234),
+        (FieldRef(name="flag"), 1),
+        (FieldRef(name="text"), 0),
+        (RatioOfField(field="salary", ratio=0.25), 8_333_333),
+        (RatioOfField(field="neg", ratio=0.5), 0),
+        (SumOfFields(fields=["a", "b", "text", "missing"]), 1_239),
+        (Constant(value=130000), 130_000),
+    ],
+)
+def test_compiled_value_keeps_legacy_semantics(expr, expected):
+    """값 표현 컴파일을 rule_expr 로 옮긴 뒤에도 기존 4종의 의미는 그대로."""
+    ctx = {
+        "a": 1_234,
+        "b": 5.9,
+        "flag": True,
+        "text": "x",
+        "salary": 33_333_333,
+        "neg": -10,
+    }
+    assert _resolve_value(expr, ctx) == expected
+
+
+@pytest.mark.parametrize("comparison", ["gt", "gte", "lt", "lte", "eq"])
+def test_compiled_threshold_formula_and_outputs(comparison):
+    rule = _make_threshold_rule(comparison)
+    ctx = {"salary": 40_000_000, "a": 7_000_000, "b": 3_000_000}
+    ev = evaluate_rule(rule, ctx)
+    assert ev.formula == f"a + b {comparison} salary × 0.25"
+    assert ev.computed == {"thr": 10_000_000, "val": 10_000_000, "ok": ev.result}
+    # model_construct 결과도 직렬화는 동일
+    assert ev.model_dump()["rule_id"] == "t"
+
+
+# ---------------- 증분 재평가 (update_rule_context) ----------------
+
+
+def _evals_by_id(rc):
+    return {e.rule_id: e for e in rc.evaluations}
+
+
+def test_update_rule_context_matches_full_rebuild():
+    from app.services.rules_engine import update_rule_context
+
+    income, deps, conds, pdf, manual = _basic_inputs()
+    prev = build_rule_context(income, deps, conds, pdf, manual)
+
+    rc = update_rule_context(prev, {"credit_card": 1_000_000, "no_house": False})
+
+    pdf.credit_card = 1_000_000
+    conds.no_house = False
+    full = build_rule_context(income, deps, conds, pdf, manual)
+
+    assert [e.model_dump() for e in rc.evaluations] == [
+        e.model_dump() for e in full.evaluations
+    ]
+    assert rc.raw == full.raw
+    assert rc.card_meets_threshold is False
+    assert rc.rent_conditions_met is False
+    # prev 는 그대로
+    assert prev.card_meets_threshold is True
+
+
+def test_update_rule_context_reevaluates_only_affected_rules():
+    from app.services.rules_engine import update_rule_context
+
+    income, deps, conds, pdf, manual = _basic_inputs()
+    prev = build_rule_context(income, deps, conds, pdf, manual)
+
+    rc = update_rule_context(prev, {"medical_expense": 9_000_000})
+    before, after = _evals_by_id(prev), _evals_by_id(rc)
+    # 의료비를 읽지 않는 룰은 객체 재사용
+    assert after["card_25_threshold"] is before["card_25_threshold"]
+    assert after["rent_eligibility"] is before["rent_eligibility"]
+    assert after["medical_3_threshold"] is not before["medical_3_threshold"]
+    assert rc.medical_meets_threshold is True
+
+    # 값이 같으면 아무 룰도 다시 평가하지 않음
+    same = update_rule_context(rc, {"medical_expense": 9_000_000})
+    assert all(a is b for a, b in zip(same.evaluations, rc.evaluations))
+
+
+def test_update_rule_context_rejects_unknown_field():
+    from app.services.rules_engine import update_rule_context
+
+    income, deps, conds, pdf, manual = _basic_inputs()
+    prev = build_rule_context(income, deps, conds, pdf, manual)
+    with pytest.raises(ValueError):
+        update_rule_context(prev, {"credit_crad": 1})
+
+
+# ---------------- 룰 팩 레지스트리 (hot reload) ----------------
+
+
+def _write_pack(path, rules):
+    import json
+
+    from app.schemas.rule_schema import RulePack
+
+    path.write_text(
+        json.dumps(RulePack(year=2025, rules=rules).model_dump(mode="json")),
+        encoding="utf-8",
+    )
+
+
+def _flag_rule(rule_id, flags):
+    return Rule(
+        rule_id=rule_id,
+        title=rule_id,
+        year=2025,
+        legal_anchor="X §1",
+        evaluator=AllOfFlagsEvaluator(
+            flags=flags, outputs=AllOfFlagsOutputs(result_key=f"{rule_id}_ok")
+        ),
+    )
+
+
+def test_rule_registry_swaps_pack_and_derived_indices(tmp_path):
+    from app.services.dependencies import rule_ids_for_fields
+    from app.services.rules_engine import RulePackRegistry
+
+    now = [0.0]
+    registry = RulePackRegistry(tmp_path, check_interval=1.0, clock=lambda: now[0])
+    _write_pack(tmp_path / "2025.json", [_flag_rule("a", ["householder"])])
+
+    snap = registry.snapshot(2025)
+    assert rule_ids_for_fields({"householder"}, snapshot=snap) == {"a"}
+    assert registry.snapshot(2025) is snap  # 변경 없음 → 같은 snapshot
+
+    _write_pack(
+        tmp_path / "2025.json",
+        [_flag_rule("a", ["no_house"]), _flag_rule("b", ["householder"])],
+    )
+    # check_interval 안에서는 stat 도 하지 않음
+    now[0] = 0.5
+    assert registry.snapshot(2025) is snap
+
+    now[0] = 1.5
+    new = registry.snapshot(2025)
+    assert new.generation > snap.generation
+    assert [r.rule_id for r in new.pack.rules] == ["a", "b"]
+    # 인덱스는 새 팩 기준으로, 이전 snapshot 의 인덱스는 그대로
+    assert rule_ids_for_fields({"householder"}, snapshot=new) == {"b"}
+    assert rule_ids_for_fields({"householder"}, snapshot=snap) == {"a"}
+
+
+def test_rule_registry_keeps_previous_pack_on_broken_file(tmp_path):
+    from app.services.rules_engine import RulePackRegistry
+
+    registry = RulePackRegistry(tmp_path, check_interval=0.0)
+    path = tmp_path / "2025.json"
+    _write_pack(path, [_flag_rule("a", ["householder"])])
+    snap = registry.snapshot(2025)
+
+    path.write_text("{ not json", encoding="utf-8")
+    assert registry.refresh(2025) is snap
+
+    with pytest.raises(FileNotFoundError):
+        registry.get(2099)
+
+
+def test_update_rule_context_reevaluates_after_pack_swap(tmp_path, monkeypatch):
+    # 승인으로 같은 rule_id 의 플래그만 바뀌면 이전 평가를 재사용하면 안 됨
+    from app.services import rules_engine
+    from app.services.rules_engine import RulePackRegistry, update_rule_context
+
+    registry = RulePackRegistry(tmp_path, check_interval=0.0)
+    monkeypatch.setattr(rules_engine, "rule_registry", registry)
+    path = tmp_path / "2025.json"
+    _write_pack(path, [_flag_rule("a", ["householder"])])
+
+    income, deps, conds, pdf, manual = _basic_inputs()
+    conds.householder = True
+    conds.no_house = False
+    prev = build_rule_context(income, deps, conds, pdf, manual)
+    assert prev.evaluations[0].result is True
+
+    _write_pack(path, [_flag_rule("a", ["no_house"])])
+    registry.refresh(2025)
+
+    rc = update_rule_context(prev, {"credit_card": 1})
+    assert rc.evaluations[0] is not prev.evaluations[0]
+    assert rc.evaluations[0].result is False
+
+
+# ---------------- any_of_flags / amount evaluator ----------------
+
+
+def test_any_of_flags_and_amount_evaluators():
+    from app.schemas.rule_schema import (
+        AmountEvaluator,
+        AmountOutputs,
+        AnyOfFlagsEvaluator,
+        MinOf,
+        Scale,
+        Sub,
+    )
+
+    any_rule = Rule(
+        rule_id="edu",
+        title="교육비 대상",
+        year=2025,
+        legal_anchor="소득세법 §59의4 ③",
+        evaluator=AnyOfFlagsEvaluator(
+            flags=["child_education", "self_education"],
+            outputs=AllOfFlagsOutputs(result_key="edu_any"),
+        ),
+    )
+    ev = evaluate_rule(any_rule, {"child_education": False, "self_education": True})
+    assert ev.result is True
+    assert ev.formula == "child_education ∨ self_education"
+    assert evaluate_rule(any_rule, {}).result is False
+
+    amount_rule = Rule(
+        rule_id="card_amount",
+        title="카드 공제액",
+        year=2025,
+        legal_anchor="조세특례제한법 §126의2 ①",
+        evaluator=AmountEvaluator(
+            value=MinOf(
+                args=[
+                    Scale(
+                        value=Sub(
+                            left=FieldRef(name="credit_card"),
+                            right=RatioOfField(field="total_salary", ratio=0.25),
+                        ),
+                        ratio=0.15,
+                    ),
+                    Constant(value=3_000_000),
+                ]
+            ),
+            outputs=AmountOutputs(value_key="card_amount", result_key="card_amount_ok"),
+        ),
+    )
+    ev = evaluate_rule(
+        amount_rule, {"credit_card": 20_000_000, "total_salary": 40_000_000}
+    )
+    assert ev.computed == {"card_amount": 1_500_000, "card_amount_ok": True}
+    assert ev.formula == "min((credit_card − total_salary × 0.25) × 0.15, 3000000)"
@@ -2,6 +2,8 @@
 Phase 4-1 시뮬레이션 테스트.
 """
 
+import pytest
+
 from app.schemas.analysis_schema import AnalyzeRequest
 from app.schemas.manual_input_schema import (
     HousingLoanInfo,
@@ -12,6 +14,7 @@ from app.schemas.pdf_schema import ParsedPdfData
 from app.schemas.simulate_schema import SimulateRequest, YearOverride
 from app.schemas.user_input_schema import Conditions, Dependents, Income
 from app.services.simulate import simulate
+from app.services.tax_calculator import calculate
 
 
 def _baseline_request(gross: int = 30_000_000) -> AnalyzeRequest:
@@ -210,3 +213,61 @@ def test_extra_deductions_applied_to_baseline():
     base = res.baseline
     assert base.inputs_used.extra_income_deductions == 2_000_000
     assert base.inputs_used.extra_tax_credits == 300_000
+
+
+# -------------------- 연도별 세율표 --------------------
+
+
+def test_projection_uses_per_year_table(tmp_path, monkeypatch):
+    import copy
+    import json
+
+    from app.services import simulate as simulate_module
+    from app.services import tax_calculator
+    from app.services.tax_calculator import TaxTableRegistry, load_tax_table
+
+    base = load_tax_table(2025).raw
+    data_2026 = copy.deepcopy(base)
+    data_2026["year"] = 2026
+    data_2026["standard_tax_credit"]["amount"] = 200_000
+    (tmp_path / "2025.json").write_text(json.dumps(base), encoding="utf-8")
+    (tmp_path / "2026.json").write_text(json.dumps(data_2026), encoding="utf-8")
+
+    registry = TaxTableRegistry(directory=tmp_path)
+    monkeypatch.setattr(tax_calculator, "table_registry", registry)
+    monkeypatch.setattr(simulate_module, "table_registry", registry)
+
+    req = SimulateRequest(
+        baseline_request=_baseline_request(30_000_000),
+        years=[YearOverride(year=2026), YearOverride(year=2028)],
+    )
+    res = simulate(req)
+    assert res.baseline.result.standard_tax_credit == 130_000
+    # 2026 → 2026.json, 2028 → 파일 없음 → 직전 최신(2026.json)
+    assert [p.result.year for p in res.projections] == [2026, 2026]
+    assert all(p.result.standard_tax_credit == 200_000 for p in res.projections)
+
+
+def test_projection_before_earliest_table_uses_earliest():
+    req = SimulateRequest(
+        baseline_request=_baseline_request(30_000_000),
+        years=[YearOverride(year=2024, gross_salary=32_000_000)],
+    )
+    res = simulate(req)
+    (proj,) = res.projections
+    assert proj.year == 2024
+    assert proj.result.year == 2025
+    assert proj.inputs_used.gross_salary == 32_000_000
+
+
+@pytest.mark.parametrize("baseline_year", [2024, 2031])
+def test_baseline_year_without_table_uses_fallback(baseline_year):
+    req = SimulateRequest(
+        baseline_request=_baseline_request(30_000_000),
+        baseline_year=baseline_year,
+        years=[],
+    )
+    res = simulate(req)
+    assert res.baseline_year == baseline_year
+    assert res.baseline.result.year == 2025
+    assert res.baseline.result == calculate(res.baseline.inputs_used)
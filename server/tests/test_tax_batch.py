@@ -0,0 +1,129 @@
+"""
+tax_batch (NumPy 일괄 계산) 테스트.
+
+- 골든셋 전 케이스: batch 결과 == scalar calculate() 결과 (원 단위)
+- 구간 경계/한도/추징/표준세액공제 미적용 등 무작위 샘플 동치성
+- 입력 검증 (길이 mismatch, itemized 거부)
+"""
+
+import json
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.schemas.tax_calculator_schema import (
+    CalcInputs,
+    DependentsInput,
+    ItemizedDeductions,
+)
+from app.services.tax_batch import BatchCalcInputs, calculate_batch
+from app.services.tax_calculator import calculate
+
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+_FIELDS = [
+    "earned_income_deduction",
+    "earned_income_amount",
+    "personal_deduction",
+    "taxable_income",
+    "calculated_tax",
+    "earned_income_tax_credit",
+    "standard_tax_credit",
+    "extra_tax_credits",
+    "determined_tax",
+    "local_income_tax",
+    "total_tax",
+    "prepaid_tax",
+    "refund_or_owed",
+]
+
+
+def _assert_rows_match(items: list[CalcInputs]) -> None:
+    batch = calculate_batch(BatchCalcInputs.from_inputs(items))
+    assert len(batch) == len(items)
+    for i, inputs in enumerate(items):
+        scalar = calculate(inputs)
+        row = batch.row(i)
+        for f in _FIELDS:
+            assert row[f] == getattr(scalar, f), (i, f, inputs)
+
+
+def test_batch_matches_golden_set():
+    items = [
+        CalcInputs.model_validate(json.loads(p.read_text(encoding="utf-8"))["inputs"])
+        for p in sorted(GOLDEN_DIR.glob("*.json"))
+    ]
+    assert items
+    _assert_rows_match(items)
+
+
+def test_batch_matches_scalar_on_bracket_boundaries():
+    grosses = [
+        0, -1_000, 1, 5_000_000, 5_000_001, 15_000_000, 33_000_000,
+        33_000_001, 45_000_000, 70_000_000, 100_000_000, 120_000_000,
+        120_000_001, 500_000_000, 3_000_000_000,
+    ]
+    items = [CalcInputs(gross_salary=g, prepaid_tax=1_000_000) for g in grosses]
+    _assert_rows_match(items)
+
+
+def test_batch_matches_scalar_random_sample():
+    rng = random.Random(20250101)
+    items: list[CalcInputs] = []
+    for _ in range(300):
+        items.append(
+            CalcInputs(
+                gross_salary=rng.randint(0, 400_000_000),
+                dependents=DependentsInput(
+                    self_eligible=rng.random() > 0.05,
+                    spouse=rng.random() > 0.5,
+                    dependents_count=rng.randint(0, 4),
+                    senior_count=rng.randint(0, 2),
+                    disabled_count=rng.randint(0, 2),
+                    female_householder=rng.random() > 0.8,
+                    single_parent=rng.random() > 0.9,
+                ),
+                extra_income_deductions=rng.randint(0, 20_000_000),
+                extra_tax_credits=rng.randint(0, 3_000_000),
+                use_standard_tax_credit=rng.random() > 0.3,
+                prepaid_tax=rng.randint(0, 50_000_000),
+            )
+        )
+    _assert_rows_match(items)
+
+
+def test_from_columns_broadcasts_scalars():
+    batch_in = BatchCalcInputs.from_columns(
+        [30_000_000, 50_000_000], prepaid_tax=1_000_000
+    )
+    assert batch_in.prepaid_tax.tolist() == [1_000_000, 1_000_000]
+    assert batch_in.spouse.tolist() == [False, False]
+
+    res = calculate_batch(batch_in)
+    # test_golden_single_30M 와 동일
+    assert int(res.refund_or_owed[0]) == 249_250
+    assert res.refund_or_owed.dtype == np.int64
+
+
+def test_from_columns_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        BatchCalcInputs.from_columns([1, 2, 3], prepaid_tax=[1, 2])
+
+
+def test_from_inputs_rejects_itemized():
+    items = [
+        CalcInputs(
+            gross_salary=30_000_000,
+            itemized=ItemizedDeductions(child_count_under_20=1),
+        )
+    ]
+    with pytest.raises(ValueError):
+        BatchCalcInputs.from_inputs(items)
+
+
+def test_empty_batch():
+    res = calculate_batch(BatchCalcInputs.from_columns([]))
+    assert len(res) == 0
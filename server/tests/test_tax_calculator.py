@@ -749,3 +749,254 @@ def test_legal_anchors_present():
     assert by_name["calculated_tax"].legal_anchor is not None
     assert by_name["earned_income_tax_credit"].legal_anchor is not None
     assert by_name["local_income_tax"].legal_anchor is not None
+
+
+# ============================================================
+# 컴파일된 세율표 (TaxTable)
+# ============================================================
+
+
+def test_load_tax_table_returns_compiled_table(table):
+    from app.services.tax_calculator import TaxTable
+
+    assert isinstance(table, TaxTable)
+    assert table.year == 2025
+    # 마지막 구간(upper=None) 은 +inf 로 컴파일
+    assert table.progressive_tax.uppers[-1] == float("inf")
+    # 원본 dict 접근 호환
+    assert table["standard_tax_credit"]["amount"] == table.standard_tax_credit
+
+
+def test_bracket_table_boundary_inclusive(table):
+    # upper 값 자체는 해당 구간에 포함 ('x <= upper')
+    bt = table.progressive_tax
+    assert bt.index(14_000_000) == 0
+    assert bt.index(14_000_001) == 1
+
+
+def test_compile_tax_table_rejects_unsorted_brackets(table):
+    import copy
+
+    from app.services.tax_calculator import compile_tax_table
+
+    data = copy.deepcopy(table.raw)
+    data["progressive_tax"]["brackets"].reverse()
+    with pytest.raises(ValueError):
+        compile_tax_table(data)
+
+
+# ============================================================
+# provenance 없는 fast path (calculate_totals)
+# ============================================================
+
+
+@pytest.mark.parametrize(
+    "inputs",
+    [
+        CalcInputs(gross_salary=0),
+        CalcInputs(gross_salary=30_000_000, prepaid_tax=1_000_000),
+        CalcInputs(
+            gross_salary=85_000_000,
+            dependents=DependentsInput(spouse=True, dependents_count=2),
+            extra_income_deductions=3_000_000,
+            extra_tax_credits=500_000,
+            use_standard_tax_credit=False,
+            prepaid_tax=5_000_000,
+        ),
+        CalcInputs(
+            gross_salary=50_000_000,
+            itemized=ItemizedDeductions(child_count_under_20=2),
+            use_standard_tax_credit=False,
+        ),
+    ],
+)
+def test_calculate_totals_matches_calculate(inputs):
+    from app.services.tax_calculator import CalcTotals, calculate_totals
+
+    full = calculate(inputs)
+    totals = calculate_totals(inputs)
+    assert isinstance(totals, CalcTotals)
+
+    promoted = totals.to_result()
+    assert promoted.steps == ()
+    assert promoted.model_dump(exclude={"steps"}) == full.model_dump(
+        exclude={"steps"}
+    )
+
+
+# ============================================================
+# 결과 캐시 (calculate_cached)
+# ============================================================
+
+
+def test_calculate_cached_hits_and_shares_frozen_result():
+    from pydantic import ValidationError
+
+    from app.services.tax_calculator import (
+        calculate_cache_stats,
+        calculate_cached,
+        clear_calculate_cache,
+    )
+
+    clear_calculate_cache()
+    inputs = CalcInputs(gross_salary=42_000_000, prepaid_tax=2_000_000)
+
+    first = calculate_cached(inputs)
+    # 저장본을 복사 없이 공유 — 대신 frozen 이라 호출자가 오염시킬 수 없음
+    with pytest.raises(ValidationError):
+        first.refund_or_owed = 0
+    with pytest.raises(ValidationError):
+        first.steps[0].output = 0
+    assert isinstance(first.steps, tuple)
+
+    second = calculate_cached(CalcInputs(gross_salary=42_000_000, prepaid_tax=2_000_000))
+    assert second is first
+    assert second == calculate(inputs)
+
+    stats = calculate_cache_stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_calculate_cached_key_distinguishes_nested_inputs():
+    from app.services.tax_calculator import calculate_cached, clear_calculate_cache
+
+    clear_calculate_cache()
+    base = CalcInputs(gross_salary=50_000_000)
+    with_spouse = CalcInputs(
+        gross_salary=50_000_000, dependents=DependentsInput(spouse=True)
+    )
+    with_child = CalcInputs(
+        gross_salary=50_000_000, itemized=ItemizedDeductions(child_count_under_20=1)
+    )
+    results = [calculate_cached(i) for i in (base, with_spouse, with_child)]
+    assert [r.total_tax for r in results] == [
+        calculate(i).total_tax for i in (base, with_spouse, with_child)
+    ]
+    assert len({id(r) for r in results}) == 3
+
+
+def test_calculate_cached_key_includes_inputs_and_table_version(table):
+    from app.services.tax_calculator import (
+        calculate_cache_stats,
+        calculate_cached,
+        clear_calculate_cache,
+    )
+
+    clear_calculate_cache()
+    calculate_cached(CalcInputs(gross_salary=42_000_000))
+    calculate_cached(CalcInputs(gross_salary=42_000_001))
+    assert calculate_cache_stats().misses == 2
+    assert len(table.version) == 16
+
+
+def test_admin_cache_stats_endpoint(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.routers import admin_cache
+    from app.services.tax_calculator import calculate_cached, clear_calculate_cache
+
+    clear_calculate_cache()
+    inputs = CalcInputs(gross_salary=42_000_000)
+    calculate_cached(inputs)
+    calculate_cached(inputs)
+
+    monkeypatch.setenv("ADMIN_TOKEN", "x")
+    app = FastAPI()
+    app.include_router(admin_cache.router, prefix="/api/v1")
+    client = TestClient(app)
+    assert client.get("/api/v1/admin/cache/stats").status_code == 401
+    res = client.get("/api/v1/admin/cache/stats", headers={"X-Admin-Token": "x"})
+    assert res.status_code == 200
+    calc = res.json()["calculate"]
+    assert (calc["hits"], calc["misses"], calc["size"]) == (1, 1, 1)
+    assert calc["hit_rate"] == 0.5
+
+
+# ============================================================
+# 세율표 레지스트리 (preload / 연도 대체 / hot reload)
+# ============================================================
+
+
+def _write_table(path, data):
+    import json
+
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def test_registry_preloads_and_resolves_years(tmp_path, table):
+    import copy
+
+    from app.services.tax_calculator import TaxTableRegistry
+
+    data_2026 = copy.deepcopy(table.raw)
+    data_2026["year"] = 2026
+    _write_table(tmp_path / "2025.json", table.raw)
+    _write_table(tmp_path / "2026.json", data_2026)
+
+    registry = TaxTableRegistry(directory=tmp_path)
+    registry.refresh()
+    assert registry.years() == [2025, 2026]
+    assert registry.get(2026).year == 2026
+    # 파일 없는 미래 연도 → 직전 최신 세율표
+    assert registry.resolve_year(2030) == 2026
+    with pytest.raises(ValueError):
+        registry.get(2030)
+    with pytest.raises(ValueError):
+        registry.resolve_year(2020)
+
+
+def test_registry_duplicate_year_prefers_canonical_file(tmp_path, table, caplog):
+    import copy
+
+    from app.services.tax_calculator import TaxTableRegistry
+
+    # "2025-draft.json" 이 "2025.json" 보다 먼저 정렬되지만 {year}.json 이 이김
+    draft = copy.deepcopy(table.raw)
+    draft["standard_tax_credit"]["amount"] = 999_000
+    _write_table(tmp_path / "2025.json", table.raw)
+    _write_table(tmp_path / "2025-draft.json", draft)
+
+    registry = TaxTableRegistry(directory=tmp_path)
+    with caplog.at_level("WARNING", logger="app.services.tax_calculator"):
+        registry.refresh()
+    assert registry.get(2025).standard_tax_credit == table.standard_tax_credit
+    assert any("tax_table_duplicate_year" in r.getMessage() for r in caplog.records)
+
+    # 변경 없는 재스캔(polling)은 다시 경고하지 않음
+    caplog.clear()
+    with caplog.at_level("WARNING", logger="app.services.tax_calculator"):
+        assert registry.refresh() is False
+    assert not caplog.records
+
+
+def test_registry_hot_swaps_on_mtime_change(tmp_path, table):
+    import copy
+    import os
+
+    from app.services.tax_calculator import TaxTableRegistry
+
+    path = tmp_path / "2025.json"
+    _write_table(path, table.raw)
+    registry = TaxTableRegistry(directory=tmp_path)
+    registry.refresh()
+    before = registry.get(2025)
+    assert registry.refresh() is False  # 변경 없음 → 재컴파일 없음
+    assert registry.get(2025) is before
+
+    data = copy.deepcopy(table.raw)
+    data["standard_tax_credit"]["amount"] = 150_000
+    _write_table(path, data)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert registry.refresh() is True
+    after = registry.get(2025)
+    assert after.standard_tax_credit == 150_000
+    assert after.version != before.version
+
+    # 깨진 파일 → 직전 정상 테이블 유지
+    path.write_text("{not json", encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000))
+    registry.refresh()
+    assert registry.get(2025) is after
@@ -0,0 +1,171 @@
+"""
+tax_curve (구간 선형 해석) 테스트.
+
+- 곡선 값 vs calculate_totals() (반올림 누적 오차 수 원 이내)
+- breakpoint 가 세율표 구간 경계와 일치
+- 한계세율 / 역산 solver 의 원 단위 최소성
+"""
+
+import random
+
+import pytest
+
+from app.schemas.tax_calculator_schema import (
+    CalcInputs,
+    DependentsInput,
+    ItemizedDeductions,
+)
+from app.services.tax_calculator import calculate_totals
+from app.services.tax_curve import (
+    PiecewiseLinear,
+    marginal_rate,
+    refund_breakpoints,
+    refund_curve,
+    solve_for_refund,
+)
+
+
+def _exact_refund(inputs: CalcInputs, variable: str, value: int) -> int:
+    return calculate_totals(inputs.model_copy(update={variable: value})).refund_or_owed
+
+
+@pytest.mark.parametrize(
+    "variable,hi",
+    [
+        ("gross_salary", 400_000_000),
+        ("extra_income_deductions", 30_000_000),
+        ("extra_tax_credits", 5_000_000),
+    ],
+)
+def test_curve_matches_calculate_within_rounding(variable, hi):
+    rng = random.Random(7)
+    inputs = CalcInputs(
+        gross_salary=62_000_000,
+        dependents=DependentsInput(spouse=True, dependents_count=1),
+        extra_income_deductions=2_000_000,
+        extra_tax_credits=100_000,
+        prepaid_tax=6_000_000,
+    )
+    curve = refund_curve(inputs, variable, 0, hi)
+    for x in [0, hi] + [rng.randint(0, hi) for _ in range(200)]:
+        assert abs(curve(x) - _exact_refund(inputs, variable, x)) <= 3
+
+
+def test_gross_breakpoints_include_bracket_boundaries():
+    inputs = CalcInputs(gross_salary=0)
+    xs = [x for x, _ in refund_breakpoints(inputs, "gross_salary", 0, 200_000_000)]
+    # 근로세액공제 한도 구간 경계 (33M, 70M, 120M) 는 항상 기울기 변화점
+    for boundary in (33_000_000, 70_000_000, 120_000_000):
+        assert any(abs(x - boundary) < 1e-6 for x in xs)
+    assert xs[0] == 0 and xs[-1] == 200_000_000
+    assert len(xs) < 40
+
+
+def test_marginal_rate_at_salary():
+    # 총급여 50M 단신: 근로소득공제 5% 구간 → 과세표준 기울기 0.95,
+    # 15% 세율, 근로세액공제는 한도에 묶여 기울기 0, 지방세 10%
+    rate = marginal_rate(CalcInputs(gross_salary=50_000_000))
+    assert rate == pytest.approx(0.95 * 0.15 * 1.1)
+
+    # 소득공제 1원 → 과세표준 1원 감소 → 15% × 1.1 절세
+    saved = marginal_rate(
+        CalcInputs(gross_salary=50_000_000), "extra_income_deductions"
+    )
+    assert saved == pytest.approx(-0.165)
+
+
+@pytest.mark.parametrize("variable", ["extra_income_deductions", "extra_tax_credits"])
+def test_solve_for_refund_is_minimal(variable):
+    inputs = CalcInputs(gross_salary=55_000_000, prepaid_tax=3_000_000)
+    current = getattr(inputs, variable)
+    target = calculate_totals(inputs).refund_or_owed + 500_000
+
+    extra = solve_for_refund(inputs, variable, target)
+    assert extra is not None and extra > 0
+    assert _exact_refund(inputs, variable, current + extra) >= target
+    assert _exact_refund(inputs, variable, current + extra - 1) < target
+
+
+def test_solve_for_refund_edges():
+    inputs = CalcInputs(gross_salary=30_000_000, prepaid_tax=1_000_000)
+    now = calculate_totals(inputs).refund_or_owed
+    assert solve_for_refund(inputs, "extra_tax_credits", now) == 0
+    # 결정세액을 모두 없애도 기납부세액 이상은 환급 불가
+    assert solve_for_refund(inputs, "extra_tax_credits", 1_000_001) is None
+    with pytest.raises(ValueError):
+        solve_for_refund(inputs, "gross_salary", now + 1)
+
+
+def test_itemized_inputs_rejected():
+    inputs = CalcInputs(
+        gross_salary=30_000_000,
+        itemized=ItemizedDeductions(child_count_under_20=1),
+    )
+    with pytest.raises(ValueError):
+        refund_curve(inputs, "gross_salary", 0, 1_000_000)
+
+
+def test_piecewise_linear_minimum_splits_at_crossing():
+    a = PiecewiseLinear.identity(0, 10)
+    b = PiecewiseLinear.constant(0, 10, 4)
+    m = a.minimum(b)
+    assert m.knots() == [(0, 0), (4, 4), (10, 4)]
+
+
+# -------------------- POST /refund-curve --------------------
+
+
+@pytest.fixture
+def curve_client():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.routers import refund_curve
+
+    app = FastAPI()
+    app.include_router(refund_curve.router, prefix="/api/v1")
+    return TestClient(app)
+
+
+def test_refund_curve_endpoint(curve_client):
+    body = {
+        "inputs": {"gross_salary": 45_000_000, "prepaid_tax": 2_000_000},
+        "variable": "extra_income_deductions",
+        "hi": 20_000_000,
+    }
+    res = curve_client.post("/api/v1/refund-curve", json=body)
+    assert res.status_code == 200
+    data = res.json()
+
+    points = data["points"]
+    assert points[0]["x"] == 0 and points[-1]["x"] == 20_000_000
+    assert points[-1]["slope_after"] is None
+    # 소득공제는 환급을 줄이지 않음
+    assert all(p["slope_after"] >= 0 for p in points[:-1])
+    assert data["current_refund"] == calculate_totals(
+        CalcInputs(gross_salary=45_000_000, prepaid_tax=2_000_000)
+    ).refund_or_owed
+    assert data["marginal_rate"] < 0
+
+
+def test_refund_curve_endpoint_rejects_bad_range(curve_client):
+    body = {
+        "inputs": {"gross_salary": 45_000_000},
+        "variable": "gross_salary",
+        "lo": 10,
+        "hi": 5,
+    }
+    res = curve_client.post("/api/v1/refund-curve", json=body)
+    assert res.status_code == 422
+
+
+def test_refund_curve_endpoint_rejects_unknown_year(curve_client):
+    body = {
+        "inputs": {"gross_salary": 45_000_000},
+        "variable": "gross_salary",
+        "hi": 50_000_000,
+        "year": 2024,
+    }
+    res = curve_client.post("/api/v1/refund-curve", json=body)
+    assert res.status_code == 422
+    assert "2024" in res.json()["detail"]